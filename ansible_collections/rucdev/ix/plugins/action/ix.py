@@ -22,6 +22,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
+import os
+
 from ansible.utils.display import Display
 from ansible_collections.ansible.netcommon.plugins.action.network import (
     ActionModule as ActionNetworkModule,
@@ -47,6 +49,18 @@ class ActionModule(ActionNetworkModule):
                 % self._play_context.connection,
             }
 
+        backup_options = self._task.args.get("backup_options") or {}
+        if self._task.args.get("backup") and backup_options.get("store"):
+            # the module puts the backup in the store itself, under a path
+            # and a name only known here
+            backup_options = dict(backup_options)
+            backup_options["store"] = os.path.join(
+                self._get_working_path(), os.path.expanduser(backup_options["store"])
+            )
+            if not backup_options.get("filename"):
+                backup_options["filename"] = task_vars["inventory_hostname"]
+            self._task.args["backup_options"] = backup_options
+
         result = super(ActionModule, self).run(task_vars=task_vars)
         if warnings:
             if "warnings" in result:
@@ -54,3 +68,11 @@ class ActionModule(ActionNetworkModule):
             else:
                 result["warnings"] = warnings
         return result
+
+    def _handle_backup_option(self, result, task_vars, backup_options):
+        if "backup_sha1" in result:
+            # already in the backup store, there is no file to write
+            return
+        super(ActionModule, self)._handle_backup_option(
+            result, task_vars, backup_options
+        )
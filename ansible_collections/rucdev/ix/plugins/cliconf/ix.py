@@ -23,13 +23,85 @@ short_description: Use ix cliconf to run command on NEC IX platform
 description:
 - ""
 version_added: 0.1.0
+options:
+  pipeline_window:
+    description:
+    - Number of commands C(run_commands) writes to the device back-to-back
+      before reading their output, instead of waiting for the prompt after
+      each of them.
+    - The output is split per command on the echoed prompt lines and each
+      command is still checked against the I(terminal_stderr_re) patterns.
+    - Only show commands are pipelined. Other commands, and commands
+      expecting a prompt or sent with I(sendonly), are always run one at a
+      time. Pipelining is disabled in single user mode, since cached
+      commands are not written to the device.
+    - When the echo of a command cannot be found in the output, e.g. because
+      the terminal wrapped it, the show commands of the window are run again
+      one at a time.
+    - When a command fails, the commands following it in the same window
+      have already been sent to the device.
+    type: int
+    default: 1
+    vars:
+    - name: ansible_ix_pipeline_window
+  bulk_chunk_size:
+    description:
+    - Number of candidate lines C(edit_config) writes to the device before
+      reading their echo back, instead of waiting for the prompt after each
+      line.
+    - Each chunk is read back before the next one is written. The echo of
+      every line is checked against the I(terminal_stderr_re) patterns and
+      the number of the first failing candidate line is reported.
+    - Lines expecting a prompt are always sent one at a time. Bulk mode is
+      disabled in single user mode.
+    - When a line fails, the lines following it in the same chunk have
+      already been sent to the device.
+    type: int
+    default: 1
+    vars:
+    - name: ansible_ix_bulk_chunk_size
+  config_cache:
+    description:
+    - Keep the output of C(get_config) and of the C(show running-config)
+      commands sent through C(configure_get) for the life of the persistent
+      connection, so that consecutive tasks against the same device do not
+      download the configuration again.
+    - The cache is dropped whenever C(edit_config) or C(run_configs) runs, and
+      whenever C(run_commands) or C(get), used by the C(cli_command) module,
+      sends anything other than a show command, such as
+      C(copy running-config startup-config).
+    - Changes made to the device outside of this connection are not seen
+      until the cache is dropped, disable it when other sessions configure
+      the device at the same time.
+    - The running-config saved last by C(ix_config) with I(save_when=modified)
+      is remembered as well, so that the startup-config is only read again
+      once the running-config differs from it.
+    type: bool
+    default: true
+    vars:
+    - name: ansible_ix_config_cache
+  replace_command:
+    description:
+    - Command C(edit_config) sends to replace the running-config with a
+      configuration file already transferred to the device, when it is
+      given the path of that file as I(replace). C({path}) is substituted
+      with the path.
+    - The whole configuration is applied by this one command instead of
+      being sent line by line. Check that the command replaces the
+      running-config, rather than merging into it, on the software version
+      of the devices. C(ix_config) reads the running-config back after a
+      replace and fails when it does not match the file.
+    type: str
+    default: copy {path} running-config
+    vars:
+    - name: ansible_ix_replace_command
 """
 
 
 import re
 import json
 from functools import wraps
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_bytes, to_text
 from ansible_collections.ansible.netcommon.plugins.plugin_utils.cliconf_base import (
     CliconfBase,
 )
@@ -39,9 +111,11 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible.module_utils.common._collections_compat import Mapping
 from ansible.errors import AnsibleConnectionFailure
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
-    NetworkConfig,
     dumps,
 )
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.config_tree import (
+    IxNetworkConfig,
+)
 from ansible.utils.display import Display
 
 display = Display()
@@ -49,18 +123,133 @@ display = Display()
 
 SVINTR_CONFIG = "svintr-config"
 
+# CLI modes of an ix session
+EXEC_MODE = "exec"
+SVINTR_CONFIG_MODE = "svintr-config"
+CONFIG_MODE = "config"
+SUB_CONFIG_MODE = "sub-config"
+
+SUB_CONFIG_PROMPT_RE = re.compile(r"\([^)]+\)#$")
+
+# commands whose output is kept in the configuration cache
+CONFIG_SOURCES = {
+    "running": "show running-config",
+    "startup": "show startup-config",
+}
+
+# a prompt at the start of a line, followed by the echo of the next command
+PROMPT_RE = re.compile(r"^[\w\+\-\.:\/\[\]]+(?:\([^\)]+\)){0,3}[%$#] ?")
+# a whole prompt, capturing the hostname in front of the mode
+HOSTNAME_PROMPT_RE = re.compile(r"^([\w\+\-\.:\/\[\]]+)(?:\([^\)]+\)){0,3}[%$#]$")
+# a pattern that never matches, to read pipelined output without raising
+NEVER_MATCH = [{"pattern": r"(?!)"}]
+
+
+def split_pipelined_output(output, commands):
+    """Splits the output of pipelined commands per command
+
+    The device echoes each command after the prompt that ends the output of
+    the previous one, except for the first command whose prompt was read
+    before it was sent.
+
+    :param output: the text read back since the first command was sent
+    :param commands: the commands that were sent, in order
+    :rtype: list
+    :returns: the output of each command, or None when the output of some
+              commands has not been read yet
+    """
+    lines = output.splitlines()
+    echoes = []
+    for lineno, line in enumerate(lines):
+        if len(echoes) == len(commands):
+            break
+        match = PROMPT_RE.match(line)
+        if match:
+            line = line[match.end() :]
+        elif echoes:
+            continue
+        if line.strip() == commands[len(echoes)].strip():
+            echoes.append(lineno)
+
+    if len(echoes) < len(commands) or len(lines) - 1 <= echoes[-1]:
+        return None
+    match = PROMPT_RE.match(lines[-1])
+    if not match or lines[-1][match.end() :].strip():
+        return None
+
+    echoes.append(len(lines) - 1)
+    return [
+        "\n".join(lines[start + 1 : end]).strip()
+        for start, end in zip(echoes, echoes[1:])
+    ]
+
+
+def split_output_at_prompts(output, commands):
+    """Splits the output of pipelined commands at the prompts
+
+    Unlike split_pipelined_output, the echo of each command is not looked
+    for, so it also splits an echo the terminal wrapped over several lines.
+    The output is complete once it ends with a prompt and holds a prompt of
+    the same hostname per command. The rest of a wrapped echo is left at the
+    start of the output of its command.
+
+    :param output: the text read back since the first command was sent
+    :param commands: the commands that were sent, in order
+    :rtype: list
+    :returns: the output of each command, or None when the output of some
+              commands has not been read yet
+    """
+    lines = output.splitlines()
+    match = HOSTNAME_PROMPT_RE.match(lines[-1].strip()) if lines else None
+    if not match:
+        return None
+
+    prompt_re = re.compile(r"^%s(?:\([^\)]+\)){0,3}[%%$#]" % re.escape(match.group(1)))
+    prompts = [lineno for lineno, line in enumerate(lines) if prompt_re.match(line)]
+    if len(prompts) < len(commands):
+        return None
+
+    # the first echo has no prompt in front of it, it starts the output
+    prompts = prompts[-len(commands) :]
+    return [
+        "\n".join(lines[start + 1 : end]).strip()
+        for start, end in zip([0] + prompts, prompts)
+    ]
+
+
+def prompt_mode(prompt):
+    """Returns the CLI mode a prompt belongs to
+
+    :param prompt: the prompt the connection matched last
+    :returns: the mode, or None when no prompt has been matched yet
+    """
+    prompt = to_text(prompt, errors="surrogate_or_strict").strip()
+    if not prompt:
+        return None
+    if prompt.endswith("(config)#"):
+        return CONFIG_MODE
+    if SUB_CONFIG_PROMPT_RE.search(prompt):
+        return SUB_CONFIG_MODE
+    return EXEC_MODE
+
+
+def prompt_hostname(prompt):
+    """Returns the hostname a prompt starts with
+
+    :param prompt: the prompt the connection matched last
+    :returns: the hostname, or None when the prompt does not carry one
+    """
+    prompt = to_text(prompt, errors="surrogate_or_strict").strip()
+    match = HOSTNAME_PROMPT_RE.match(prompt)
+    if match:
+        return match.group(1)
+    return None
+
 
 def configure_mode(func):
     @wraps(func)
     def wrapped(self, *args, **kwargs):
-        prompt = self._connection.get_prompt()
-        if (
-            not to_text(prompt, errors="surrogate_or_strict")
-            .strip()
-            .endswith("(config)#")
-        ):
-            # self.send_command(SVINTR_CONFIG)
-            self.send_command("configure")
+        self.enter_config_mode()
         return func(self, *args, **kwargs)
 
     return wrapped
@@ -69,12 +258,103 @@ def configure_mode(func):
 class Cliconf(CliconfBase):
     def __init__(self, *args, **kwargs):
         self._device_info = {}
+        self._mode = None
+        self._svintr_config = False
+        self._terminal_length = False
+        self._config_cache = {}
+        self._config_cache_hits = 0
+        self._config_cache_misses = 0
+        self._saved_config = None
         display.vvvvv("cliconf init")
         super(Cliconf, self).__init__(*args, **kwargs)
 
+    def get_mode(self):
+        """Returns the current CLI mode
+
+        The mode follows the prompt the connection matched last, which is
+        read locally without a round trip to the device. svintr-config
+        shares its prompt with config, so it is tracked from the commands
+        sent here.
+        """
+        mode = prompt_mode(self._connection.get_prompt())
+        if mode == CONFIG_MODE and self._mode == SVINTR_CONFIG_MODE:
+            return SVINTR_CONFIG_MODE
+        self._mode = mode
+        return mode
+
+    def _change_mode(self, command, mode):
+        self.send_command(command)
+        self._mode = mode
+
+    def enter_config_mode(self):
+        """Moves to config mode, unless the session is already there"""
+        if self.get_mode() != CONFIG_MODE:
+            self._change_mode("configure", CONFIG_MODE)
+
+    def enter_svintr_config(self):
+        """Enters svintr-config once per connection"""
+        if not self._svintr_config:
+            self._change_mode(SVINTR_CONFIG, SVINTR_CONFIG_MODE)
+            self._svintr_config = True
+
+    def set_terminal_length(self):
+        """Disables paging once per connection"""
+        if not self._terminal_length:
+            self.send_command("terminal length 0")
+            self._terminal_length = True
+
+    def use_config_cache(self) -> bool:
+        try:
+            return self.get_option("config_cache") is not False
+        except KeyError:
+            return True
+
+    def invalidate_config_cache(self):
+        """Drops the configurations read so far"""
+        self._config_cache.clear()
+
+    def _drop_config_state(self, command):
+        """Drops the cached and saved configs before a command may change them
+
+        :param command: the command about to be sent, show commands keep them
+        """
+        if not self._is_show(command):
+            self.invalidate_config_cache()
+            self._saved_config = None
+
+    def get_saved_config(self):
+        """Returns the sha1 of the running-config last saved to startup-config
+
+        It is set by the module which saved the configuration, and dropped
+        whenever a command other than a show command runs through this
+        connection, since that may change the startup-config. Nothing is
+        remembered when the configuration cache is disabled.
+        """
+        if not self.use_config_cache():
+            return None
+        return self._saved_config
+
+    def set_saved_config(self, sha1):
+        """Remembers the sha1 of a running-config equal to startup-config"""
+        self._saved_config = sha1
+
+    def _get_cached_config(self, command):
+        if not self.use_config_cache():
+            return self.send_command(command)
+
+        key = " ".join(command.split())
+        try:
+            out = self._config_cache[key]
+        except KeyError:
+            self._config_cache_misses += 1
+            out = self._config_cache[key] = self.send_command(command)
+        else:
+            self._config_cache_hits += 1
+        return out
+
     @configure_mode
     def get_config(self, source="running", flags=None, format=None):
-        if source not in ("running", "startup"):
+        if source not in CONFIG_SOURCES:
             raise ValueError(
                 # running, startup以外はエラーとする
                 f"fetching configuration for {source} is not supported"
@@ -86,12 +366,8 @@ class Cliconf(CliconfBase):
         if not flags:
             flags = []
 
-        cmd = ""
-        if source == "running":
-            cmd = "show running-config"
-        cmd += " ".join(to_list(flags))
-        cmd = cmd.strip()
-        return self.send_command(cmd)
+        cmd = " ".join([CONFIG_SOURCES[source]] + to_list(flags))
+        return self._get_cached_config(cmd)
 
     def get_diff(
         self,
@@ -118,14 +394,14 @@ class Cliconf(CliconfBase):
                 f"'replace' value {diff_replace} in invalid, valid values are {', '.join(option_values['diff_replace'])}"
             )
 
-        candidate_obj = NetworkConfig(indent=1)
+        candidate_obj = IxNetworkConfig(indent=1)
         # TODO: バナーに対応させる
         # want_src, want_banners = self._extract_banners(candi)
         candidate_obj.load(candidate)
 
         if running and diff_match != "none":
             # have_src, have_banners = self._extract_banners(running)
-            running_obj = NetworkConfig(
+            running_obj = IxNetworkConfig(
                 indent=1, contents=running, ignore_lines=diff_ignore_lines
             )
             configdiffobjs = candidate_obj.difference(
@@ -154,17 +430,23 @@ class Cliconf(CliconfBase):
 
             match = re.search(version_pattern, data, re.M)
             if match:
+                device_info["network_os_model"] = match.group(1).split()[0]
                 device_info["network_os_version"] = match.group(2)
 
-            # TODO: hostnameとnetwork_os_modelの取得方法を追加する
-            self.send_command(SVINTR_CONFIG)
-            self.send_command("configure")
-            self.send_command("terminal length 0")
-            reply = self.get(command="show running-config")
-            data = to_text(reply, errors="surrogate_or_strict")
-            match = re.search(r"hostname (.+)", data, re.M)
-            if match:
-                device_info["network_os_hostname"] = match.group(1)
+            self.enter_svintr_config()
+            self.enter_config_mode()
+            self.set_terminal_length()
+
+            hostname = prompt_hostname(self._connection.get_prompt())
+            if not hostname:
+                # no usable prompt, fall back to the full configuration
+                reply = self.get(command="show running-config")
+                data = to_text(reply, errors="surrogate_or_strict")
+                match = re.search(r"hostname (.+)", data, re.M)
+                if match:
+                    hostname = match.group(1)
+            if hostname:
+                device_info["network_os_hostname"] = hostname
 
             self._device_info = device_info
         return self._device_info
@@ -184,6 +466,8 @@ class Cliconf(CliconfBase):
         if output:
             raise ValueError(f"'output' value {output} is not supported for get")
 
+        # cli_command and configure_get write through here
+        self._drop_config_state(command)
         return self.send_command(
             command=command,
             prompt=prompt,
@@ -204,6 +488,8 @@ class Cliconf(CliconfBase):
         output=None,
         check_all=False,
     ):
+        if self._is_config_read(command) and not (prompt or answer or sendonly):
+            return self._get_cached_config(command)
         return self.get(
             command,
             prompt,
@@ -218,6 +504,10 @@ class Cliconf(CliconfBase):
         result = super(Cliconf, self).get_capabilities()
         result["rpc"] += ["get_diff", "run_commands"]
         result["device_operations"] = self.get_device_operations()
+        result["config_cache"] = {
+            "hits": self._config_cache_hits,
+            "misses": self._config_cache_misses,
+        }
         return json.dumps(result)
 
     def get_device_operations(self) -> dict:
@@ -231,7 +521,7 @@ class Cliconf(CliconfBase):
             "supports_diff_match": True,
             "supports_diff_ignore_lines": True,
             "supports_generate_diff": True,
-            "supports_replace": False,
+            "supports_replace": True,
         }
 
     def get_option_values(self):
@@ -246,29 +536,164 @@ class Cliconf(CliconfBase):
         if commands is None:
             raise ValueError("'commands' value is required")
 
+        window = self.get_pipeline_window()
         responses = list()
+        pipeline = list()
         for cmd in to_list(commands):
             if not isinstance(cmd, Mapping):
                 cmd = {"command": cmd}
+            self._drop_config_state(cmd["command"])
             output = cmd.pop("output", None)
             if output:
                 raise ValueError(
                     f"'output' value {output} is not supported for run_commands"
                 )
 
-            try:
-                out = self.send_command(**cmd)
-            except AnsibleConnectionFailure as e:
-                if check_rc:
-                    raise
-                out = getattr(e, "err", to_text(e))
+            # show commands only, a window may have to be run again
+            if window > 1 and self._is_show(cmd["command"]) and self._can_pipeline(cmd):
+                pipeline.append(cmd["command"])
+                if len(pipeline) == window:
+                    responses.extend(self.run_pipelined(pipeline, check_rc))
+                    pipeline = list()
+                continue
 
-            responses.append(out)
+            if pipeline:
+                responses.extend(self.run_pipelined(pipeline, check_rc))
+                pipeline = list()
+            responses.append(self._run_command(cmd, check_rc))
+
+        if pipeline:
+            responses.extend(self.run_pipelined(pipeline, check_rc))
 
         return responses
 
+    def _is_show(self, command) -> bool:
+        return to_text(command).strip().startswith("show ")
+
+    def _is_config_read(self, command) -> bool:
+        command = to_text(command).strip()
+        return any(
+            command == source or command.startswith(source + " ")
+            for source in CONFIG_SOURCES.values()
+        ) and not command.endswith("?")
+
+    def _run_command(self, cmd, check_rc=True):
+        try:
+            out = self.send_command(**cmd)
+        except AnsibleConnectionFailure as e:
+            if check_rc:
+                raise
+            out = getattr(e, "err", to_text(e))
+        return out
+
+    def get_pipeline_window(self) -> int:
+        return self._get_batch_option("pipeline_window")
+
+    def get_bulk_chunk_size(self) -> int:
+        return self._get_batch_option("bulk_chunk_size")
+
+    def get_replace_command(self, path) -> str:
+        if not isinstance(path, str):
+            raise ValueError(
+                "'replace' must be the path of a configuration file on the device"
+            )
+        try:
+            command = self.get_option("replace_command")
+        except KeyError:
+            command = None
+        return (command or "copy {path} running-config").format(path=path)
+
+    def _get_batch_option(self, option) -> int:
+        try:
+            size = self.get_option(option)
+        except KeyError:
+            size = None
+        if not size or size < 1:
+            return 1
+
+        # cached commands are answered without being written to the device
+        try:
+            if self._connection.get_option("single_user_mode"):
+                return 1
+        except KeyError:
+            pass
+        return size
+
+    def _can_pipeline(self, cmd) -> bool:
+        return not (
+            cmd.get("prompt")
+            or cmd.get("answer")
+            or cmd.get("sendonly")
+            or cmd.get("newline", True) is False
+        )
+
+    def run_pipelined(self, commands, check_rc=True) -> list:
+        """Writes the commands back-to-back, then reads all their output
+
+        :param commands: the show commands to run, they are run again one at
+                         a time when their echoes are not found
+        :param check_rc: raise on the first command whose output matches
+                         terminal_stderr_re, instead of returning its output
+        :returns: the output of each command
+        """
+        if len(commands) == 1:
+            return [self._run_command({"command": commands[0]}, check_rc)]
+
+        outputs, echoed = self._send_pipelined(commands)
+        if not echoed:
+            # the outputs cannot be told apart from the echoes, run the show
+            # commands again one at a time
+            return [
+                self._run_command({"command": command}, check_rc)
+                for command in commands
+            ]
+
+        if check_rc:
+            stderr_re = self._connection._get_terminal_std_re("terminal_stderr_re")
+            for out in outputs:
+                if self._find_error(out, stderr_re):
+                    raise AnsibleConnectionFailure(out)
+        return outputs
+
+    def _send_pipelined(self, commands) -> tuple:
+        """Writes the commands back-to-back and reads until their last prompt
+
+        :param commands: the commands to write
+        :rtype: tuple
+        :returns: the output of each command, and False when the echo of a
+                  command was not found and the output was split at the
+                  prompts instead, see split_output_at_prompts
+        """
+        for command in commands:
+            self.send_command(command=command, sendonly=True)
+
+        # the connection raises as soon as it finds an error in what it has
+        # read, which would leave the output of the other commands unread
+        saved = self._connection.get_option("terminal_stderr_re")
+        self._connection.set_option("terminal_stderr_re", NEVER_MATCH)
+        try:
+            output = ""
+            while True:
+                reply = self._connection.receive(strip_prompt=False)
+                output += to_text(reply, errors="surrogate_then_replace")
+                segments = split_pipelined_output(output, commands)
+                if segments is not None:
+                    return segments, True
+                # an echo may never match, e.g. when the terminal wrapped it,
+                # so stop reading once the last prompt has been read
+                segments = split_output_at_prompts(output, commands)
+                if segments is not None:
+                    return segments, False
+        finally:
+            self._connection.set_option("terminal_stderr_re", saved)
+
+    def _find_error(self, out, stderr_re) -> bool:
+        data = to_bytes(out, errors="surrogate_then_replace")
+        return any(regex.search(data) for regex in stderr_re)
+
     @configure_mode
     def run_configs(self, commands=None, check_rc=True) -> list:
+        self.invalidate_config_cache()
         return self.run_commands(commands=commands, check_rc=check_rc)
 
     @configure_mode
@@ -283,19 +708,35 @@ class Cliconf(CliconfBase):
 
         results = []
         requests = []
-        if commit:
-            self.send_command("configure")
-            for line in to_list(candidate):
+        if commit and replace:
+            # the candidate is a file on the device, applied in one command
+            self.invalidate_config_cache()
+            requests.append(self.get_replace_command(replace))
+            results.append(self.send_command(requests[0]))
+
+        elif commit:
+            self.invalidate_config_cache()
+            lines = []
+            for lineno, line in enumerate(to_list(candidate), 1):
                 if not isinstance(line, Mapping):
                     line = {"command": line}
 
                 cmd = line["command"]
                 if cmd != "exit":
-                    results.append(self.send_command(**line))
+                    lines.append((lineno, line))
                     requests.append(cmd)
 
-            self.send_command("configure")
-            self.send_command("exit")
+            chunk_size = self.get_bulk_chunk_size()
+            if chunk_size > 1:
+                results = self.paste_config(lines, chunk_size)
+            else:
+                for lineno, line in lines:
+                    results.append(self.send_command(**line))
+
+            # leave the session at the top of config mode, where the next
+            # configure_mode call expects it
+            if self.get_mode() == SUB_CONFIG_MODE:
+                self._change_mode("configure", CONFIG_MODE)
 
         else:
             raise ValueError("check mode is not supported")
@@ -304,8 +745,53 @@ class Cliconf(CliconfBase):
         resp["response"] = results
         return resp
 
+    def paste_config(self, lines, chunk_size) -> list:
+        """Streams configuration lines to the device in chunks
+
+        Each chunk is written back-to-back and its echo is read back before
+        the next one is written, which keeps the device input buffer from
+        overflowing. The echo of every line is then checked against the
+        terminal_stderr_re patterns.
+
+        :param lines: the (line number, command dict) of the lines to send
+        :param chunk_size: the number of lines written at once
+        :returns: the output of each line
+        :raises AnsibleConnectionFailure: for the first failing line, the
+                                          lines after its chunk are not sent
+        """
+        stderr_re = self._connection._get_terminal_std_re("terminal_stderr_re")
+        results = []
+        chunk = []
+        for lineno, line in lines:
+            if self._can_pipeline(line):
+                chunk.append((lineno, line["command"]))
+                if len(chunk) == chunk_size:
+                    results.extend(self._paste_chunk(chunk, stderr_re))
+                    chunk = []
+                continue
+
+            if chunk:
+                results.extend(self._paste_chunk(chunk, stderr_re))
+                chunk = []
+            results.append(self.send_command(**line))
+
+        if chunk:
+            results.extend(self._paste_chunk(chunk, stderr_re))
+        return results
+
+    def _paste_chunk(self, chunk, stderr_re) -> list:
+        # the lines are not sent again when their echoes were not found,
+        # which would apply them twice
+        outputs = self._send_pipelined([command for _lineno, command in chunk])[0]
+        for (lineno, command), out in zip(chunk, outputs):
+            if self._find_error(out, stderr_re):
+                raise AnsibleConnectionFailure(
+                    f"candidate line {lineno} '{command}' failed: {out}"
+                )
+        return outputs
+
     def get_default_flag(self):
-        self.send_command(SVINTR_CONFIG)
+        self.enter_svintr_config()
         out = self.get("show running-config ?")
         out = to_text(out, errors="surrogate_then_replace")
 
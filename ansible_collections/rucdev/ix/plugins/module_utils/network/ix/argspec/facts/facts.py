@@ -27,4 +27,6 @@ class FactsArgs(object):  # pylint: disable=R0903
     argument_spec = {
         "gather_subset": dict(default=["min"], type="list"),
         "gather_network_resources": dict(choices=choices, type="list"),
+        "cache_dir": dict(type="path"),
+        "parse_workers": dict(type="int"),
     }
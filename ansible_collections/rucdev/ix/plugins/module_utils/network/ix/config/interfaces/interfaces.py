@@ -85,7 +85,11 @@ class Interfaces(ResourceModule):
                 self.purge(have)
         else:
             for k, want in iteritems(wantd):
-                self._compare(want=want, have=haved.pop(k, {}))
+                have = haved.pop(k, {})
+                # an interface already configured as wanted needs no commands
+                if want == have:
+                    continue
+                self._compare(want=want, have=have)
 
     def _compare(self, want, have):
         """Leverages the base class `compare()` method and
@@ -32,6 +32,7 @@ from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.
 )
 
 from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.utils import (
+    normalize_ip,
     validate_n_expand_ipv4,
     validate_ipv6,
 )
@@ -102,7 +103,11 @@ class L3_interfaces(ResourceModule):
                     self._compare(want={}, have=have)
 
         for k, want in wantd.items():
-            self._compare(want=want, have=haved.pop(k, {}))
+            have = haved.pop(k, {})
+            # an interface already configured as wanted needs no commands
+            if want == have:
+                continue
+            self._compare(want=want, have=have)
 
     def _compare(self, want, have):
         begin = len(self.commands)
@@ -115,50 +120,36 @@ class L3_interfaces(ResourceModule):
             wacls = want.pop(afi, {})
             hacls = have.pop(afi, {})
 
+            # index the want entries by role once, the primaries are
+            # compared before the secondaries
+            primaries = []
+            secondaries = []
+            want_primary = False
             for key, entry in wacls.items():
-                if entry.get("secondary", False) is True:
-                    continue
+                secondary = entry.get("secondary", False)
+                if secondary is not True:
+                    primaries.append((key, entry))
+                if secondary is not False:
+                    secondaries.append((key, entry))
+                else:
+                    want_primary = True
+
+            for key, entry in primaries:
                 # entry is set as primary
                 hacl = hacls.get(key, {})
                 if hacl.get("secondary", False) is True:
                     hacl = {}
-                self.validate_ips(afi, want=entry, have=hacl)
+                self._compare_entry(afi, key, entry, hacl, hacls)
 
-                if hacl:
-                    hacls.pop(key, {})
-
-                self.compare(
-                    parsers=self.parsers,
-                    want={afi: entry},
-                    have={afi: hacl},
-                )
-
-            for key, entry in wacls.items():
-                if entry.get("secondary", False) is False:
-                    continue
+            for key, entry in secondaries:
                 # entry is set as secondary
                 hacl = hacls.get(key, {})
-                if hacl.get("secondary", False) is False:
-                    # hacl is set as primary, if wacls has no other primary entry we must keep
-                    # this entry as primary (so we'll compare entry to hacl and not
-                    # generate commands)
-                    if list(
-                        filter(
-                            lambda w: w.get("secondary", False) is False, wacls.values()
-                        )
-                    ):
-                        # another primary is in wacls
-                        hacl = {}
-                self.validate_ips(afi, want=entry, have=hacl)
-
-                if hacl:
-                    hacls.pop(key, {})
-
-                self.compare(
-                    parsers=self.parsers,
-                    want={afi: entry},
-                    have={afi: hacl},
-                )
+                if hacl.get("secondary", False) is False and want_primary:
+                    # hacl is set as primary, it is only kept as primary (so
+                    # entry is compared to hacl and no command is generated)
+                    # when wacls has no other primary entry
+                    hacl = {}
+                self._compare_entry(afi, key, entry, hacl, hacls)
 
             # remove remaining items in have for replaced
             # these can be subnets that are no longer used
@@ -168,6 +159,18 @@ class L3_interfaces(ResourceModule):
                 self.validate_ips(afi, have=entry)
                 self.compare(parsers=self.parsers, want={}, have={afi: entry})
 
+    def _compare_entry(self, afi, key, entry, hacl, hacls):
+        self.validate_ips(afi, want=entry, have=hacl)
+
+        if hacl:
+            hacls.pop(key, {})
+
+        self.compare(
+            parsers=self.parsers,
+            want={afi: entry},
+            have={afi: hacl},
+        )
+
     def purge(self, have):
         """Handle operation for purged state"""
         self.commands.append(self._tmplt.render(have, "interface", True))
@@ -210,6 +213,7 @@ class L3_interfaces(ResourceModule):
                     temp = {}
                     for each in val["ipv4"]:
                         if each.get("address") and each.get("address") != "dhcp":
+                            each["address"] = normalize_ip(each["address"])
                             temp.update({each["address"]: each})
                         elif each.get("address") == "dhcp":
                             # deprecated attribute
@@ -230,7 +234,7 @@ class L3_interfaces(ResourceModule):
                     temp = {}
                     for each in val["ipv6"]:
                         if each.get("address"):
-                            each["address"] = each["address"].lower()
+                            each["address"] = normalize_ip(each["address"])
                             temp.update({each["address"]: each})
                         if not each.get("address"):
                             temp.update({list(each.keys())[0]: each})
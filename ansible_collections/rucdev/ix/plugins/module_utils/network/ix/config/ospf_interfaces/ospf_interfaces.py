@@ -32,6 +32,9 @@ from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.facts i
 from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.ospf_interfaces import (
     Ospf_interfacesTemplate,
 )
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.utils import (
+    normalize_ip,
+)
 
 
 class Ospf_interfaces(ResourceModule):
@@ -83,7 +86,11 @@ class Ospf_interfaces(ResourceModule):
                     self._compare(want={}, have=have, interface=k)
 
         for k, want in iteritems(wantd):
-            self._compare(want=want, have=haved.pop(k, {}), interface=k)
+            have = haved.pop(k, {})
+            # an interface already configured as wanted needs no commands
+            if want == have:
+                continue
+            self._compare(want=want, have=have, interface=k)
 
     def _compare(self, want, have, interface):
         """Leverages the base class `compare()` method and
@@ -129,5 +136,8 @@ class Ospf_interfaces(ResourceModule):
     def process_list_attr(self, add_fam):
         item = {}
         for ag in add_fam.get("address_family", []):
+            for neighbor in ag.get("neighbor_v3") or []:
+                if neighbor.get("address"):
+                    neighbor["address"] = normalize_ip(neighbor["address"])
             item[ag.get("afi")] = ag
         return item
@@ -2,43 +2,277 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import multiprocessing
+
+from ansible.module_utils._text import to_text
+from ansible.module_utils.common._collections_compat import Mapping
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts import (
     FactsBase,
 )
-from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.interfaces.interfaces import (
-    InterfacesFacts,
-)
-from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.l3_interfaces.l3_interfaces import (
-    L3_interfacesFacts,
-)
-from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.ospf_interfaces.ospf_interfaces import (
-    Ospf_interfacesFacts
-)
-from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.ospfv2.ospfv2 import (
-    Ospfv2Facts
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.facts_cache import (
+    FactsCache,
 )
-from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.ospfv3.ospfv3 import (
-    Ospfv3Facts
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.sections import (
+    ConfigSections,
+    get_config_sections,
 )
 
-FACT_RESOURCE_SUBSETS = dict(
-    interfaces=InterfacesFacts,
-    l3_interfaces=L3_interfacesFacts,
-    ospf_interfaces=Ospf_interfacesFacts,
-    ospfv2=Ospfv2Facts,
-    ospfv3=Ospfv3Facts,
+# The facts classes are imported by these loaders, so that a resource
+# module only imports the facts, template and argspec of its own resource.
+# The imports stay plain import statements for AnsiballZ to find and ship.
+
+
+def _interfaces_facts():
+    from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.interfaces.interfaces import (
+        InterfacesFacts,
+    )
+
+    return InterfacesFacts
+
+
+def _l3_interfaces_facts():
+    from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.l3_interfaces.l3_interfaces import (
+        L3_interfacesFacts,
+    )
+
+    return L3_interfacesFacts
+
+
+def _ospf_interfaces_facts():
+    from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.ospf_interfaces.ospf_interfaces import (
+        Ospf_interfacesFacts,
+    )
+
+    return Ospf_interfacesFacts
+
+
+def _ospfv2_facts():
+    from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.ospfv2.ospfv2 import (
+        Ospfv2Facts,
+    )
+
+    return Ospfv2Facts
+
+
+def _ospfv3_facts():
+    from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.ospfv3.ospfv3 import (
+        Ospfv3Facts,
+    )
+
+    return Ospfv3Facts
+
+
+class LazyFactsMap(Mapping):
+    """Maps the resource names to their facts class, imported on first use"""
+
+    def __init__(self, loaders):
+        self._loaders = loaders
+        self._classes = {}
+
+    def __getitem__(self, resource):
+        try:
+            return self._classes[resource]
+        except KeyError:
+            facts_cls = self._classes[resource] = self._loaders[resource]()
+            return facts_cls
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+
+FACT_RESOURCE_SUBSETS = LazyFactsMap(
+    dict(
+        interfaces=_interfaces_facts,
+        l3_interfaces=_l3_interfaces_facts,
+        ospf_interfaces=_ospf_interfaces_facts,
+        ospfv2=_ospfv2_facts,
+        ospfv3=_ospfv3_facts,
+    )
 )
 
+# below this number of config lines to parse, starting the worker processes
+# costs more than it saves
+PARALLEL_MIN_LINES = 2000
+
+
+class ParseModule(object):
+    """Stands in for the AnsibleModule while a worker process parses facts
+
+    The facts classes only read the module params and collect the values
+    to redact, which are handed back to the real module.
+    """
+
+    def __init__(self, params):
+        self.params = params
+        self.no_log_values = set()
+        # the templates look the connection up, parsing never uses it
+        self._connection = None
+
+
+def parse_resource(facts_cls, params, data):
+    """Parses the facts of a resource in a worker process
+
+    :param facts_cls: the facts class of the resource
+    :param params: the params of the module gathering the facts
+    :param data: the config lines the resource is parsed from
+    :rtype: tuple
+    :returns: the network resources facts and the values to redact
+    """
+    module = ParseModule(params)
+    ansible_facts = {"ansible_network_resources": {}}
+    # a ConfigSections, even an empty one, keeps the facts class from
+    # fetching the config itself
+    data = get_config_sections("\n".join(data))
+    facts_cls(module).populate_facts(None, ansible_facts, data)
+    return ansible_facts["ansible_network_resources"], module.no_log_values
+
 
 class Facts(FactsBase):
     VALID_RESOURCE_SUBSETS = frozenset(FACT_RESOURCE_SUBSETS.keys())
 
     def __init__(self, module):
         super().__init__(module)
+        self._cache = None
+        cache_dir = module.params.get("cache_dir")
+        if cache_dir:
+            self._cache = FactsCache(cache_dir)
+        self._parse_workers = module.params.get("parse_workers") or 1
 
     def get_facts(self, legacy_facts_type=None, resource_facts_type=None, data=None):
         if self.VALID_RESOURCE_SUBSETS:
+            if data is None:
+                data = self.get_shared_config(resource_facts_type)
+            if data:
+                # split the config once, every resource reuses the index
+                data = get_config_sections(data)
             self.get_network_resources_facts(
                 FACT_RESOURCE_SUBSETS, resource_facts_type, data
             )
         return self.ansible_facts, self._warnings
+
+    def get_shared_config(self, resource_facts_type=None):
+        """Fetch the running-config once for all requested resources
+
+        Every resource can be parsed from the full running-config, so when
+        more than one resource is gathered the config is fetched here and
+        shared instead of each facts class sending its own show command.
+
+        :param resource_facts_type: the requested network resources
+        :rtype: string
+        :returns: the running-config, or None when no resource or a single
+                  resource is requested and should keep using its own show
+                  command
+        """
+        if not self._connection:
+            return None
+
+        runable_subsets = self.gen_runable(
+            resource_facts_type or self._gather_network_resources,
+            self.VALID_RESOURCE_SUBSETS,
+            resource_facts=True,
+        )
+        if not runable_subsets or (len(runable_subsets) < 2 and not self._cache):
+            return None
+        return self._connection.configure_get("show running-config")
+
+    def get_network_resources_facts(
+        self, facts_resource_obj_map, resource_facts_type=None, data=None
+    ):
+        """Gather the resource facts, reusing the cached facts when possible
+
+        A resource is only parsed when the config sections it consumes
+        have changed since its facts were cached. With parse_workers, the
+        resources left to parse are parsed on a pool of processes.
+        """
+        if not isinstance(data, ConfigSections) or (
+            self._cache is None and self._parse_workers < 2
+        ):
+            return super().get_network_resources_facts(
+                facts_resource_obj_map, resource_facts_type, data
+            )
+
+        runable_subsets = self.gen_runable(
+            resource_facts_type or self._gather_network_resources,
+            frozenset(facts_resource_obj_map.keys()),
+            resource_facts=True,
+        )
+        resources = self.ansible_facts["ansible_network_resources"]
+        keys = {}
+        for subset in runable_subsets:
+            if self._cache is None:
+                keys[subset] = None
+                continue
+            key = self._cache.key(data, facts_resource_obj_map[subset])
+            entry = None if key is None else self._cache.get(subset, key)
+            if entry is None:
+                keys[subset] = key
+            elif "facts" in entry:
+                resources[subset] = entry["facts"]
+
+        if keys and not self.parse_parallel(facts_resource_obj_map, list(keys), data):
+            super().get_network_resources_facts(
+                facts_resource_obj_map, list(keys), data
+            )
+        if keys and self._cache is not None:
+            for subset, key in keys.items():
+                if key is None:
+                    continue
+                entry = {}
+                if subset in resources:
+                    entry["facts"] = resources[subset]
+                try:
+                    self._cache.set(subset, key, entry)
+                except (IOError, OSError) as exc:
+                    self._warnings.append(
+                        "unable to cache the %s facts: %s" % (subset, exc)
+                    )
+        self.ansible_facts["ansible_net_gather_network_resources"] = list(
+            runable_subsets
+        )
+
+    def parse_parallel(self, facts_resource_obj_map, subsets, data):
+        """Parses the facts of some resources on a pool of processes
+
+        :param facts_resource_obj_map: the facts class of each resource
+        :param subsets: the resources to parse
+        :param data: the ConfigSections of the device config
+        :rtype: bool
+        :returns: False, without parsing anything, when the resources are
+                  better parsed serially
+        """
+        if self._parse_workers < 2 or len(subsets) < 2:
+            return False
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return False
+
+        jobs = []
+        for subset in subsets:
+            facts_cls = facts_resource_obj_map[subset]
+            lines = []
+            for kind in facts_cls.config_sections:
+                lines.extend(data.lines(kind))
+            jobs.append((facts_cls, lines))
+        if sum(len(lines) for _facts_cls, lines in jobs) < PARALLEL_MIN_LINES:
+            return False
+
+        # the workers inherit the imported collection instead of importing
+        # it again from the AnsiballZ payload
+        context = multiprocessing.get_context("fork")
+        processes = min(self._parse_workers, len(jobs))
+        params = dict(self._module.params)
+        with context.Pool(processes) as pool:
+            results = [
+                pool.apply_async(parse_resource, (facts_cls, params, lines))
+                for facts_cls, lines in jobs
+            ]
+            for result in results:
+                try:
+                    resources, no_log_values = result.get()
+                except Exception as exc:
+                    self._module.fail_json(msg=to_text(exc))
+                self.ansible_facts["ansible_network_resources"].update(resources)
+                self._module.no_log_values.update(no_log_values)
+        return True
@@ -13,20 +13,23 @@ based on the configuration.
 import re
 from copy import deepcopy
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.argspec.interfaces.interfaces import (
     InterfacesArgs,
 )
 from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.interfaces import (
     InterfacesTemplate,
 )
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.sections import (
+    get_config_sections,
+)
 
 
 class InterfacesFacts(object):
     """The ios interfaces facts class"""
 
+    # the kinds of config blocks the facts are parsed from
+    config_sections = ("interface",)
+
     def __init__(self, module):
         self._module = module
         self.argument_spec = InterfacesArgs.argument_spec
@@ -49,21 +52,19 @@ class InterfacesFacts(object):
 
         # parse native config using the Interfaces template
         interfaces_parser = InterfacesTemplate(
-            lines=data.splitlines(), module=self._module
-        )
-        objs = sorted(
-            list(interfaces_parser.parse().values()), key=lambda k, sk="name": k[sk]
+            lines=get_config_sections(data).lines("interface"),
+            module=self._module,
         )
+        objs = list(interfaces_parser.parse().values())
 
         ansible_facts["ansible_network_resources"].pop("interfaces", None)
         facts = {"interfaces": []}
-        params = utils.remove_empties(
-            interfaces_parser.validate_config(
-                self.argument_spec, {"config": objs}, redact=True
-            ),
+        facts["interfaces"] = (
+            interfaces_parser.normalize_config(
+                self.argument_spec, objs, key="name", redact=True
+            )
+            or []
         )
-
-        facts["interfaces"] = params["config"]
         ansible_facts["ansible_network_resources"].update(facts)
 
         return ansible_facts
@@ -10,28 +10,33 @@ It is in this file the configuration is collected from the device
 for a given resource, parsed, and the facts tree is populated
 based on the configuration.
 """
-from ansible.module_utils.six import iteritems
-
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.argspec.l3_interfaces.l3_interfaces import (
     L3_interfacesArgs,
 )
 from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.l3_interfaces import (
     L3_interfacesTemplate,
 )
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.sections import (
+    get_config_sections,
+    get_interfaces_config,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.utils import (
+    normalize_ip,
+)
 
 
 class L3_interfacesFacts(object):
     """The ix l3_interfaces fact class"""
 
+    # the kinds of config blocks the facts are parsed from
+    config_sections = ("interface",)
+
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = L3_interfacesArgs.argument_spec
 
     def get_l3_interfaces_data(self, connection):
-        return connection.configure_get("show running-config interface")
+        return get_interfaces_config(connection, self._module)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for l3_interfaces
@@ -47,26 +52,23 @@ class L3_interfacesFacts(object):
             data = self.get_l3_interfaces_data(connection)
 
         # parse native config using the l3_interfaces template
-        l3_interfaces_parser = L3_interfacesTemplate(lines=data.splitlines())
-        objs = l3_interfaces_parser.parse()
-
-        objs = utils.remove_empties(objs)
-        temp = []
-        for k, v in iteritems(objs):
-            temp.append(v)
-        # sorting the dict by interface name
-        temp = sorted(temp, key=lambda k, sk="name": k[sk])
+        l3_interfaces_parser = L3_interfacesTemplate(
+            lines=get_config_sections(data).lines("interface")
+        )
+        objs = list(l3_interfaces_parser.parse().values())
+        for obj in objs:
+            for afi in ("ipv4", "ipv6"):
+                for entry in obj.get(afi, []):
+                    if entry.get("address"):
+                        entry["address"] = normalize_ip(entry["address"])
 
-        objs = temp
         facts = {}
+        # validated, empty-free and sorted by interface name in one pass
+        objs = l3_interfaces_parser.normalize_config(
+            self.argument_spec, objs, key="name"
+        )
         if objs:
-            facts["l3_interfaces"] = []
-            params = utils.validate_config(self.argument_spec, {"config": objs})
-            for cfg in params["config"]:
-                facts["l3_interfaces"].append(utils.remove_empties(cfg))
-            facts["l3_interfaces"] = sorted(
-                facts["l3_interfaces"], key=lambda k, sk="name": k[sk]
-            )
+            facts["l3_interfaces"] = objs
         ansible_facts["ansible_network_resources"].update(facts)
 
         return ansible_facts
@@ -17,26 +17,33 @@ based on the configuration.
 from copy import deepcopy
 
 from ansible.module_utils.six import iteritems
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.ospf_interfaces import (
     Ospf_interfacesTemplate,
 )
 from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.argspec.ospf_interfaces.ospf_interfaces import (
     Ospf_interfacesArgs,
 )
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.sections import (
+    get_config_sections,
+    get_interfaces_config,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.utils import (
+    normalize_ip,
+)
 
 
 class Ospf_interfacesFacts(object):
     """The ix ospf_interfaces facts class"""
 
+    # the kinds of config blocks the facts are parsed from
+    config_sections = ("interface",)
+
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Ospf_interfacesArgs.argument_spec
 
     def get_ospf_interfaces_data(self, connection):
-        return connection.configure_get("show running-config interface")
+        return get_interfaces_config(connection, self._module)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for Ospf_interfaces network resource
@@ -56,7 +63,8 @@ class Ospf_interfacesFacts(object):
 
         # parse native config using the Ospf_interfaces template
         ospf_interfaces_parser = Ospf_interfacesTemplate(
-            lines=data.splitlines(), module=self._module
+            lines=get_config_sections(data).lines("interface"),
+            module=self._module,
         )
 
         objs = ospf_interfaces_parser.parse()
@@ -68,23 +76,25 @@ class Ospf_interfacesFacts(object):
                 temp_af.append(value["address_family"].get("ip"))
             if value["address_family"].get("ipv6"):
                 temp_af.append(value["address_family"].get("ipv6"))
+            for afi in temp_af:
+                for neighbor in afi.get("neighbor_v3", []):
+                    if neighbor.get("address"):
+                        neighbor["address"] = normalize_ip(neighbor["address"])
             if temp_af:
                 value["address_family"] = temp_af
+            else:
+                value.pop("address_family", None)
             if value:
-                value = utils.remove_empties(value)
                 final_objs.append(value)
 
         ansible_facts["ansible_network_resources"].pop("ospf_interfaces", None)
 
-        params = utils.remove_empties(
-            ospf_interfaces_parser.validate_config(
-                self.argument_spec,
-                {"config": final_objs},
-                redact=True,
-            ),
+        facts["ospf_interfaces"] = (
+            ospf_interfaces_parser.normalize_config(
+                self.argument_spec, final_objs, key="name", redact=True
+            )
+            or []
         )
-
-        facts["ospf_interfaces"] = params.get("config", [])
         ansible_facts["ansible_network_resources"].update(facts)
 
         return ansible_facts
@@ -17,20 +17,26 @@ based on the configuration.
 from copy import deepcopy
 
 from ansible.module_utils.six import iteritems
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.ospfv2 import (
     Ospfv2Template,
 )
 from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.argspec.ospfv2.ospfv2 import (
     Ospfv2Args,
 )
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.sections import (
+    get_config_sections,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.utils import (
+    natural_key,
+)
 
 
 class Ospfv2Facts(object):
     """The ix ospfv2 facts class"""
 
+    # the kinds of config blocks the facts are parsed from
+    config_sections = ("ip router ospf",)
+
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Ospfv2Args.argument_spec
@@ -47,32 +53,14 @@ class Ospfv2Facts(object):
 
         facts_output = {"processes": []}
 
-        for process in ospf_data.get("processes", []):
+        processes = ospf_data.get("processes", [])
+        for process in sorted(processes, key=lambda k: natural_key(k["process_id"])):
             if "areas" in process:
                 process["areas"] = list(process["areas"].values())
             facts_output["processes"].append(process)
 
         return facts_output
 
-    def preprocess_lines(self, lines):
-        """Filters input lines to extract only the relevant OSPFv3 configuration
-        :param lines: A list of configuration lines.
-
-        :rtypes: list
-        :returns: lines
-        """
-        get_line = False
-        filtered_lines = []
-
-        for line in lines:
-            if line.startswith("ip router ospf"):
-                get_line = True
-            if get_line:
-                filtered_lines.append(line)
-            if line.startswith("!"):
-                get_line = False
-        return filtered_lines
-
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for Ospfv2 network resource
 
@@ -90,7 +78,8 @@ class Ospfv2Facts(object):
 
         # parse native config using the Ospfv2 template
         ospfv2_parser = Ospfv2Template(
-            lines=self.preprocess_lines(data.splitlines()), module=self._module
+            lines=get_config_sections(data).lines("ip router ospf"),
+            module=self._module,
         )
         ospfv2_parsed = ospfv2_parser.parse()
 
@@ -104,13 +93,12 @@ class Ospfv2Facts(object):
 
         ansible_facts["ansible_network_resources"].pop("ospfv2", None)
 
-        params = utils.remove_empties(
-            ospfv2_parser.validate_config(
-                self.argument_spec, {"config": facts_output}, redact=True
+        facts["ospfv2"] = (
+            ospfv2_parser.normalize_config(
+                self.argument_spec, facts_output, redact=True
             )
+            or {}
         )
-
-        facts["ospfv2"] = params["config"]
         ansible_facts["ansible_network_resources"].update(facts)
 
         return ansible_facts
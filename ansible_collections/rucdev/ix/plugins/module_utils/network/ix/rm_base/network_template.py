@@ -0,0 +1,520 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+"""
+The ix network template file.
+IxNetworkTemplate is the parsing engine the ix rm_templates inherit from.
+It behaves like the netcommon NetworkTemplate, but indexes the PARSERS by
+their leading keywords so that each config line is only tested against
+the parsers that can match it.
+
+A parser may also define a ``result_fn`` callable which builds the parsed
+fragment from the regex captures in plain python. It must return exactly
+what rendering the parser's Jinja ``result`` would, the ``result`` stays
+the fallback for parsers without one and for the netcommon engine.
+
+The setval and remval templates are compiled once per process and cached
+by parser name, instead of being compiled again for every rendered
+command.
+
+The getval regexes are declared as LazyPattern, which compiles them on
+the first parsed line, so runs that only render commands never compile
+them. The ix engine reads the PARSERS from the template class, while the
+netcommon engine reads them from the template instance, which gives them
+with their getval compiled, see TemplateParsers.
+
+validate_config and normalize_config only apply the argspec types and
+defaults to the parsed facts, see the ix validation utils.
+"""
+
+import ast
+import re
+
+from itertools import chain
+
+from ansible.module_utils.common._collections_compat import Mapping
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    sort_list,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.validation import (
+    normalize_config,
+    validate_config,
+)
+
+try:
+    from jinja2.exceptions import UndefinedError
+except ImportError:
+    # the netcommon Template reports the missing jinja2 before anything
+    # gets compiled
+    UndefinedError = None
+
+try:
+    from ansible.module_utils.common.parameters import (
+        _list_no_log_values as list_no_log_values,
+    )
+except ImportError:
+    from ansible.module_utils.common.parameters import list_no_log_values
+
+# a run of literal characters, e.g. ``ip``, ``dead-interval`` or ``rfc1583``
+_LITERAL_RE = re.compile(r"(?:[A-Za-z0-9_]|\\?-)+")
+# a group of literal alternatives, e.g. ``(?P<afi>ip|ipv6)``
+_ALTERNATION_RE = re.compile(
+    r"\((?:\?P<\w+>|\?:)?((?:[A-Za-z0-9_-]+\|)*[A-Za-z0-9_-]+)\)"
+)
+_SPACE_RE = re.compile(r"\\s[+*]?")
+_QUANTIFIERS = ("?", "*", "+", "{")
+
+# maximum number of leading words a parser is indexed by
+_KEY_DEPTH = 2
+
+
+def strip_verbose(pattern):
+    """Removes the whitespace and comments re.VERBOSE ignores
+
+    :param pattern: a regular expression written for re.VERBOSE
+    :rtype: str
+    :returns: the same expression without the insignificant whitespace
+    """
+    stripped = []
+    in_class = False
+    idx = 0
+    while idx < len(pattern):
+        char = pattern[idx]
+        if char == "\\":
+            stripped.append(pattern[idx : idx + 2])
+            idx += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # a leading ']' (after an optional '^') is a literal
+            if pattern[idx + 1 : idx + 2] == "^":
+                stripped.append(char)
+                idx += 1
+                char = "^"
+            if pattern[idx + 1 : idx + 2] == "]":
+                stripped.append(char)
+                idx += 1
+                char = "]"
+        elif char.isspace():
+            idx += 1
+            continue
+        elif char == "#":
+            while idx < len(pattern) and pattern[idx] != "\n":
+                idx += 1
+            continue
+        stripped.append(char)
+        idx += 1
+    return "".join(stripped)
+
+
+class LazyPattern(object):
+    """A parser regex compiled on its first match
+
+    It is used in place of re.compile for the getval of the PARSERS, so
+    that importing a template, or only rendering commands with it, does
+    not compile any regex.  Once compiled the regex is kept for the rest
+    of the process, as the PARSERS are class attributes.
+
+    A re.VERBOSE pattern is compiled from its strip_verbose form, which
+    the regex parser goes through faster.  ``pattern`` and ``flags`` keep
+    the values the parser was declared with.
+    """
+
+    __slots__ = ("pattern", "flags", "_compiled")
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled = None
+
+    def compile(self):
+        """Returns the compiled regex, compiling it on the first call"""
+        compiled = self._compiled
+        if compiled is None:
+            pattern, flags = self.pattern, self.flags
+            if flags & re.VERBOSE:
+                pattern = strip_verbose(pattern)
+                flags &= ~re.VERBOSE
+            compiled = self._compiled = re.compile(pattern, flags)
+        return compiled
+
+    def match(self, string, *args):
+        """re.Pattern.match"""
+        return self.compile().match(string, *args)
+
+    def search(self, string, *args):
+        """re.Pattern.search"""
+        return self.compile().search(string, *args)
+
+    @property
+    def groupindex(self):
+        """re.Pattern.groupindex"""
+        return self.compile().groupindex
+
+    def __repr__(self):
+        return "LazyPattern(%r, %r)" % (self.pattern, self.flags)
+
+
+class TemplateParsers(object):
+    """The PARSERS of a template
+
+    Read from the template class, the parsers are the ones declared, with
+    their LazyPattern getval.  Read from a template instance, as the
+    netcommon NetworkTemplate does, they are copies with their getval
+    compiled, since re.match only takes a string or a compiled regex.
+    """
+
+    def __init__(self, parsers):
+        self.parsers = parsers
+        self._compiled = None
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.parsers
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = [
+                (
+                    dict(parser, getval=parser["getval"].compile())
+                    if isinstance(parser["getval"], LazyPattern)
+                    else parser
+                )
+                for parser in self.parsers
+            ]
+        return compiled
+
+
+def _group_end(pattern, pos):
+    """Returns the index following the group opened at pos"""
+    depth = 0
+    in_class = False
+    idx = pos
+    while idx < len(pattern):
+        char = pattern[idx]
+        if char == "\\":
+            idx += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return idx + 1
+        idx += 1
+    return None
+
+
+def _ends_word(pattern, pos):
+    """Checks that a literal ending at pos can only be followed by whitespace
+    or the end of the line, i.e. the literal is a complete word
+    """
+    if pos >= len(pattern) or pattern.startswith("$", pos):
+        return True
+    if pattern.startswith("\\s", pos):
+        return True
+    if pattern[pos] == "(":
+        end = _group_end(pattern, pos)
+        if end is None:
+            return False
+        body = pattern[pos + 1 : end - 1]
+        body = re.sub(r"^(?:\?P<\w+>|\?:)", "", body)
+        if not body.startswith("\\s") or "|" in body:
+            return False
+        quantifier = pattern[end : end + 1]
+        if quantifier in ("?", "*"):
+            return _ends_word(pattern, end + 1)
+        return quantifier not in ("+", "{")
+    return False
+
+
+def _read_word(pattern, pos):
+    """Reads a literal word, or a group of literal alternatives, at pos
+
+    :returns: a tuple of the possible words and the position after them,
+              or None when no complete literal word starts at pos
+    """
+    match = _LITERAL_RE.match(pattern, pos)
+    if match:
+        words = (match.group().replace("\\", ""),)
+    else:
+        match = _ALTERNATION_RE.match(pattern, pos)
+        if not match:
+            return None
+        words = tuple(match.group(1).split("|"))
+    end = match.end()
+    if pattern[end : end + 1] in _QUANTIFIERS or not _ends_word(pattern, end):
+        return None
+    return words, end
+
+
+def leading_keywords(getval):
+    """Derives the leading words a line must start with to match a parser
+
+    :param getval: the compiled parser regex
+    :rtype: list
+    :returns: the possible keyword tuples, e.g. [("ip", "ospf")], or None
+              when the parser may match any line
+    """
+    if getval.flags & re.IGNORECASE:
+        return None
+    pattern = getval.pattern
+    if getval.flags & re.VERBOSE:
+        pattern = strip_verbose(pattern)
+
+    pos = 1 if pattern.startswith("^") else 0
+    match = _SPACE_RE.match(pattern, pos)
+    if match:
+        pos = match.end()
+
+    keys = [()]
+    for _depth in range(_KEY_DEPTH):
+        word = _read_word(pattern, pos)
+        if word is None:
+            break
+        words, pos = word
+        keys = [key + (each,) for key in keys for each in words]
+        match = _SPACE_RE.match(pattern, pos)
+        if not match:
+            break
+        pos = match.end()
+
+    if not keys[0]:
+        return None
+    return keys
+
+
+def literal(value):
+    """Converts a captured value the way a rendered Jinja result is converted
+
+    :param value: the captured string, or None when the group did not match
+    :returns: None for a missing or empty value, the python literal the
+              value spells if any, the value itself otherwise
+    """
+    if not value:
+        return None
+    if value.isdigit() and value.isascii() and (value[0] != "0" or value == "0"):
+        return int(value)
+    try:
+        return ast.literal_eval(value)
+    except Exception:
+        return str(value)
+
+
+def compact(data):
+    """Drops the None values of a result fragment, as _deepformat does
+
+    :param data: the dict built by a result_fn
+    :rtype: dict
+    :returns: the dict without its None values
+    """
+    return dict((key, value) for key, value in data.items() if value is not None)
+
+
+def merge_into(base, other):
+    """Merges other into base in place
+
+    Gives the same result as the netcommon dict_merge, without copying the
+    accumulated base for every parsed line: lists are combined, nested dicts
+    merged, and a None in other replaces the value of base, a list included.
+
+    :param base: dict object updated in place
+    :param other: dict object to combine with base
+    :returns: base
+    """
+    for key, item in other.items():
+        if key not in base:
+            base[key] = item
+            continue
+        value = base[key]
+        if item is None:
+            base[key] = None
+        elif isinstance(value, dict):
+            if isinstance(item, Mapping):
+                merge_into(value, item)
+            else:
+                base[key] = item
+        elif isinstance(value, list):
+            try:
+                base[key] = list(set(chain(value, item)))
+            except TypeError:
+                value.extend([i for i in item if i not in value])
+        elif sort_list(value) != sort_list(item):
+            base[key] = item
+    return base
+
+
+def compile_renderer(template, tmplt):
+    """Compiles a setval or remval template into a callable
+
+    The callable renders the command exactly like the netcommon Template
+    does, from a template compiled only once.
+
+    :param template: the netcommon Template whose environment is used
+    :param tmplt: the Jinja template string, or an existing callable
+    :returns: a callable taking the data and returning the command
+    """
+    if callable(tmplt):
+        return tmplt
+    if not template.contains_vars(tmplt):
+        return lambda data: tmplt
+
+    compiled = template.env.from_string(tmplt)
+
+    def renderer(data):
+        try:
+            value = compiled.render(data or {})
+        except UndefinedError:
+            return None
+        return literal(value)
+
+    return renderer
+
+
+class ParserDispatch(object):
+    """Index of a template's PARSERS by their leading keywords"""
+
+    def __init__(self, parsers):
+        self._parsers = parsers
+        self._wildcard = []
+        self._by_word = {}
+        self._by_pair = {}
+        self._candidates = {}
+
+        for idx, parser in enumerate(parsers):
+            keys = leading_keywords(parser["getval"])
+            if keys is None:
+                self._wildcard.append(idx)
+                continue
+            for key in keys:
+                if len(key) == 1:
+                    self._by_word.setdefault(key[0], []).append(idx)
+                else:
+                    self._by_pair.setdefault(key, []).append(idx)
+        self._paired = set(key[0] for key in self._by_pair)
+
+    def candidates(self, line):
+        """Returns the parsers that may match a line, in PARSERS order
+
+        :param line: a configuration line
+        :rtype: list
+        :returns: the candidate parsers
+        """
+        words = line.split(None, _KEY_DEPTH)
+        if not words:
+            key = (None, None)
+        elif words[0] in self._paired and len(words) > 1:
+            key = (words[0], words[1])
+        else:
+            key = (words[0], None)
+
+        found = self._candidates.get(key)
+        if found is None:
+            indexes = set(self._wildcard)
+            indexes.update(self._by_word.get(key[0], ()))
+            indexes.update(self._by_pair.get(key, ()))
+            found = [self._parsers[idx] for idx in sorted(indexes)]
+            self._candidates[key] = found
+        return found
+
+
+class IxNetworkTemplate(NetworkTemplate):
+    """The NetworkTemplate the ix rm_templates inherit from"""
+
+    _DISPATCH = {}
+    _PARSERS_BY_NAME = {}
+    _RENDERERS = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super(IxNetworkTemplate, cls).__init_subclass__(**kwargs)
+        parsers = cls.__dict__.get("PARSERS")
+        if isinstance(parsers, list):
+            cls.PARSERS = TemplateParsers(parsers)
+
+    def dispatch(self):
+        """Returns the keyword index of the template's PARSERS"""
+        tmplt = type(self._tmplt)
+        table = self._DISPATCH.get(tmplt)
+        if table is None:
+            table = self._DISPATCH[tmplt] = ParserDispatch(tmplt.PARSERS)
+        return table
+
+    def get_parser(self, name):
+        """get_parser"""
+        tmplt = type(self._tmplt)
+        parsers = self._PARSERS_BY_NAME.get(tmplt)
+        if parsers is None:
+            parsers = self._PARSERS_BY_NAME[tmplt] = {}
+            for parser in tmplt.PARSERS:
+                parsers.setdefault(parser["name"], parser)
+        return parsers[name]
+
+    def render(self, data, parser_name, negate=False):
+        """render"""
+        key = (type(self._tmplt), parser_name, negate)
+        renderer = self._RENDERERS.get(key)
+        if renderer is None:
+            parser = self.get_parser(parser_name)
+            if negate:
+                tmplt = parser.get("remval") or parser["setval"]
+            else:
+                tmplt = parser["setval"]
+            renderer = compile_renderer(self._template, tmplt)
+            self._RENDERERS[key] = renderer
+        return self._render(renderer, data, negate)
+
+    def parse(self):
+        """parse"""
+        result = {}
+        shared = {}
+        dispatch = self.dispatch()
+        for line in self._lines:
+            for parser in dispatch.candidates(line):
+                cap = parser["getval"].match(line)
+                if cap:
+                    capdict = cap.groupdict()
+                    capdict = dict((k, v) for k, v in capdict.items() if v is not None)
+                    if parser.get("shared"):
+                        shared = capdict
+                    vals = dict(capdict)
+                    vals.update(shared)
+                    result_fn = parser.get("result_fn")
+                    if result_fn is not None:
+                        res = result_fn(vals)
+                    else:
+                        res = self._deepformat(parser["result"], vals)
+                    merge_into(result, res)
+                    break
+        return result
+
+    def validate_config(self, spec, data, redact=False):
+        """validate_config"""
+        validated_data = validate_config(spec, data)
+        if redact:
+            self._module.no_log_values.update(list_no_log_values(spec, validated_data))
+        return validated_data
+
+    def normalize_config(self, spec, config, key=None, redact=False):
+        """Returns the parsed config validated, empty-free and sorted by key"""
+        config = normalize_config(spec, config, key)
+        if redact and config:
+            self._module.no_log_values.update(
+                list_no_log_values(spec, {"config": config})
+            )
+        return config
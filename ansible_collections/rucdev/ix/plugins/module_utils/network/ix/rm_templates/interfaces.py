@@ -16,25 +16,53 @@ the given network resource.
 """
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_base.network_template import (
+    IxNetworkTemplate,
+    LazyPattern,
+    compact,
+    literal,
 )
 
 
-class InterfacesTemplate(NetworkTemplate):
+def _result_interface(vals):
+    return {literal(vals["name"]): {"name": literal(vals["name"])}}
+
+
+def _result_description(vals):
+    return {
+        literal(vals["name"]): compact(
+            {"description": literal(vals.get("description"))}
+        )
+    }
+
+
+def _result_enabled(vals):
+    return {
+        literal(vals["name"]): {
+            "enabled": not ("shutdown" in vals and "negate" not in vals)
+        }
+    }
+
+
+def _result_mtu(vals):
+    return {literal(vals["name"]): compact({"mtu": literal(vals.get("mtu"))})}
+
+
+class InterfacesTemplate(IxNetworkTemplate):
     def __init__(self, lines=None, tmplt=None, prefix=None, module=None):
         super(InterfacesTemplate, self).__init__(lines=lines, tmplt=self, module=module)
 
     PARSERS = [
         {
             "name": "interface",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
               ^interface\s
               (?P<name>\S+)$""",
                 re.VERBOSE,
             ),
             "setval": "interface {{ name }}",
+            "result_fn": _result_interface,
             "result": {
                 "{{ name }}": {
                     "name": "{{ name }}",
@@ -44,13 +72,14 @@ class InterfacesTemplate(NetworkTemplate):
         },
         {
             "name": "description",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+description\s(?P<description>.+$)
                 $""",
                 re.VERBOSE,
             ),
             "setval": "description {{ description }}",
+            "result_fn": _result_description,
             "result": {
                 "{{ name }}": {
                     "description": "{{ description }}",
@@ -59,7 +88,7 @@ class InterfacesTemplate(NetworkTemplate):
         },
         {
             "name": "enabled",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 (?P<negate>\s+no)?
                 (?P<shutdown>\s+shutdown)
@@ -67,6 +96,7 @@ class InterfacesTemplate(NetworkTemplate):
                 re.VERBOSE,
             ),
             "setval": "shutdown",
+            "result_fn": _result_enabled,
             "result": {
                 "{{ name }}": {
                     "enabled": "{{ False if shutdown is defined and negate is not defined else True }}",
@@ -75,13 +105,14 @@ class InterfacesTemplate(NetworkTemplate):
         },
         {
             "name": "mtu",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+ip\smtu\s(?P<mtu>\d+$)
                 $""",
                 re.VERBOSE,
             ),
             "setval": "ip mtu {{ mtu }}",
+            "result_fn": _result_mtu,
             "result": {
                 "{{ name }}": {
                     "mtu": "{{ mtu }}",
@@ -16,12 +16,67 @@ the given network resource.
 """
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_base.network_template import (
+    IxNetworkTemplate,
+    LazyPattern,
+    compact,
+    literal,
 )
 
 
-class L3_interfacesTemplate(NetworkTemplate):
+def _result_name(vals):
+    return {literal(vals["name"]): {"name": literal(vals["name"])}}
+
+
+def _result_ipv4_address(vals):
+    return {
+        literal(vals["name"]): {
+            "ipv4": [
+                compact(
+                    {
+                        "address": literal(vals.get("ipv4")),
+                        "secondary": True if "secondary" in vals else None,
+                    }
+                )
+            ]
+        }
+    }
+
+
+def _result_ipv6_address(vals):
+    return {
+        literal(vals["name"]): {
+            "ipv6": [
+                compact(
+                    {
+                        "address": literal(vals.get("ipv6")),
+                        "anycast": True if "anycast" in vals else None,
+                        "eui": True if "eui" in vals else None,
+                    }
+                )
+            ]
+        }
+    }
+
+
+def _result_ipv6_autoconfig(vals):
+    return {
+        literal(vals["name"]): {
+            "ipv6": [
+                {
+                    "autoconfig": compact(
+                        {
+                            "enable": True if "enable" in vals else None,
+                            "default": True if "default" in vals else None,
+                        }
+                    )
+                }
+            ]
+        }
+    }
+
+
+class L3_interfacesTemplate(IxNetworkTemplate):
     def __init__(self, lines=None, tmplt=None, prefix=None, module=None):
         super(L3_interfacesTemplate, self).__init__(
             lines=lines, tmplt=self, module=module
@@ -30,7 +85,7 @@ class L3_interfacesTemplate(NetworkTemplate):
     PARSERS = [
         {
             "name": "name",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""^interface
                     (\s(?P<name>\S+))
                     $""",
@@ -38,12 +93,13 @@ class L3_interfacesTemplate(NetworkTemplate):
             ),
             "compval": "name",
             "setval": "interface {{ name }}",
+            "result_fn": _result_name,
             "result": {"{{ name }}": {"name": "{{ name }}"}},
             "shared": True,
         },
         {
             "name": "ipv4.address",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""\s+ip\saddress
                     (\s(?P<ipv4>\S+))
                     (\s(?P<secondary>secondary))?
@@ -52,6 +108,7 @@ class L3_interfacesTemplate(NetworkTemplate):
             ),
             "setval": "ip address {{ ipv4.address }}"
             "{{ ' secondary' if ipv4.secondary|d(False) else ''}}",
+            "result_fn": _result_ipv4_address,
             "result": {
                 "{{ name }}": {
                     "ipv4": [
@@ -65,7 +122,7 @@ class L3_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "ipv6.address",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""\s+ipv6\saddress
                     (\s(?P<ipv6>\S+))
                     (\s(?P<anycast>anycast))?
@@ -75,6 +132,7 @@ class L3_interfacesTemplate(NetworkTemplate):
             ),
             "setval": "ipv6 address {{ ipv6.address }}{{ ' anycast' if ipv6.anycast|d(False) else ''}}"
             "{{' eui-64' if ipv6.eui|d(False) else ''}}",
+            "result_fn": _result_ipv6_address,
             "result": {
                 "{{ name }}": {
                     "ipv6": [
@@ -89,7 +147,7 @@ class L3_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "ipv6.autoconfig",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""\s+ipv6\saddress
                     (\s(?P<enable>autoconfig))
                     (\s(?P<default>receive-default))?
@@ -98,6 +156,7 @@ class L3_interfacesTemplate(NetworkTemplate):
             ),
             "setval": "{{ 'ipv6 address autoconfig' if ipv6.autoconfig.enable|d(False) or ipv6.autoconfig.default|d(False) else ''}}"
             "{{ ' receive-default' if ipv6.autoconfig.default|d(False) else ''}}",
+            "result_fn": _result_ipv6_autoconfig,
             "result": {
                 "{{ name }}": {
                     "ipv6": [
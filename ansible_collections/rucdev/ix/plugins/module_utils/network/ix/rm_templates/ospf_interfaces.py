@@ -15,12 +15,130 @@ the given network resource.
 """
 
 import re
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_base.network_template import (
+    IxNetworkTemplate,
+    LazyPattern,
+    compact,
+    literal,
 )
 
 
-class Ospf_interfacesTemplate(NetworkTemplate):
+def _result_name(vals):
+    return {
+        literal(vals["name"]): {"name": literal(vals["name"]), "address_family": {}}
+    }
+
+
+def _result_afi(attr):
+    """Builds the result_fn of the parsers configuring attr for ip or ipv6"""
+
+    def result_fn(vals):
+        afi = vals["afi"]
+        return {
+            literal(vals["name"]): {
+                "address_family": {
+                    literal(afi): compact(
+                        {
+                            "afi": "ipv4" if afi == "ip" else "ipv6",
+                            attr: literal(vals.get(attr)),
+                        }
+                    )
+                }
+            }
+        }
+
+    return result_fn
+
+
+def _result_ipv4(data):
+    """Wraps the ip address family fragment of a parser"""
+
+    def result_fn(vals):
+        return {literal(vals["name"]): {"address_family": {"ip": data(vals)}}}
+
+    return result_fn
+
+
+def _result_ipv6(data):
+    """Wraps the ipv6 address family fragment of a parser"""
+
+    def result_fn(vals):
+        return {literal(vals["name"]): {"address_family": {"ipv6": data(vals)}}}
+
+    return result_fn
+
+
+@_result_ipv4
+def _result_authentication(vals):
+    return {
+        "afi": "ipv4",
+        "authentication": compact(
+            {
+                "message_digest": True if "message_digest" in vals else None,
+                "null": True if "isnull" in vals else None,
+            }
+        ),
+    }
+
+
+@_result_ipv4
+def _result_message_digest_key(vals):
+    return {
+        "afi": "ipv4",
+        "message_digest_key": compact(
+            {
+                "key_id": literal(vals.get("key_id")),
+                "password": literal(vals.get("password")),
+            }
+        ),
+    }
+
+
+@_result_ipv4
+def _result_mtu_ignore(vals):
+    return {"afi": "ipv4", "mtu_ignore": "mtu_ignore" in vals}
+
+
+@_result_ipv4
+def _result_neighbor_v2(vals):
+    return {
+        "afi": "ipv4",
+        "neighbor_v2": [
+            compact(
+                {
+                    "interval": literal(vals.get("interval")),
+                    "priority": literal(vals.get("priority")),
+                    "router_id": literal(vals.get("router_id")),
+                }
+            )
+        ],
+    }
+
+
+@_result_ipv6
+def _result_neighbor_v3(vals):
+    return {
+        "afi": "ipv6",
+        "neighbor_v3": [
+            compact(
+                {
+                    "address": literal(vals.get("address")),
+                    "interval": literal(vals.get("interval")),
+                    "priority": literal(vals.get("priority")),
+                    "process_id": literal(vals.get("process_id")),
+                    "router_id": literal(vals.get("router_id")),
+                }
+            )
+        ],
+    }
+
+
+@_result_ipv4
+def _result_interface_type(vals):
+    return compact({"interface_type": literal(vals.get("interface_type"))})
+
+
+class Ospf_interfacesTemplate(IxNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(Ospf_interfacesTemplate, self).__init__(
             lines=lines, tmplt=self, module=module
@@ -30,11 +148,12 @@ class Ospf_interfacesTemplate(NetworkTemplate):
     PARSERS = [
         {
             "name": "name",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 ^interface\s(?P<name>\S+)
                 $""", re.VERBOSE),
             "setval": "interface {{ name }}",
+            "result_fn": _result_name,
             "result": {
                 "{{ name }}": {
                     "name": "{{ name }}",
@@ -45,7 +164,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "authentication",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+ip\sospf\sauthentication
                 (\s(?P<message_digest>message-digest))?
@@ -54,6 +173,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
             "setval": "ip ospf authentication"
             "{{ (' ' + message-digest) if authentication.message_digest is defined else '' }}"
             "{{ (' ' + null) if authentication.null is defined else '' }}",
+            "result_fn": _result_authentication,
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -70,7 +190,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "cost",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+(?P<afi>ip|ipv6)
                 \sospf\scost\s(?P<cost>\S+)
@@ -78,6 +198,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "{{ 'ip' if afi == 'ipv4' else 'ipv6' }} ospf cost {{ cost }}",
+            "result_fn": _result_afi("cost"),
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -91,7 +212,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "dead_interval",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+(?P<afi>ip|ipv6)
                 \sospf\sdead-interval\s(?P<dead_interval>\S+)
@@ -99,6 +220,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "{{ 'ip' if afi == 'ipv4' else 'ipv6' }} ospf dead-interval {{ dead_interval }}",
+            "result_fn": _result_afi("dead_interval"),
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -112,7 +234,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "hello_interval",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+(?P<afi>ip|ipv6)
                 \sospf\shello-interval\s(?P<hello_interval>\S+)
@@ -120,6 +242,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "{{ 'ip' if afi == 'ipv4' else 'ipv6' }} ospf hello-interval {{ hello_interval }}",
+            "result_fn": _result_afi("hello_interval"),
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -133,7 +256,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "message_digest_key",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+ip\sospf\smessage-digest
                 \s(?P<key_id>\S+)
@@ -142,6 +265,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "ip ospf message-digest {{ key_id }} {{ password}}",
+            "result_fn": _result_message_digest_key,
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -158,13 +282,14 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "mtu_ignore",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+ip\sospf\s(?P<mtu_ignore>mtu-ignore)
                 $""",
                 re.VERBOSE
             ),
             "setval": "ip ospf mtu-ignore",
+            "result_fn": _result_mtu_ignore,
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -178,7 +303,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "neighbor_v2",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+ip\sospf\sneighbor
                 \s(?P<router_id>\S+)
@@ -190,6 +315,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
             "setval": "ip ospf neighbor {{ router_id }}"
             "{{ (' poll-interval' + interval) if interval is defined else '' }}"
             "{{ (' priority' + priority) if priority is defined else '' }}",
+            "result_fn": _result_neighbor_v2,
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -209,7 +335,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "neighbor_v3",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+ipv6\sospf\sneighbor
                 \s(?P<process_id>\S+)
@@ -223,6 +349,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
             "setval": "ipv6 ospf neighbor {{ process_id }} {{ router_id }} {{ address }}"
             "{{ (' poll-interval' + interval) if interval is defined else '' }}"
             "{{ (' priority' + priority) if priority is defined else '' }}",
+            "result_fn": _result_neighbor_v3,
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -244,13 +371,14 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "interface_type",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+ip\sospf\snetwork\s(?P<interface_type>\S+)
                 $""",
                 re.VERBOSE
             ),
             "setval": "ip ospf network {{ interface_type }}",
+            "result_fn": _result_interface_type,
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -263,7 +391,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "priority",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+(?P<afi>ip|ipv6)
                 \spriority\s(?P<priority>\S+)
@@ -271,6 +399,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "{{ 'ip' if afi == 'ipv4' else 'ipv6' }} ospf priority {{ priority }}",
+            "result_fn": _result_afi("priority"),
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -284,7 +413,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "retransmit_interval",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+(?P<afi>ip|ipv6)
                 \sospf\sretransmit-interval
@@ -293,6 +422,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "{{ 'ip' if afi == 'ipv4' else 'ipv6' }} ospf retransmit-interval {{ retransmit_interval }}",
+            "result_fn": _result_afi("retransmit_interval"),
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -306,7 +436,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
         },
         {
             "name": "transmit_delay",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+(?P<afi>ip|ipv6)
                 \sospf\stransmit-delay\s(?P<transmit_delay>\S+)
@@ -314,6 +444,7 @@ class Ospf_interfacesTemplate(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "{{ 'ip' if afi == 'ipv4' else 'ipv6' }} ospf transmit-delay {{ transmit_delay }}",
+            "result_fn": _result_afi("transmit_delay"),
             "result": {
                 "{{ name }}": {
                     "address_family": {
@@ -15,8 +15,11 @@ the given network resource.
 """
 
 import re
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_base.network_template import (
+    IxNetworkTemplate,
+    LazyPattern,
+    compact,
+    literal,
 )
 
 
@@ -47,7 +50,224 @@ def _tmplt_ospf_virtual_link(config_data):
     return command
 
 
-class Ospfv2Template(NetworkTemplate):
+def _result_process(data):
+    """Wraps the process level fragment of a parser"""
+
+    def result_fn(vals):
+        return {"processes": {literal(vals["pid"]): data(vals)}}
+
+    return result_fn
+
+
+def _result_area(data):
+    """Wraps the area level fragment of a parser"""
+
+    def result_fn(vals):
+        area = compact({"area_id": literal(vals.get("area_id"))})
+        area.update(data(vals))
+        return {
+            "processes": {
+                literal(vals["pid"]): {"areas": {literal(vals["area_id"]): area}}
+            }
+        }
+
+    return result_fn
+
+
+@_result_process
+def _result_pid(vals):
+    return {"process_id": int(vals["pid"])}
+
+
+@_result_area
+def _result_area_id(vals):
+    return {}
+
+
+@_result_area
+def _result_default_cost(vals):
+    return compact({"default_cost": literal(vals.get("default_cost"))})
+
+
+@_result_area
+def _result_nssa(vals):
+    return {
+        "nssa": compact(
+            {
+                "no_summary": True if "no_summary" in vals else None,
+                "stability_interval": literal(vals.get("stability_interval")),
+                "translate": True if "translate" in vals else None,
+                "default_metric": literal(vals.get("default_metric")),
+            }
+        )
+    }
+
+
+@_result_area
+def _result_ranges(vals):
+    return {
+        "ranges": [
+            compact(
+                {
+                    "address": literal(vals.get("address")),
+                    "advertise": "not_advertise" not in vals,
+                }
+            )
+        ]
+    }
+
+
+@_result_area
+def _result_stub(vals):
+    return {
+        "stub": compact(
+            {
+                "set": True if "stub" in vals and "no_sum" not in vals else None,
+                "no_summary": True if "no_sum" in vals else None,
+            }
+        )
+    }
+
+
+@_result_area
+def _result_virtual_links(vals):
+    if "auth_type" in vals:
+        auth_type = literal(vals["auth_type"])
+    elif "authentication" in vals:
+        auth_type = "text"
+    else:
+        auth_type = None
+    return {
+        "virtual_links": [
+            compact(
+                {
+                    "address": literal(vals.get("address")),
+                    "authentication": compact(
+                        {
+                            "auth_type": auth_type,
+                            "text_password": literal(vals.get("password")),
+                            "message_digest_key_id": literal(
+                                vals.get("message_digest_key_id")
+                            ),
+                            "message_digest_password": literal(
+                                vals.get("message_digest_password")
+                            ),
+                        }
+                    ),
+                    "hello_interval": literal(vals.get("hello_interval")),
+                    "dead_interval": literal(vals.get("dead_interval")),
+                    "retransmit_interval": literal(vals.get("retransmit_interval")),
+                    "transmit_delay": literal(vals.get("transmit_delay")),
+                }
+            )
+        ]
+    }
+
+
+@_result_process
+def _result_compatible(vals):
+    return {"compatible": compact({"rfc1583": True if "rfc1583" in vals else None})}
+
+
+@_result_process
+def _result_default_metric(vals):
+    return compact({"default_metric": literal(vals.get("metric"))})
+
+
+@_result_process
+def _result_distance(vals):
+    return {
+        "distance": compact(
+            {
+                "external": literal(vals.get("external")),
+                "inter_area": literal(vals.get("inter_area")),
+                "intra_area": literal(vals.get("intra_area")),
+                "nssa_external": literal(vals.get("nssa_external")),
+            }
+        )
+    }
+
+
+@_result_process
+def _result_distribute_list(vals):
+    return {
+        "distribute_list": compact(
+            {
+                "prefix": literal(vals.get("prefix_list")),
+                "route_map": literal(vals.get("route_map")),
+            }
+        )
+    }
+
+
+@_result_process
+def _result_network(vals):
+    return {
+        "network": [
+            compact(
+                {
+                    "address": literal(vals.get("address")),
+                    "area": literal(vals.get("area")),
+                }
+            )
+        ]
+    }
+
+
+@_result_process
+def _result_nssa_range(vals):
+    return {
+        "nssa_range": [
+            compact(
+                {
+                    "range": literal(vals.get("range")),
+                    "not_advertise": True if "not_advertise" in vals else None,
+                    "tag": literal(vals.get("tag")),
+                }
+            )
+        ]
+    }
+
+
+@_result_process
+def _result_originate_default(vals):
+    return {
+        "originate_default": compact(
+            {
+                "always": True if "always" in vals else None,
+                "metric": literal(vals.get("metric")),
+                "metric_type": literal(vals.get("metric_type")),
+                "route_map": literal(vals.get("route_map")),
+            }
+        )
+    }
+
+
+@_result_process
+def _result_passive_interfaces(vals):
+    return {"passive_interfaces": [literal(vals.get("interface"))]}
+
+
+@_result_process
+def _result_rib(vals):
+    return {"rib": compact({"max_entries": literal(vals.get("max_entries"))})}
+
+
+@_result_process
+def _result_router_id(vals):
+    return compact({"router_id": literal(vals.get("router_id"))})
+
+
+@_result_process
+def _result_timers(vals):
+    return {
+        "timers": compact(
+            {"delay": literal(vals.get("delay")), "hold": literal(vals.get("hold"))}
+        )
+    }
+
+
+class Ospfv2Template(IxNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(Ospfv2Template, self).__init__(lines=lines, tmplt=self, module=module)
 
@@ -55,12 +275,13 @@ class Ospfv2Template(NetworkTemplate):
     PARSERS = [
         {
             "name": "pid",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 ^ip\srouter\sospf
                 (\s(?P<pid>\d+))
                 $""", re.VERBOSE),
             "setval": "ip router ospf {{ process_id }}",
+            "result_fn": _result_pid,
             "result": {
                 "processes": {
                     "{{ pid }}": {"process_id": "{{ pid | int }}"}
@@ -70,12 +291,13 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "area_id",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+area
                 (\s(?P<area_id>\S+))
                 $""", re.VERBOSE),
             "setval": "area {{ area_id }}",
+            "result_fn": _result_area_id,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -90,13 +312,14 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "default_cost",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+area\s(?P<area_id>\S+)
                 \sdefault-cost
                 (\s(?P<default_cost>\S+))?
                 $""", re.VERBOSE),
             "setval": "area {{ area_id }} default-cost {{ default_cost }}",
+            "result_fn": _result_default_cost,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -112,7 +335,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "nssa",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+area\s(?P<area_id>\S+)
                 (\s(?P<nssa>nssa))?
@@ -124,6 +347,7 @@ class Ospfv2Template(NetworkTemplate):
                 $""",
                 re.VERBOSE,
             ),
+            "result_fn": _result_nssa,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -144,7 +368,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "ranges",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+area
                 (\s(?P<area_id>\S+))
@@ -155,6 +379,7 @@ class Ospfv2Template(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "area {{ area_id }} range {{ address }} {{ 'advertise' if advertise else 'not-advertise' }}",
+            "result_fn": _result_ranges,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -175,7 +400,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "stub",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+area
                 (\s(?P<area_id>\S+))
@@ -186,6 +411,7 @@ class Ospfv2Template(NetworkTemplate):
             ),
             "setval": "area {{ area_id }} stub"
             "{{ (' no-summary') if stub.no_summary is defined and stub.no_summary else '' }}",
+            "result_fn": _result_stub,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -204,7 +430,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "virtual_links",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+area
                 (\s(?P<area_id>\S+))
@@ -221,6 +447,7 @@ class Ospfv2Template(NetworkTemplate):
                 re.VERBOSE,
             ),
             "setval": _tmplt_ospf_virtual_link,
+            "result_fn": _result_virtual_links,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -250,13 +477,14 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "compatible",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+compatible(\s(?P<rfc1583>rfc1583))
                 $""",
                 re.VERBOSE
             ),
             "setval": "compatible {{ 'rfc1583' if rfc1583 }}",
+            "result_fn": _result_compatible,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -269,11 +497,12 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "default_metric",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+default-metric\s(?P<metric>\S+)
                 $""", re.VERBOSE),
             "setval": "default-metric {{ default_metric }}",
+            "result_fn": _result_default_metric,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -284,7 +513,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "distance",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+distance
                 (\sexternal\s(?P<external>\S+))?
@@ -297,6 +526,7 @@ class Ospfv2Template(NetworkTemplate):
             "{{ ' inter-area ' + distance.inter_area|string if distance.inter_area is defined }}"
             "{{ ' intra-area ' + distance.intra_area|string if distance.intra_area is defined }}"
             "{{ ' nssa-external ' + distance.nssa_external|string if distance.nssa_external is defined }}",
+            "result_fn": _result_distance,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -312,7 +542,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "distribute_list",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+distribute-list\s
                 (prefix\s(?P<prefix_list>\S+))?
@@ -323,6 +553,7 @@ class Ospfv2Template(NetworkTemplate):
             "setval": "distribute-list"
             "{{ ' prefix ' + distribute_list.prefix|string if distribute_list.prefix is defined else '' }}"
             "{{ ' route-map ' + distribute_list.route_map|string if distribute_list.route_map is defined else '' }}",
+            "result_fn": _result_distribute_list,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -336,7 +567,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "network",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+network
                 \s(?P<address>\S+)
@@ -345,6 +576,7 @@ class Ospfv2Template(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "network {{ address }} area {{ area }}",
+            "result_fn": _result_network,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -360,7 +592,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "nssa_range",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+nssa-range
                 \s(?P<range>\S+)
@@ -370,6 +602,7 @@ class Ospfv2Template(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "nssa-range {{ range }}{{ ' not-advertise' if not_advertise }}{{ ' ' + tag if tag is defined}}",
+            "result_fn": _result_nssa_range,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -386,7 +619,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "originate_default",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+originate-default
                 (\s(?P<always>always))?
@@ -400,6 +633,7 @@ class Ospfv2Template(NetworkTemplate):
             " metric {{ originate_default.metric }}"
             " metric-type {{ originate_default.metric_type }}"
             " route-map {{ originate_default.route_map }}",
+            "result_fn": _result_originate_default,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -415,7 +649,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "passive_interfaces",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+passive-interface
                 (\s(?P<interface>\S+))?
@@ -423,6 +657,7 @@ class Ospfv2Template(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "passive-interface {{ interface }}",
+            "result_fn": _result_passive_interfaces,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -435,7 +670,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "rib",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+rib
                 (\smax-entries\s(?P<max_entries>\S+))?
@@ -443,6 +678,7 @@ class Ospfv2Template(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "rib max-entries {{ rib.max_entries }}",
+            "result_fn": _result_rib,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -455,7 +691,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "router_id",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+router-id
                 (\s(?P<router_id>\S+))?
@@ -463,6 +699,7 @@ class Ospfv2Template(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "router-id {{ router_id }}",
+            "result_fn": _result_router_id,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -473,7 +710,7 @@ class Ospfv2Template(NetworkTemplate):
         },
         {
             "name": "timers",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+timers
                 (\sdelay\s(?P<delay>\S+))?
@@ -484,6 +721,7 @@ class Ospfv2Template(NetworkTemplate):
             "setval": "timers"
             "{{ ' delay ' + timers.delay|string if timers.delay is defined else '' }}"
             "{{ ' hold ' + timers.hold|string if timers.hold is defined else '' }}",
+            "result_fn": _result_timers,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -15,12 +15,140 @@ the given network resource.
 """
 
 import re
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_base.network_template import (
+    IxNetworkTemplate,
+    LazyPattern,
+    compact,
+    literal,
 )
 
 
-class Ospfv3Template(NetworkTemplate):
+def _result_process(data):
+    """Wraps the process level fragment of a parser"""
+
+    def result_fn(vals):
+        return {"processes": {literal(vals["pid"]): data(vals)}}
+
+    return result_fn
+
+
+def _result_area(data):
+    """Wraps the area level fragment of a parser"""
+
+    def result_fn(vals):
+        area = compact({"area_id": literal(vals.get("area_id"))})
+        area.update(data(vals))
+        return {
+            "processes": {
+                literal(vals["pid"]): {"areas": {literal(vals["area_id"]): area}}
+            }
+        }
+
+    return result_fn
+
+
+@_result_process
+def _result_pid(vals):
+    return {"process_id": int(vals["pid"])}
+
+
+@_result_area
+def _result_area_id(vals):
+    return {}
+
+
+@_result_area
+def _result_default_cost(vals):
+    return compact({"default_cost": literal(vals.get("default_cost"))})
+
+
+@_result_area
+def _result_ranges(vals):
+    return {
+        "ranges": [
+            compact(
+                {
+                    "address": literal(vals.get("address")),
+                    "advertise": "not_advertise" not in vals,
+                }
+            )
+        ]
+    }
+
+
+@_result_area
+def _result_stub(vals):
+    return {
+        "stub": compact(
+            {
+                "set": True if "stub" in vals and "no_sum" not in vals else None,
+                "no_summary": True if "no_sum" in vals else None,
+            }
+        )
+    }
+
+
+@_result_process
+def _result_distance(vals):
+    return {
+        "distance": compact(
+            {
+                "external": literal(vals.get("external")),
+                "inter_area": literal(vals.get("inter_area")),
+                "intra_area": literal(vals.get("intra_area")),
+            }
+        )
+    }
+
+
+@_result_process
+def _result_network(vals):
+    return {
+        "network": [
+            compact(
+                {
+                    "address": literal(vals.get("address")),
+                    "area": literal(vals.get("area")),
+                }
+            )
+        ]
+    }
+
+
+@_result_process
+def _result_originate_default(vals):
+    return {
+        "originate_default": compact(
+            {
+                "always": True if "always" in vals else None,
+                "metric": literal(vals.get("metric")),
+                "metric_type": literal(vals.get("metric_type")),
+                "route_map": literal(vals.get("route_map")),
+            }
+        )
+    }
+
+
+@_result_process
+def _result_passive_interfaces(vals):
+    return {"passive_interfaces": [literal(vals.get("interface"))]}
+
+
+@_result_process
+def _result_router_id(vals):
+    return compact({"router_id": literal(vals.get("router_id"))})
+
+
+@_result_process
+def _result_timers(vals):
+    return {
+        "timers": compact(
+            {"delay": literal(vals.get("delay")), "hold": literal(vals.get("hold"))}
+        )
+    }
+
+
+class Ospfv3Template(IxNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(Ospfv3Template, self).__init__(lines=lines, tmplt=self, module=module)
 
@@ -28,11 +156,12 @@ class Ospfv3Template(NetworkTemplate):
     PARSERS = [
         {
             "name": "pid",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 ^ipv6\srouter\sospf\s(?P<pid>\d+)
                 $""", re.VERBOSE),
             "setval": "ipv6 router ospf {{ process_id }}",
+            "result_fn": _result_pid,
             "result": {
                 "processes": {
                     "{{ pid }}": {"process_id": "{{ pid | int }}"}
@@ -42,12 +171,13 @@ class Ospfv3Template(NetworkTemplate):
         },
         {
             "name": "area_id",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+area
                 (\s(?P<area_id>\S+))
                 $""", re.VERBOSE),
             "setval": "area {{ area_id }}",
+            "result_fn": _result_area_id,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -62,13 +192,14 @@ class Ospfv3Template(NetworkTemplate):
         },
         {
             "name": "default_cost",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+area\s(?P<area_id>\S+)
                 \sdefault-cost
                 (\s(?P<default_cost>\S+))?
                 $""", re.VERBOSE),
             "setval": "area {{ area_id }} default-cost {{ default_cost }}",
+            "result_fn": _result_default_cost,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -84,7 +215,7 @@ class Ospfv3Template(NetworkTemplate):
         },
         {
             "name": "ranges",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+area
                 (\s(?P<area_id>\S+))
@@ -95,6 +226,7 @@ class Ospfv3Template(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "area {{ area_id }} range {{ address }} {{ 'advertise' if advertise else 'not-advertise' }}",
+            "result_fn": _result_ranges,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -115,7 +247,7 @@ class Ospfv3Template(NetworkTemplate):
         },
         {
             "name": "stub",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+area
                 (\s(?P<area_id>\S+))
@@ -126,6 +258,7 @@ class Ospfv3Template(NetworkTemplate):
             ),
             "setval": "area {{ area_id }} stub"
             "{{ (' no-summary') if stub.no_summary is defined and stub.no_summary else '' }}",
+            "result_fn": _result_stub,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -144,7 +277,7 @@ class Ospfv3Template(NetworkTemplate):
         },
         {
             "name": "distance",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+distance
                 (\sexternal\s(?P<external>\S+))?
@@ -155,6 +288,7 @@ class Ospfv3Template(NetworkTemplate):
             "{{ ' external ' + distance.external|string if distance.external is defined }}"
             "{{ ' inter-area ' + distance.inter_area|string if distance.inter_area is defined }}"
             "{{ ' intra-area ' + distance.intra_area|string if distance.intra_area is defined }}",
+            "result_fn": _result_distance,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -169,7 +303,7 @@ class Ospfv3Template(NetworkTemplate):
         },
         {
             "name": "network",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+network
                 \s(?P<address>\S+)
@@ -178,6 +312,7 @@ class Ospfv3Template(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "network {{ address }} area {{ area }}",
+            "result_fn": _result_network,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -193,7 +328,7 @@ class Ospfv3Template(NetworkTemplate):
         },
         {
             "name": "originate_default",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+originate-default
                 (\s(?P<always>always))?
@@ -207,6 +342,7 @@ class Ospfv3Template(NetworkTemplate):
             " metric {{ originate_default.metric }}"
             " metric-type {{ originate_default.metric_type }}"
             " route-map {{ originate_default.route_map }}",
+            "result_fn": _result_originate_default,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -222,7 +358,7 @@ class Ospfv3Template(NetworkTemplate):
         },
         {
             "name": "passive_interfaces",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+passive-interface
                 (\s(?P<interface>\S+))?
@@ -230,6 +366,7 @@ class Ospfv3Template(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "passive-interface {{ interface }}",
+            "result_fn": _result_passive_interfaces,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -242,7 +379,7 @@ class Ospfv3Template(NetworkTemplate):
         },
         {
             "name": "router_id",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+router-id
                 (\s(?P<router_id>\S+))?
@@ -250,6 +387,7 @@ class Ospfv3Template(NetworkTemplate):
                 re.VERBOSE
             ),
             "setval": "router-id {{ router_id }}",
+            "result_fn": _result_router_id,
             "result": {
                 "processes": {
                     "{{ pid }}": {
@@ -260,7 +398,7 @@ class Ospfv3Template(NetworkTemplate):
         },
         {
             "name": "timers",
-            "getval": re.compile(
+            "getval": LazyPattern(
                 r"""
                 \s+timers
                 (\sdelay\s(?P<delay>\S+))?
@@ -271,6 +409,7 @@ class Ospfv3Template(NetworkTemplate):
             "setval": "timers"
             "{{ ' delay ' + timers.delay|string if timers.delay is defined else '' }}"
             "{{ ' hold ' + timers.hold|string if timers.hold is defined else '' }}",
+            "result_fn": _result_timers,
             "result": {
                 "processes": {
                     "{{ pid }}": {
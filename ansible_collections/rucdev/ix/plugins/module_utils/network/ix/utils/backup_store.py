@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+"""
+The ix backup store file.
+It keeps config backups on disk addressed by the SHA-1 of their text, so
+a config backed up from many devices or on many runs is stored once.
+A backup is stored as the delta from the previous backup of the same
+device whenever that is smaller, and every object is gzip compressed.
+"""
+
+import difflib
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+# deltas followed at most to read a backup, a longer chain starts over
+# from a full copy
+MAX_DELTA_DEPTH = 30
+
+
+class BackupStore(object):
+    """Directory of config backups
+
+    ``objects/<sha1>.gz`` holds the text of a backup, and
+    ``objects/<sha1>.delta.gz`` a JSON delta which rebuilds it from the
+    backup ``base``: ``ops`` lists ranges ``[start, end]`` of the lines of
+    the base and the text inserted between them. ``refs/<name>`` lists the
+    backups of a device, one ``<date>@<time> <sha1>`` line per change.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def _object(self, sha1, delta=False):
+        suffix = ".delta.gz" if delta else ".gz"
+        return os.path.join(self.path, "objects", sha1 + suffix)
+
+    def _ref(self, name):
+        return os.path.join(self.path, "refs", name)
+
+    def object_path(self, sha1):
+        """Returns the file a backup is stored in, or None"""
+        for delta in (False, True):
+            path = self._object(sha1, delta)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def history(self, name):
+        """Returns the backups of a device
+
+        :param name: the name the backups were put under
+        :rtype: list
+        :returns: a ``(timestamp, sha1)`` tuple per change, oldest first
+        """
+        try:
+            with open(self._ref(name)) as fobj:
+                return [tuple(line.split()) for line in fobj if line.strip()]
+        except (IOError, OSError):
+            return []
+
+    def get(self, sha1):
+        """Returns the text of a backup
+
+        :param sha1: the SHA-1 put returned for it
+        :rtype: str
+        :raises KeyError: when the store does not hold the backup
+        :raises ValueError: when the text rebuilt does not hash to sha1, i.e.
+                            an object of its delta chain is corrupt
+        """
+        wanted = sha1
+        deltas = []
+        path = self._object(sha1)
+        while not os.path.exists(path):
+            try:
+                delta = self._read(self._object(sha1, delta=True))
+            except (IOError, OSError):
+                raise KeyError(sha1)
+            delta = json.loads(delta)
+            deltas.append(delta["ops"])
+            sha1 = delta["base"]
+            path = self._object(sha1)
+
+        text = self._read(path)
+        for ops in reversed(deltas):
+            base = text.split("\n")
+            lines = []
+            for op in ops:
+                if isinstance(op, list):
+                    lines.extend(base[op[0] : op[1]])
+                else:
+                    lines.extend(op.split("\n"))
+            text = "\n".join(lines)
+        if hashlib.sha1(text.encode("utf-8")).hexdigest() != wanted:
+            raise ValueError("backup %s is corrupt" % wanted)
+        return text
+
+    def put(self, name, text):
+        """Stores a backup of a device
+
+        The object is written to a temporary file first and renamed, so a
+        concurrent run never reads a partial object.
+
+        :param name: the name of the device, e.g. its inventory hostname
+        :param text: the config text
+        :rtype: tuple
+        :returns: ``(sha1, changed)``, where changed is False when the
+                  backup is the same as the previous one of the device
+        :raises OSError: when the backup cannot be written
+        """
+        sha1 = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        history = self.history(name)
+        if history and history[-1][1] == sha1:
+            return sha1, False
+
+        if self.object_path(sha1) is None:
+            data = gzip.compress(text.encode("utf-8"), mtime=0)
+            delta = None
+            if history:
+                delta = self._delta(history[-1][1], text)
+            if delta is not None and len(delta) < len(data):
+                self._write(self._object(sha1, delta=True), delta)
+            else:
+                self._write(self._object(sha1), data)
+
+        tstamp = time.strftime("%Y-%m-%d@%H:%M:%S", time.localtime(time.time()))
+        ref = self._ref(name)
+        if not os.path.isdir(os.path.dirname(ref)):
+            os.makedirs(os.path.dirname(ref))
+        with open(ref, "a") as fobj:
+            fobj.write("%s %s\n" % (tstamp, sha1))
+        return sha1, True
+
+    def _delta(self, base_sha1, text):
+        """Returns the compressed delta from a backup, or None"""
+        depth = 0
+        path = self._object(base_sha1, delta=True)
+        if os.path.exists(path):
+            depth = json.loads(self._read(path))["depth"]
+            if depth >= MAX_DELTA_DEPTH:
+                return None
+        try:
+            base = self.get(base_sha1).split("\n")
+        except (KeyError, ValueError):
+            return None
+
+        lines = text.split("\n")
+        matcher = difflib.SequenceMatcher(None, base, lines)
+        ops = []
+        for tag, start, end, new_start, new_end in matcher.get_opcodes():
+            if tag == "equal":
+                ops.append([start, end])
+            elif new_start != new_end:
+                ops.append("\n".join(lines[new_start:new_end]))
+        delta = {"base": base_sha1, "depth": depth + 1, "ops": ops}
+        return gzip.compress(json.dumps(delta).encode("utf-8"), mtime=0)
+
+    def _read(self, path):
+        with gzip.open(path) as fobj:
+            return fobj.read().decode("utf-8")
+
+    def _write(self, path, data):
+        dirname = os.path.dirname(path)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        fd, tmp = tempfile.mkstemp(dir=dirname, prefix=".")
+        try:
+            with os.fdopen(fd, "wb") as fobj:
+                fobj.write(data)
+            os.rename(tmp, path)
+        except Exception:
+            os.unlink(tmp)
+            raise
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+"""
+The ix config tree file.
+IxNetworkConfig parses and diffs a configuration exactly like the
+netcommon NetworkConfig, but its diffs run in linear time.
+
+NetworkConfig finds a line in a block or a config by comparing it with
+every line there, which makes match line and replace block quadratic in
+the size of the config. Here every line caches its full path and the
+diffs look the paths up in sets.
+
+ConfigTrees keeps the trees of a module run, so that each distinct
+config text is only parsed and hashed once.
+"""
+
+import re
+
+from ansible.module_utils._text import to_native
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
+    ConfigLine,
+    NetworkConfig,
+    ignore_line,
+)
+
+_TOPLEVEL_RE = re.compile(r"\S")
+_CHILDLINE_RE = re.compile(r"^\s*(.+)$")
+_ENTRY_RE = re.compile(r"([{};])")
+
+
+class IxConfigLine(ConfigLine):
+    """A ConfigLine which computes its path only once
+
+    The parents of a line are set when it is parsed and never change
+    afterwards, so the path, which equality is based on, is cached.
+    """
+
+    def __init__(self, raw):
+        super(IxConfigLine, self).__init__(raw)
+        self._line = None
+
+    @property
+    def line(self):
+        line = self._line
+        if line is None:
+            line = self._line = " ".join(
+                [parent.text for parent in self._parents] + [self.text]
+            )
+        return line
+
+    def __eq__(self, other):
+        return self.line == other.line
+
+    def __hash__(self):
+        return hash(self.line)
+
+
+class IxNetworkConfig(NetworkConfig):
+    """NetworkConfig with linear time diffs"""
+
+    _sha1 = None
+
+    @property
+    def sha1(self):
+        sha1 = self._sha1
+        if sha1 is None:
+            sha1 = self._sha1 = super(IxNetworkConfig, self).sha1
+        return sha1
+
+    def load(self, s):
+        self._sha1 = None
+        super(IxNetworkConfig, self).load(s)
+
+    def add(self, lines, parents=None):
+        self._sha1 = None
+        super(IxNetworkConfig, self).add(lines, parents=parents)
+
+    def parse(self, lines):
+        ancestors = list()
+        config = list()
+
+        indents = [0]
+
+        for line in to_native(lines, errors="surrogate_or_strict").split("\n"):
+            text = _ENTRY_RE.sub("", line).strip()
+
+            if not text or ignore_line(text, self.comment_tokens):
+                continue
+
+            cfg = IxConfigLine(line)
+
+            # handle top level commands
+            if _TOPLEVEL_RE.match(line):
+                ancestors = [cfg]
+                indents = [0]
+
+            # handle sub level commands
+            else:
+                line_indent = _CHILDLINE_RE.match(line).start(1)
+
+                if line_indent < indents[-1]:
+                    while indents[-1] > line_indent:
+                        indents.pop()
+
+                if line_indent > indents[-1]:
+                    indents.append(line_indent)
+
+                curlevel = len(indents) - 1
+                parent_level = curlevel - 1
+
+                cfg._parents = ancestors[:curlevel]
+
+                if curlevel > len(ancestors):
+                    config.append(cfg)
+                    continue
+
+                del ancestors[curlevel:]
+
+                ancestors.append(cfg)
+                ancestors[parent_level].add_child(cfg)
+
+            config.append(cfg)
+
+        return config
+
+    def _expand_block(self, configobj, S=None):
+        if S is None:
+            S = list()
+        self._expand(configobj, S, set(item.line for item in S))
+        return S
+
+    def _expand(self, configobj, block, seen):
+        block.append(configobj)
+        seen.add(configobj.line)
+        for child in configobj._children:
+            if child.line not in seen:
+                self._expand(child, block, seen)
+
+    def _diff_line(self, other):
+        lines = set(item.line for item in other)
+        return [item for item in self.items if item.line not in lines]
+
+    def difference(self, other, match="line", path=None, replace=None):
+        """Perform a config diff against the another network config
+
+        Gives the same lines as NetworkConfig.difference, see there.
+        """
+        if path and match != "line":
+            try:
+                other = other.get_block(path)
+            except ValueError:
+                other = list()
+        else:
+            other = other.items
+
+        # generate a list of ConfigLines that aren't in other
+        meth = getattr(self, "_diff_%s" % match)
+        updates = meth(other)
+
+        if replace == "block":
+            parents = list()
+            seen = set()
+            for item in updates:
+                if not item.has_parents:
+                    parents.append(item)
+                    seen.add(item.line)
+                else:
+                    for p in item._parents:
+                        if p.line not in seen:
+                            parents.append(p)
+                            seen.add(p.line)
+
+            updates = list()
+            for item in parents:
+                updates.extend(self._expand_block(item))
+
+        visited = set()
+        expanded = list()
+
+        for curr_elem in updates:
+            add_parents = False
+            if expanded:
+                last_elem = expanded[-1]
+                # If parent of current line not added in expanded list flag it
+                # to be added later on
+                if (
+                    curr_elem._parents
+                    and last_elem._parents
+                    and curr_elem._parents[0].text != last_elem._parents[0].text
+                ):
+                    add_parents = True
+                # check if parent of current line is already added, if added don't
+                # add again
+                if (
+                    last_elem._children
+                    and last_elem._children[0].text != curr_elem.text
+                ):
+                    add_parents = True
+            for p in curr_elem._parents:
+                if p.line not in visited or add_parents:
+                    visited.add(p.line)
+                    expanded.append(p)
+            expanded.append(curr_elem)
+            visited.add(curr_elem.line)
+
+        return expanded
+
+    def merge(self, other):
+        """Returns the text of this config with the lines of other it lacks
+
+        This is what a device holds once it accepted the lines of other,
+        as long as they only add to this config. A line which does not open
+        a block is assumed to replace a line of its block when it negates
+        something, when the block has its ``no`` form, or when all its words
+        but the last start a line of the block, e.g. ``ip ospf cost 30``
+        replaces ``ip ospf cost 10``.
+
+        A missing line is inserted at the end of the block of its closest
+        ancestor found in this config, or at the end of the config, and
+        indented like the lines of this config.
+
+        :param other: the IxNetworkConfig to merge, e.g. the candidate
+        :rtype: str
+        :returns: the merged text, or None when a line of other may replace
+                  a line of this config
+        """
+        existing = set()
+        # per block, the lines and the leading words of its lines
+        blocks = {}
+        unit = None
+        for item in self.items:
+            path = _path(item)
+            existing.add(path)
+            texts, heads = blocks.setdefault(path[:-1], (set(), set()))
+            texts.add(item.text)
+            words = item.text.split()
+            for idx in range(1, len(words)):
+                heads.add(" ".join(words[:idx]))
+            if unit is None and item._parents:
+                unit = _indent(item.raw) // len(item._parents)
+
+        seen = set(existing)
+        inserts = {}
+        for item in other.items:
+            path = _path(item)
+            if path in seen:
+                continue
+            seen.add(path)
+            if item.text.startswith("no "):
+                return None
+            # a line opening a block names it, it does not replace another
+            if path[:-1] in blocks and not item._children:
+                texts, heads = blocks[path[:-1]]
+                head = item.text.rsplit(None, 1)[0] if " " in item.text else None
+                if "no " + item.text in texts or head in heads:
+                    return None
+
+            anchor = path[:-1]
+            while anchor and anchor not in existing:
+                anchor = anchor[:-1]
+            raw = item.raw
+            if unit is not None:
+                raw = " " * (unit * (len(path) - 1)) + item.text
+            inserts.setdefault(anchor, []).append(raw)
+
+        merged = []
+        opened = []
+        for item in self.items:
+            path = _path(item)
+            # close the blocks this line is not part of, innermost first
+            while opened and opened[-1] != path[: len(opened[-1])]:
+                merged.extend(inserts.pop(opened.pop(), ()))
+            merged.append(item.raw)
+            opened.append(path)
+        while opened:
+            merged.extend(inserts.pop(opened.pop(), ()))
+        merged.extend(inserts.pop((), ()))
+        return "\n".join(merged)
+
+
+def _indent(raw):
+    return len(raw) - len(raw.lstrip())
+
+
+def _path(item):
+    return tuple(parent.text for parent in item._parents) + (item.text,)
+
+
+class ConfigTrees(object):
+    """The config trees of a module run, keyed by their text
+
+    :param ignore_lines: the diff_ignore_lines every tree is parsed with
+    """
+
+    def __init__(self, ignore_lines=None):
+        self._ignore_lines = ignore_lines
+        self._trees = {}
+
+    def get(self, text):
+        """Returns the tree of a config text, parsing it on the first call
+
+        :param text: the config text
+        :rtype: IxNetworkConfig
+        """
+        tree = self._trees.get(text)
+        if tree is None:
+            tree = IxNetworkConfig(
+                indent=1, contents=text, ignore_lines=self._ignore_lines
+            )
+            self._trees[text] = tree
+        return tree
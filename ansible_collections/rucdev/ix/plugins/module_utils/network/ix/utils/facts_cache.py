@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+"""
+The ix facts cache file.
+It keeps the parsed facts of each resource on disk, keyed by a hash of
+the config sections the resource is parsed from, so an unchanged
+resource is not parsed again on the next run.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+
+# bump whenever the layout of the cache entries changes
+FACTS_CACHE_VERSION = "2"
+
+# the modules whose sources the facts of a resource depend on
+COLLECTION_PACKAGE = "ansible_collections.rucdev.ix.plugins.module_utils"
+
+# source digests of the facts classes, computed once per process
+_SOURCE_DIGESTS = {}
+
+
+def source_digest(facts_cls):
+    """Returns the SHA-1 of the sources a facts class parses with
+
+    The sources are the module of the facts class and every collection
+    module it reaches through its imports, e.g. its rm_template, argspec
+    and the rm_base engine, so facts cached by another version of the
+    collection are never returned.
+
+    :param facts_cls: the facts class of a resource
+    :rtype: str
+    :returns: the hex digest, or None when a source cannot be read
+    """
+    name = facts_cls.__module__
+    if name in _SOURCE_DIGESTS:
+        return _SOURCE_DIGESTS[name]
+
+    seen = set()
+    pending = [name]
+    while pending:
+        module = sys.modules.get(pending.pop())
+        if module is None or module.__name__ in seen:
+            continue
+        seen.add(module.__name__)
+        for value in vars(module).values():
+            depends = getattr(value, "__module__", None) or getattr(
+                value, "__name__", None
+            )
+            if isinstance(depends, str) and depends.startswith(COLLECTION_PACKAGE):
+                pending.append(depends)
+
+    sha1 = hashlib.sha1()
+    try:
+        for depends in sorted(seen):
+            sha1.update(depends.encode("utf-8") + b"\0")
+            sha1.update(inspect.getsource(sys.modules[depends]).encode("utf-8"))
+    except (IOError, OSError, TypeError):
+        digest = None
+    else:
+        digest = sha1.hexdigest()
+    _SOURCE_DIGESTS[name] = digest
+    return digest
+
+
+class FactsCache(object):
+    """Directory of parsed resource facts
+
+    Each entry is stored in ``<resource>-<sha1>.json``, where the SHA-1
+    covers the config sections the resource consumed and the sources it is
+    parsed with.  Entries only depend on the config text and the collection
+    code, so one directory can be shared by many devices.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def key(self, sections, facts_cls):
+        """Returns the cache key of the facts of a resource
+
+        :param sections: the ConfigSections of the device config
+        :param facts_cls: the facts class of the resource
+        :rtype: str
+        :returns: the key, or None when the facts should not be cached
+        """
+        digest = source_digest(facts_cls)
+        if digest is None:
+            return None
+        return sections.digest(
+            (FACTS_CACHE_VERSION, digest) + tuple(facts_cls.config_sections)
+        )
+
+    def _filename(self, resource, key):
+        return os.path.join(self.path, "%s-%s.json" % (resource, key))
+
+    def get(self, resource, key):
+        """Returns the cached facts of a resource
+
+        :param resource: the resource name, e.g. ``interfaces``
+        :param key: the cache key of its config sections
+        :rtype: dict
+        :returns: ``{"facts": <facts>}``, or None when nothing is cached or
+                  the entry cannot be read
+        """
+        try:
+            with open(self._filename(resource, key)) as fobj:
+                entry = json.load(fobj)
+        except (IOError, OSError, ValueError):
+            return None
+        if not isinstance(entry, dict):
+            return None
+        return entry
+
+    def set(self, resource, key, entry):
+        """Stores the facts of a resource
+
+        The entry is written to a temporary file first and renamed, so a
+        concurrent run never reads a partial entry.
+
+        :param resource: the resource name, e.g. ``interfaces``
+        :param key: the cache key of its config sections
+        :param entry: ``{"facts": <facts>}``, or ``{}`` when the resource
+                      has no facts
+        :raises OSError: when the entry cannot be written
+        """
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        fd, tmp = tempfile.mkstemp(dir=self.path, prefix=".%s-" % resource)
+        try:
+            with os.fdopen(fd, "w") as fobj:
+                json.dump(entry, fobj)
+            os.rename(tmp, self._filename(resource, key))
+        except Exception:
+            os.unlink(tmp)
+            raise
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+"""
+The ix config sections file.
+It splits an IX running-config into its top level blocks in a single
+pass, so each resource parser only walks the blocks it is interested in.
+"""
+
+import hashlib
+
+from ansible.module_utils.connection import ConnectionError
+
+
+class ConfigSections(object):
+    """Index of the top level blocks of an IX configuration
+
+    A block starts with a line that is not indented and holds every
+    indented line that follows it.  Blocks are indexed by kind (the header
+    without its last word, e.g. ``interface``, ``ip router ospf`` or
+    ``ipv6 router ospf``) and by name (the last word of the header, e.g.
+    ``GigaEthernet0.0`` or ``1``).
+    """
+
+    def __init__(self, text=None):
+        self._sections = {}
+        if text:
+            self._parse(text)
+
+    def _parse(self, text):
+        block = None
+        for line in text.splitlines():
+            if not line or line.isspace():
+                continue
+            if line[0].isspace():
+                if block is not None:
+                    block.append(line)
+                continue
+            if line.startswith("!"):
+                block = None
+                continue
+
+            header = line.rstrip()
+            kind, sep, name = header.rpartition(" ")
+            if not sep:
+                kind, name = header, ""
+
+            blocks = self._sections.setdefault(kind, {})
+            block = blocks.get(name)
+            if block is None:
+                block = blocks[name] = [header]
+
+    def kinds(self):
+        """Returns the kinds of the blocks found in the configuration"""
+        return list(self._sections)
+
+    def blocks(self, kind):
+        """Returns the blocks of a kind
+
+        :param kind: the block kind, e.g. ``interface``
+        :rtype: dict
+        :returns: the block lines keyed by block name
+        """
+        return self._sections.get(kind, {})
+
+    def lines(self, kind, names=None):
+        """Returns the lines of the blocks of a kind
+
+        :param kind: the block kind, e.g. ``interface``
+        :param names: restrict the result to the blocks with these names
+        :rtype: list
+        :returns: the header and body lines of the matching blocks
+        """
+        blocks = self.blocks(kind)
+        if names is not None:
+            blocks = dict((name, blocks[name]) for name in names if name in blocks)
+
+        lines = []
+        for block in blocks.values():
+            lines.extend(block)
+        return lines
+
+    def digest(self, kinds):
+        """Returns the SHA-1 of the blocks of some kinds
+
+        :param kinds: the block kinds, e.g. ``("interface",)``
+        :rtype: str
+        :returns: the hex digest, which changes whenever one of the blocks
+                  is added, removed or edited
+        """
+        sha1 = hashlib.sha1()
+        for kind in kinds:
+            sha1.update(kind.encode("utf-8") + b"\0")
+            for line in self.lines(kind):
+                sha1.update(line.encode("utf-8") + b"\n")
+            sha1.update(b"\0")
+        return sha1.hexdigest()
+
+
+def get_config_sections(data):
+    """Returns the sections index for previously collected config
+
+    :param data: the configuration text or an existing ConfigSections
+    :rtype: ConfigSections
+    :returns: the sections index
+    """
+    if isinstance(data, ConfigSections):
+        return data
+    return ConfigSections(data)
+
+
+def get_named_interfaces(module):
+    """Returns the interfaces a resource module run is limited to
+
+    merged and replaced only touch the interfaces named in config, so the
+    blocks of the other interfaces do not need to be fetched or parsed.
+
+    :param module: the AnsibleModule of the resource module
+    :rtype: list
+    :returns: the interface names, or None when every interface is needed
+    """
+    params = module.params
+    if params.get("state") not in ("merged", "replaced"):
+        return None
+    config = params.get("config")
+    if not config or not all(entry.get("name") for entry in config):
+        return None
+
+    names = []
+    for entry in config:
+        if entry["name"] not in names:
+            names.append(entry["name"])
+    return names
+
+
+def get_interfaces_config(connection, module):
+    """Fetches the interface blocks a resource module run needs
+
+    :param connection: the device connection
+    :param module: the AnsibleModule of the resource module
+    :rtype: str
+    :returns: the blocks of the interfaces named in config when
+              get_named_interfaces limits the run, else all of them
+    """
+    names = get_named_interfaces(module)
+    if names:
+        blocks = []
+        try:
+            for name in names:
+                blocks.append(
+                    connection.configure_get("show running-config interface %s" % name)
+                )
+        except ConnectionError:
+            # e.g. an interface the device does not know yet
+            pass
+        else:
+            return "\n".join(blocks)
+    return connection.configure_get("show running-config interface")
@@ -11,58 +11,234 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import re
 import socket
 
 from itertools import count, groupby
 
-from ansible.module_utils.common.network import is_masklen, to_netmask
+from ansible.module_utils.common.network import is_masklen
 from ansible.module_utils.six import iteritems
 
 
-def validate_ipv4(value, module):
-    if value:
+_IPV4_RE = re.compile(r"^([0-9]{1,3})\.([0-9]{1,3})\.([0-9]{1,3})\.([0-9]{1,3})$")
+
+# the addresses parsed so far, keyed by their text, to a (address, prefix
+# length) tuple of integers or to the message of the error they raised
+_IPV4_ADDRESSES = {}
+_IPV6_ADDRESSES = {}
+# the "a.b.c.d m.m.m.m" form of the IPv4 addresses expanded so far
+_IPV4_EXPANDED = {}
+# the canonical text of the addresses normalized so far
+_IP_NORMALIZED = {}
+
+
+def _ipv4_text(number):
+    return "%d.%d.%d.%d" % (
+        number >> 24,
+        number >> 16 & 0xFF,
+        number >> 8 & 0xFF,
+        number & 0xFF,
+    )
+
+
+# the netmask of each prefix length, and the other way around
+_NETMASKS = tuple(
+    _ipv4_text(0xFFFFFFFF << (32 - length) & 0xFFFFFFFF) for length in range(33)
+)
+_MASKLENS = dict((mask, length) for length, mask in enumerate(_NETMASKS))
+
+
+def _ipv4_number(text):
+    match = _IPV4_RE.match(text)
+    if not match:
+        return None
+    number = 0
+    for octet in match.groups():
+        if int(octet) > 255:
+            return None
+        number = number << 8 | int(octet)
+    return number
+
+
+def _parse_ipv4(value):
+    value = value.strip()
+    address, sep, mask = value.partition(" ")
+    if sep:
+        length = _MASKLENS.get(mask.strip())
+        if length is None:
+            raise ValueError(
+                "invalid value for mask: {0}, mask should be a netmask".format(
+                    mask.strip()
+                ),
+            )
+    else:
         address = value.split("/")
         if len(address) != 2:
-            module.fail_json(
-                msg="address format is <ipv4 address>/<mask>, got invalid format {0}".format(
+            raise ValueError(
+                "address format is <ipv4 address>/<mask>, got invalid format {0}".format(
                     value
                 ),
             )
-
         if not is_masklen(address[1]):
-            module.fail_json(
-                msg="invalid value for mask: {0}, mask should be in range 0-32".format(
+            raise ValueError(
+                "invalid value for mask: {0}, mask should be in range 0-32".format(
                     address[1]
                 ),
             )
+        address, length = address[0], int(address[1])
 
+    number = _ipv4_number(address)
+    if number is None:
+        raise ValueError("invalid IPv4 address: {0}".format(address))
+    return number, length
 
-def validate_ipv6(value, module):
+
+def _parse_ipv6(value):
+    address = value.split("/")
+    if len(address) != 2:
+        raise ValueError(
+            "address format is <ipv6 address>/<mask>, got invalid format {0}".format(
+                value
+            ),
+        )
+    if not address[1].isdigit() or not 0 <= int(address[1]) <= 128:
+        raise ValueError(
+            "invalid value for mask: {0}, mask should be in range 0-128".format(
+                address[1],
+            ),
+        )
+    try:
+        packed = socket.inet_pton(socket.AF_INET6, address[0])
+    except (OSError, ValueError):
+        raise ValueError("invalid IPv6 address: {0}".format(address[0]))
+    return int.from_bytes(packed, "big"), int(address[1])
+
+
+def _parse_cached(cache, parse, value):
+    parsed = cache.get(value)
+    if parsed is None:
+        try:
+            parsed = parse(value)
+        except ValueError as exc:
+            parsed = str(exc)
+        cache[value] = parsed
+    if not isinstance(parsed, tuple):
+        raise ValueError(parsed)
+    return parsed
+
+
+def parse_ipv4(value):
+    """Parses an IPv4 interface address, once per process
+
+    :param value: ``a.b.c.d/len`` or ``a.b.c.d m.m.m.m``
+    :rtype: tuple
+    :returns: the (address, prefix length) integers
+    :raises ValueError: with the message to report when value is invalid
+    """
+    return _parse_cached(_IPV4_ADDRESSES, _parse_ipv4, value)
+
+
+def parse_ipv6(value):
+    """Parses an IPv6 interface address, once per process
+
+    :param value: ``address/len``
+    :rtype: tuple
+    :returns: the (address, prefix length) integers
+    :raises ValueError: with the message to report when value is invalid
+    """
+    return _parse_cached(_IPV6_ADDRESSES, _parse_ipv6, value)
+
+
+def expand_ipv4(value):
+    """Returns the ``a.b.c.d m.m.m.m`` form IX configures an IPv4 address in
+
+    :param value: ``a.b.c.d/len`` or ``a.b.c.d m.m.m.m``
+    :rtype: str
+    :raises ValueError: with the message to report when value is invalid
+    """
+    expanded = _IPV4_EXPANDED.get(value)
+    if expanded is None:
+        number, length = parse_ipv4(value)
+        expanded = "{0} {1}".format(_ipv4_text(number), _NETMASKS[length])
+        _IPV4_EXPANDED[value] = expanded
+    return expanded
+
+
+def _normalize_ip(value):
+    text = value.strip()
+    host = "/" not in text and " " not in text
+    try:
+        if ":" in text:
+            number, length = parse_ipv6(text + "/128" if host else text)
+            address = socket.inet_ntop(socket.AF_INET6, number.to_bytes(16, "big"))
+        else:
+            number, length = parse_ipv4(text + "/32" if host else text)
+            address = _ipv4_text(number)
+    except ValueError:
+        return value
+    return address if host else "{0}/{1}".format(address, length)
+
+
+def normalize_ip(value):
+    """Returns the canonical text of an address, once per process
+
+    The facts and the diff engines key the addresses by this text, so that
+    ``2001:DB8:0::1/64`` and ``2001:db8::1/64`` are the same address.
+
+    :param value: an IPv4 or IPv6 address, with or without a prefix length,
+                  or an IPv4 address and its netmask
+    :rtype: str
+    :returns: ``a.b.c.d/len`` or the compressed lowercase IPv6 form, without
+              the prefix length when value has none, or value itself when
+              it is not an address so that its validation reports it
+    """
+    normalized = _IP_NORMALIZED.get(value)
+    if normalized is None:
+        normalized = _IP_NORMALIZED[value] = _normalize_ip(value)
+    return normalized
+
+
+def validate_ipv4(value, module):
     if value:
-        address = value.split("/")
-        if len(address) != 2:
+        if len(value.split("/")) != 2:
             module.fail_json(
-                msg="address format is <ipv6 address>/<mask>, got invalid format {0}".format(
+                msg="address format is <ipv4 address>/<mask>, got invalid format {0}".format(
                     value
                 ),
             )
-        else:
-            if not 0 <= int(address[1]) <= 128:
-                module.fail_json(
-                    msg="invalid value for mask: {0}, mask should be in range 0-128".format(
-                        address[1],
-                    ),
-                )
+        try:
+            parse_ipv4(value)
+        except ValueError as exc:
+            module.fail_json(msg=str(exc))
+
+
+def validate_ipv6(value, module):
+    if value:
+        try:
+            parse_ipv6(value)
+        except ValueError as exc:
+            module.fail_json(msg=str(exc))
 
 
 def validate_n_expand_ipv4(module, want):
     # Check if input IPV4 is valid IP and expand IPV4 with its subnet mask
-    ip_addr_want = want.get("address")
-    if len(ip_addr_want.split(" ")) > 1:
-        return ip_addr_want
-    validate_ipv4(ip_addr_want, module)
-    ip = ip_addr_want.split("/")
-    if len(ip) == 2:
-        ip_addr_want = "{0} {1}".format(ip[0], to_netmask(ip[1]))
-
-    return ip_addr_want
+    try:
+        return expand_ipv4(want.get("address"))
+    except ValueError as exc:
+        module.fail_json(msg=str(exc))
+
+
+_DIGITS_RE = re.compile(r"(\d+)")
+
+
+def natural_key(value):
+    """Returns a sort key ordering the numbers in a name by value
+
+    e.g. ``Tunnel9.0`` sorts before ``Tunnel10.0``
+
+    :param value: an interface name, a process id...
+    :rtype: tuple
+    """
+    parts = _DIGITS_RE.split(str(value))
+    parts[1::2] = [int(part) for part in parts[1::2]]
+    return tuple(parts)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+"""
+The ix validation file.
+The facts parsed by the ix rm_templates always follow the layout of the
+resource argspec, so they do not need the full AnsibleModule validation
+netcommon runs over them. Only the type conversion and the defaults of
+the argspec are applied, through converters compiled once per argspec.
+
+normalize_config also drops the empty values and sorts the entries in
+the same pass, instead of running remove_empties and sorted over the
+whole tree around the validation.
+
+Setting the ANSIBLE_IX_STRICT_FACTS_VALIDATION environment variable
+brings the full validation back, e.g. to compare both on a new template.
+"""
+
+import os
+
+from ansible.module_utils.common.parameters import DEFAULT_TYPE_VALIDATORS
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    remove_empties,
+    validate_config as _validate_config,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.utils import (
+    natural_key,
+)
+
+STRICT_VALIDATION_ENV = "ANSIBLE_IX_STRICT_FACTS_VALIDATION"
+
+# compiled argspecs, keyed by the id of the argspec they were compiled from
+_CONVERTERS = {}
+
+# the values remove_empties drops
+_EMPTY = (None, [], {}, (), "")
+
+
+def strict_validation():
+    """Returns whether the full AnsibleModule validation is requested"""
+    value = os.environ.get(STRICT_VALIDATION_ENV, "")
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+def _keep(value):
+    return value
+
+
+def _type_checker(wanted):
+    if callable(wanted):
+        return wanted
+    # a type AnsibleModule does not know only fails once a value is set,
+    # the parsed value is kept as is
+    return DEFAULT_TYPE_VALIDATORS.get(wanted or "str", _keep)
+
+
+def compile_spec(spec):
+    """Returns the converters of an argspec
+
+    :param spec: the argspec, e.g. ``L3_interfacesArgs.argument_spec``
+    :rtype: list
+    :returns: a (name, type checker, elements checker, default, nested
+              converters) tuple per option
+    """
+    compiled = _CONVERTERS.get(id(spec))
+    if compiled is not None and compiled[0] is spec:
+        return compiled[1]
+
+    converters = []
+    for name, option in spec.items():
+        wanted = option.get("type")
+        elements = option.get("elements") if wanted == "list" else None
+        nested = None
+        if option.get("options") is not None and "dict" in (wanted, elements):
+            nested = compile_spec(option["options"])
+        converters.append(
+            (
+                name,
+                _type_checker(wanted),
+                _type_checker(elements) if elements else None,
+                option.get("default"),
+                nested,
+            )
+        )
+    _CONVERTERS[id(spec)] = (spec, converters)
+    return converters
+
+
+def coerce_config(converters, data, prune=False):
+    """Applies compiled converters to a parsed config
+
+    Values are converted with the same type checkers AnsibleModule uses
+    and missing options get their argspec default. Unlike AnsibleModule,
+    options that are neither set nor defaulted are left out instead of
+    being set to None, which remove_empties drops anyway.
+
+    :param converters: the converters returned by compile_spec
+    :param data: the parsed config
+    :param prune: also drop the values remove_empties would drop
+    :rtype: dict
+    :returns: a converted copy of the config
+    """
+    result = dict(data)
+    for name, check, check_element, default, nested in converters:
+        value = result.get(name)
+        if value is None:
+            if default is None or name in result:
+                if prune:
+                    result.pop(name, None)
+                continue
+            value = default
+
+        value = check(value)
+        if check_element is not None:
+            value = [check_element(element) for element in value]
+        if nested is not None:
+            if isinstance(value, dict):
+                value = coerce_config(nested, value, prune)
+            else:
+                value = [
+                    (
+                        coerce_config(nested, element, prune)
+                        if isinstance(element, dict)
+                        else element
+                    )
+                    for element in value
+                ]
+        if prune and value in _EMPTY:
+            del result[name]
+        else:
+            result[name] = value
+    return result
+
+
+def validate_config(spec, data):
+    """Validates facts built by the ix rm_templates
+
+    :param spec: the resource argspec
+    :param data: the parsed facts, e.g. ``{"config": [...]}``
+    :rtype: dict
+    :returns: the converted facts
+    """
+    if strict_validation():
+        return _validate_config(spec, data)
+    return coerce_config(compile_spec(spec), data)
+
+
+def normalize_config(spec, config, key=None):
+    """Validates the parsed config of a resource and drops its empty values
+
+    :param spec: the resource argspec
+    :param config: the parsed config, the value of the ``config`` option
+    :param key: when config is a list, the option its entries are sorted
+                by, in natural order
+    :returns: the normalized config, or None when it is empty
+    """
+    data = {"config": config}
+    if strict_validation():
+        data = remove_empties(_validate_config(spec, data))
+    else:
+        data = coerce_config(compile_spec(spec), data, prune=True)
+
+    config = data.get("config")
+    if key and config:
+        config = sorted(config, key=lambda entry: natural_key(entry[key]))
+    return config
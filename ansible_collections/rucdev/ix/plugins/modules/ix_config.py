@@ -91,12 +91,34 @@ options:
         If the replace argument is set to I(line) then the modified lines are pushed
         to the device in configuration mode.  If the replace argument is set to I(block)
         then the entire command block is pushed to the device in configuration mode
-        if any line is not correct.
+        if any line is not correct.  If the replace argument is set to I(config) then
+        the configuration given in I(src) is transferred to the device as a file and
+        replaces the running-config in one operation, when it differs from it.
+        The running-config is read back afterwards and the task fails when it still
+        differs from I(src).  I(before) and I(after) are not used in that case.
     default: line
     choices:
     - line
     - block
+    - config
+    type: str
+  replace_path:
+    description:
+    - The path on the device the configuration is transferred to when I(replace) is
+        set to I(config), as given to the file transfer and to the C(replace_command)
+        of the cliconf plugin.
     type: str
+    default: ansible_candidate.cfg
+  file_transfer:
+    description:
+    - The protocol the configuration is transferred with when I(replace) is set to
+        I(config).  The C(paramiko) library, and the C(scp) library for I(scp), must be
+        installed on the controller.
+    type: str
+    default: sftp
+    choices:
+    - sftp
+    - scp
   running_config:
     description:
     - The module, by default, will connect to the remote device and retrieve the current
@@ -125,8 +147,9 @@ options:
         always be copied to the startup-config and the I(modified) flag will always
         be set to True.  If the argument is set to I(modified), then the running-config
         will only be copied to the startup-config if it has changed since the last save
-        to startup-config.  If the argument is set to I(never), the running-config will
-        never be copied to the startup-config.  If the argument is set to I(changed),
+        to startup-config, the startup-config is not read again while the running-config
+        is the one saved last through the same connection.  If the argument is set to
+        I(never), the running-config will never be copied to the startup-config.  If the argument is set to I(changed),
         then the running-config will only be copied to the startup-config if the task
         has made a change. I(changed) was added in Ansible 2.5.
     default: never
@@ -157,6 +180,8 @@ options:
       - When this option is configured as I(running), the module will return the before
         and after diff of the running-config with respect to any changes made to the
         device configuration.
+      - The running-config after the change is not read from the device again when
+        the applied commands only added lines to it.
     type: str
     choices:
       - running
@@ -203,6 +228,22 @@ options:
             in the current working directory and backup configuration will be copied
             in C(filename) within I(backup) directory.
         type: path
+      store:
+        description:
+          - The directory of a content-addressed backup store to put the backup in,
+            instead of writing a backup file. A relative path is relative to the
+            playbook root directory or role root directory.
+          - Each distinct configuration is stored once, gzip compressed, as
+            C(objects/<sha1>.gz), or as C(objects/<sha1>.delta.gz) when the delta
+            from the previous backup of the same device is smaller.
+          - C(refs/<filename>) lists the backups of the device, one line with the
+            date, time and SHA-1 of the backup per change. C(filename) defaults to
+            the inventory hostname, and C(dir_path) is ignored.
+          - The module returns the SHA-1 of the backup and the path of the store
+            instead of the configuration itself. An object may hold a delta rather
+            than the configuration, the text of a backup is rebuilt with
+            C(BackupStore(store).get(sha1)) from the C(backup_store) module utils.
+        type: path
     type: dict
 """
 
@@ -217,12 +258,41 @@ EXAMPLES = """
     parents:
       - interface GigabitEthernet0.0
 
+- name: Replace the whole configuration, transferred over SFTP
+  rucdev.ix.ix_config:
+    src: ix.cfg
+    replace: config
+
+- name: Back up the running-config to a store shared by all devices
+  rucdev.ix.ix_config:
+    backup: true
+    backup_options:
+      store: backup_store
+
 """
 
 RETURN = """
-
+backup_path:
+  description: The full path to the backup file
+  returned: when backup is yes and backup_options.store is not given
+  type: str
+backup_sha1:
+  description:
+    - The SHA-1 of the backup put in the backup store.
+    - The text of the backup is rebuilt with C(BackupStore(backup_store).get(backup_sha1)),
+      since the backup may be stored as a delta from another one.
+  returned: when backup is yes and backup_options.store is given
+  type: str
+  sample: 0b3b2a0f9f5c7a9ac3d0e6d2bd3e1a7a4b7c2f11
+backup_store:
+  description: The full path to the backup store the backup was put in
+  returned: when backup is yes and backup_options.store is given
+  type: str
 """
 
+import os
+import tempfile
+
 from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import ConnectionError
@@ -235,6 +305,12 @@ from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.ix import (
     get_config,
     get_connection,
 )
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.backup_store import (
+    BackupStore,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.config_tree import (
+    ConfigTrees,
+)
 
 
 def get_candidate_config(module: AnsibleModule):
@@ -259,6 +335,61 @@ def get_running_config(module: AnsibleModule, current_config=None, flags=None):
     return running
 
 
+def get_changed_config(module: AnsibleModule, trees, current, candidate, commands):
+    """Returns the running-config once the commands were applied
+
+    When the device accepted commands which only add lines, the result is
+    the config before the change merged with the candidate, otherwise it
+    is read from the device again.
+    """
+    if current is not None:
+        if not commands:
+            return current
+        if not (
+            module.params["before"]
+            or module.params["after"]
+            or module.params["replace"] == "config"
+        ):
+            changed = trees.get(current).merge(trees.get(candidate))
+            if changed is not None:
+                return changed
+    output = run_commands(module, "show running-config", configure=True)
+    return output[0]
+
+
+def backup_config(module: AnsibleModule, result, contents):
+    backup_options = module.params["backup_options"] or {}
+    if not backup_options.get("store"):
+        # the action plugin writes the backup file
+        result["__backup__"] = contents
+        return
+
+    store = BackupStore(backup_options["store"])
+    try:
+        sha1 = store.put(backup_options["filename"], contents)[0]
+    except (IOError, OSError) as exc:
+        module.fail_json(msg="unable to store the backup: %s" % to_text(exc))
+    result["backup_sha1"] = sha1
+    result["backup_store"] = store.path
+
+
+def replace_config(module: AnsibleModule, connection, candidate):
+    """Transfers the candidate to the device and replaces the running-config"""
+    path = module.params["replace_path"]
+    fd, source = tempfile.mkstemp(prefix="ix_config-")
+    try:
+        with os.fdopen(fd, "w") as fobj:
+            fobj.write(candidate.rstrip("\n") + "\n")
+        connection.copy_file(
+            source=source, destination=path, proto=module.params["file_transfer"]
+        )
+        return connection.edit_config(candidate=None, replace=path)
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
+    finally:
+        os.unlink(source)
+
+
 def save_config(module: AnsibleModule, result):
     result["changed"] = True
     if not module.check_mode:
@@ -273,7 +404,9 @@ def main():
     """
     main entry point for module execution
     """
-    backup_spec = dict(filename=dict(), dir_path=dict(type="path"))
+    backup_spec = dict(
+        filename=dict(), dir_path=dict(type="path"), store=dict(type="path")
+    )
     argument_spec = dict(
         src=dict(type="str"),
         lines=dict(aliases=["commands"], type="list", elements="str"),
@@ -281,7 +414,9 @@ def main():
         before=dict(type="list", elements="str"),
         after=dict(type="list", elements="str"),
         match=dict(default="line", choices=["line", "strict", "exact", "none"]),
-        replace=dict(default="line", choices=["line", "block"]),
+        replace=dict(default="line", choices=["line", "block", "config"]),
+        replace_path=dict(default="ansible_candidate.cfg"),
+        file_transfer=dict(default="sftp", choices=["sftp", "scp"]),
         running_config=dict(aliases=["config"]),
         intended_config=dict(),
         defaults=dict(type="bool", default=False),
@@ -300,6 +435,7 @@ def main():
         ("match", "strict", ["lines"]),
         ("match", "exact", ["lines"]),
         ("replace", "block", ["lines"]),
+        ("replace", "config", ["src"]),
         ("diff_against", "intended", ["intended_config"]),
     ]
 
@@ -314,9 +450,13 @@ def main():
     warnings = list()
     result["warnings"] = warnings
     diff_ignore_lines = module.params["diff_ignore_lines"]
+    trees = ConfigTrees(ignore_lines=diff_ignore_lines)
     flags = []
-    config = None
     contents = None
+    running = None
+    candidate = None
+    applied = None
+    replaced = None
     connection = get_connection(module)
     if (
         module.params["backup"]
@@ -324,11 +464,32 @@ def main():
         and module.params["diff_against"] == "running"
     ):
         contents = get_config(module, flags)
-        config = NetworkConfig(indent=1, contents=contents)
         if module.params["backup"]:
-            result["__backup__"] = contents
+            backup_config(module, result, contents)
 
-    if any((module.params["lines"], module.params["src"])):
+    if module.params["replace"] == "config":
+        candidate = module.params["src"]
+        running = get_running_config(module, contents, flags)
+        if trees.get(candidate).sha1 != trees.get(running).sha1:
+            if not module.check_mode:
+                response = replace_config(module, connection, candidate)
+                result["commands"] = response["request"]
+                applied = response["request"]
+                # the replace command may merge on some releases, check
+                # that the device holds the candidate now
+                replaced = get_changed_config(
+                    module, trees, running, candidate, applied
+                )
+                if trees.get(replaced).sha1 != trees.get(candidate).sha1:
+                    module.fail_json(
+                        msg="the running-config differs from src after the replace, "
+                        "check that the replace_command of the cliconf plugin "
+                        "replaces the running-config",
+                        commands=result["commands"],
+                    )
+            result["changed"] = True
+
+    elif any((module.params["lines"], module.params["src"])):
         match = module.params["match"]
         replace = module.params["replace"]
         path = module.params["parents"]
@@ -360,6 +521,7 @@ def main():
             if not module.check_mode:
                 if commands:
                     connection.edit_config(candidate=commands)
+                    applied = commands
 
             result["changed"] = True
 
@@ -368,69 +530,82 @@ def main():
     if module.params["save_when"] == "always":
         save_config(module, result)
     elif module.params["save_when"] == "modified":
-        output = run_commands(
-            module, ["show running-config", "show startup-config"], configure=True
-        )
-        running_config = NetworkConfig(
-            indent=1, contents=output[0], ignore_lines=diff_ignore_lines
-        )
-        startup_config = NetworkConfig(
-            indent=1, contents=output[1], ignore_lines=diff_ignore_lines
-        )
-        if running_config.sha1 != startup_config.sha1:
-            save_config(module, result)
+        try:
+            running_config = to_text(
+                connection.get_config(source="running"),
+                errors="surrogate_then_replace",
+            )
+            running_sha1 = trees.get(running_config).sha1
+            if connection.get_saved_config() == running_sha1:
+                # unchanged since this connection saved it last
+                startup_config = running_config
+            else:
+                startup_config = to_text(
+                    connection.get_config(source="startup"),
+                    errors="surrogate_then_replace",
+                )
+                if trees.get(startup_config).sha1 != running_sha1:
+                    save_config(module, result)
+                if not (module.check_mode and result["changed"]):
+                    connection.set_saved_config(running_sha1)
+        except ConnectionError as exc:
+            module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
 
     elif module.params["save_when"] == "changed" and result["changed"]:
         save_config(module, result)
 
     if module._diff:
-        if not running_config:
-            output = run_commands(module, "show running-config", configure=True)
-            contents = output[0]
-        else:
-            contents = running_config
+        current = contents if contents is not None else running
+        if module.params["diff_against"] and replaced is not None:
+            running_config = replaced
+        elif module.params["diff_against"] and not running_config:
+            running_config = get_changed_config(
+                module, trees, current, candidate, applied
+            )
 
-        running_config = NetworkConfig(
-            indent=1, contents=contents, ignore_lines=diff_ignore_lines
-        )
+        contents = None
         if module.params["diff_against"] == "running":
             if module.check_mode:
                 module.warn(
                     "unable to perform diff against running-config due to check mode"
                 )
-                contents = None
             else:
-                contents = config.config_text
+                contents = current
         elif module.params["diff_against"] == "startup":
             if not startup_config:
                 output = run_commands(module, "show startup-config", configure=True)
                 contents = output[0]
             else:
-                contents = startup_config.config_text
+                contents = startup_config
         elif module.params["diff_against"] == "intended":
             contents = module.params["intended_config"]
 
         if contents is not None:
-            base_config = NetworkConfig(
-                indent=1, contents=contents, ignore_lines=diff_ignore_lines
-            )
+            running_tree = trees.get(running_config)
+            base_tree = trees.get(contents)
 
-            if running_config.sha1 != base_config.sha1:
+            if running_tree.sha1 != base_tree.sha1:
                 if module.params["diff_against"] == "intended":
-                    before = running_config
-                    after = base_config
+                    before = running_tree
+                    after = base_tree
                 elif module.params["diff_against"] in ("startup", "running"):
-                    before = base_config
-                    after = running_config
+                    before = base_tree
+                    after = running_tree
 
                 result.update(
                     dict(changed=True, diff=dict(before=str(before), after=str(after)))
                 )
 
-        if result.get("changed") and any(module.params["src"], module.params["lines"]):
-            msg = ()
+        if result.get("changed") and any(
+            (module.params["src"], module.params["lines"])
+        ):
+            msg = (
+                "To ensure idempotency and correct diff the input configuration "
+                "lines should be similar to how they appear if present in the "
+                "running configuration on device"
+            )
             if module.params["src"]:
-                msg += ""
+                msg += " including the indentation"
             if "warnings" in result:
                 result["warnings"].append(msg)
             else:
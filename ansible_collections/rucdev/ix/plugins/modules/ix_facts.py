@@ -53,6 +53,30 @@ options:
         specific subset should not be collected.
     required: false
     version_added: "2.9"
+  cache_dir:
+    description:
+      - When supplied, the parsed facts of each network resource are stored
+        in this directory on the controller, along with a SHA-1 of the
+        config sections the resource is parsed from and of the collection
+        code it is parsed with.
+      - On the next run the running-config is fetched once and a resource
+        whose sections have not changed is read back from the directory
+        instead of being parsed again.
+      - The entries only depend on the config text, so the directory can be
+        shared by all the devices of an inventory. Upgrading the collection
+        parses the resources again.
+    type: path
+    required: false
+  parse_workers:
+    description:
+      - When greater than 1, the network resources are parsed concurrently
+        on a pool of up to this many worker processes, once the
+        running-config has been fetched.
+      - The resources are still parsed one after the other when a single
+        one is gathered, when the config is too small for the workers to
+        pay off, or when the controller cannot fork.
+    type: int
+    required: false
 """
 
 EXAMPLES = """
@@ -78,6 +102,10 @@ EXAMPLES = """
 - ix_facts:
     gather_subset: min
     gather_network_resources: interfaces
+
+- ix_facts:
+    gather_network_resources: all
+    cache_dir: "{{ playbook_dir }}/.ix_facts_cache"
 """
 
 RETURN = """
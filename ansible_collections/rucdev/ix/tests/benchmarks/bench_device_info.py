@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark of the device discovery on a cold connection.
+
+Runs Cliconf.get_device_info over a simulated connection with a fixed
+round trip time and link bandwidth, once reading the hostname from the
+prompt and once from the full running configuration, which is the
+fallback when the prompt does not carry it.
+
+Usage:
+    python -m ansible_collections.rucdev.ix.tests.benchmarks.bench_device_info
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible.module_utils._text import to_text
+
+from ansible_collections.rucdev.ix.plugins.cliconf.ix import Cliconf
+
+SHOW_VERSION = (
+    "NEC Portable Internetwork Core Operating System Software\n"
+    "IX Series IX2106 (magellan-sec) Software, Version 10.2.16, RELEASE SOFTWARE"
+)
+
+
+def running_config(interfaces):
+    lines = ["hostname Router", "timezone +09 00"]
+    for idx in range(interfaces):
+        lines.extend(
+            [
+                "interface Tunnel%d.0" % idx,
+                "  ip address 10.%d.%d.1/30" % (idx // 256 % 256, idx % 256),
+                "  ip ospf cost 10",
+                "  no shutdown",
+                "!",
+            ]
+        )
+    return "\n".join(lines)
+
+
+class SimulatedConnection(object):
+    """A network_cli connection to a device rtt seconds away over a link
+    of bandwidth bytes per second
+    """
+
+    def __init__(self, rtt, bandwidth, config, prompt=b"Router(config)#"):
+        self.rtt = rtt
+        self.bandwidth = bandwidth
+        self.outputs = {"show version": SHOW_VERSION, "show running-config": config}
+        self.prompt = prompt
+        self.commands = 0
+        self.received = 0
+
+    def get_prompt(self):
+        return self.prompt
+
+    def send(self, command, **kwargs):
+        output = self.outputs.get(to_text(command), "")
+        self.commands += 1
+        self.received += len(output)
+        time.sleep(self.rtt + len(output) / self.bandwidth)
+        return output
+
+
+def discover(connection):
+    cliconf = Cliconf(connection)
+    start = time.perf_counter()
+    cliconf.get_device_info()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--interfaces", type=int, default=2000)
+    parser.add_argument("--rtt", type=float, default=0.02)
+    parser.add_argument("--bandwidth", type=int, default=1000000)
+    args = parser.parse_args()
+
+    config = running_config(args.interfaces)
+    print(
+        "%d byte configuration, %.0fms round trip, %d bytes/s"
+        % (len(config), args.rtt * 1000, args.bandwidth)
+    )
+    print(
+        "%-16s %9s %12s %10s" % ("hostname from", "commands", "bytes read", "seconds")
+    )
+    for source, prompt in (("running-config", b""), ("prompt", b"Router(config)#")):
+        connection = SimulatedConnection(args.rtt, args.bandwidth, config, prompt)
+        elapsed = discover(connection)
+        print(
+            "%-16s %9d %12d %10.3f"
+            % (source, connection.commands, connection.received, elapsed)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark of the candidate to running config diff.
+
+Diffs a generated candidate against a running-config differing from it
+in one line out of ten, with the netcommon NetworkConfig and with
+IxNetworkConfig, for each match and replace mode, in seconds.
+
+Usage:
+    python -m ansible_collections.rucdev.ix.tests.benchmarks.bench_diff
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
+    NetworkConfig,
+    dumps,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.config_tree import (
+    IxNetworkConfig,
+)
+from ansible_collections.rucdev.ix.tests.benchmarks.bench_parse import (
+    synthetic_config,
+)
+
+MODES = (("line", "line"), ("line", "block"), ("strict", "line"), ("exact", "line"))
+
+
+def configs(lines):
+    running = synthetic_config(lines // 8 + 1)[:lines]
+    candidate = [
+        line.replace("hello-interval 10", "hello-interval 20") for line in running
+    ]
+    return "\n".join(candidate), "\n".join(running)
+
+
+def diff(config_cls, candidate, running, match, replace):
+    start = time.perf_counter()
+    candidate_obj = config_cls(indent=1, contents=candidate)
+    running_obj = config_cls(indent=1, contents=running)
+    updates = candidate_obj.difference(running_obj, match=match, replace=replace)
+    commands = dumps(updates, "commands")
+    return time.perf_counter() - start, commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, nargs="+", default=[2500, 5000, 40000])
+    parser.add_argument(
+        "--skip-netcommon-above",
+        type=int,
+        default=5000,
+        help="only time IxNetworkConfig for larger configs",
+    )
+    args = parser.parse_args()
+
+    print(
+        "%8s %-8s %-8s %12s %12s %9s"
+        % ("lines", "match", "replace", "netcommon", "ix", "speedup")
+    )
+    for lines in args.lines:
+        candidate, running = configs(lines)
+        for match, replace in MODES:
+            ours, commands = diff(IxNetworkConfig, candidate, running, match, replace)
+            if lines > args.skip_netcommon_above:
+                print(
+                    "%8d %-8s %-8s %12s %12.3f %9s"
+                    % (lines, match, replace, "-", ours, "-")
+                )
+                continue
+            theirs, expected = diff(NetworkConfig, candidate, running, match, replace)
+            if commands != expected:
+                raise AssertionError("the diffs differ for %s/%s" % (match, replace))
+            print(
+                "%8d %-8s %-8s %12.3f %12.3f %8.0fx"
+                % (lines, match, replace, theirs, ours, theirs / ours)
+            )
+
+
+if __name__ == "__main__":
+    main()
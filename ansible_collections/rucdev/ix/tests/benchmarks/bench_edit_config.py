@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark of the edit_config throughput.
+
+Pushes a generated tunnel configuration through Cliconf.edit_config over
+a simulated connection with a fixed round trip time, once line by line
+and once in bulk mode for several chunk sizes, in lines per second.
+
+Usage:
+    python -m ansible_collections.rucdev.ix.tests.benchmarks.bench_edit_config
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible.module_utils._text import to_text
+
+from ansible_collections.rucdev.ix.plugins.cliconf.ix import Cliconf
+from ansible_collections.rucdev.ix.plugins.terminal.ix import TerminalModule
+
+
+class SimulatedConnection(object):
+    """A network_cli connection to a device rtt seconds away, which takes
+    line_cost seconds to apply a configuration line
+    """
+
+    def __init__(self, rtt, line_cost):
+        self.rtt = rtt
+        self.line_cost = line_cost
+        self.options = {"terminal_stderr_re": None, "single_user_mode": False}
+        self._pending = []
+
+    def get_option(self, option):
+        return self.options[option]
+
+    def set_option(self, option, value):
+        self.options[option] = value
+
+    def get_prompt(self):
+        return b"Router(config)#"
+
+    def _get_terminal_std_re(self, option):
+        return TerminalModule.terminal_stderr_re
+
+    def send(self, command, sendonly=False, **kwargs):
+        if sendonly:
+            self._pending.append(to_text(command))
+            return None
+        time.sleep(self.rtt + self.line_cost)
+        return ""
+
+    def receive(self, **kwargs):
+        commands, self._pending = self._pending, []
+        time.sleep(self.rtt + self.line_cost * len(commands))
+        return "\nRouter(config)# ".join(commands) + "\nRouter(config)#"
+
+
+def tunnel_config(lines):
+    candidate = []
+    idx = 0
+    while len(candidate) < lines:
+        candidate.extend(
+            [
+                "interface Tunnel%d.0" % idx,
+                "  ip address 10.%d.%d.1/30" % (idx // 256 % 256, idx % 256),
+                "  ip ospf cost 10",
+                "  no shutdown",
+            ]
+        )
+        idx += 1
+    return candidate[:lines]
+
+
+def push(candidate, chunk_size, rtt, line_cost):
+    cliconf = Cliconf(SimulatedConnection(rtt, line_cost))
+    cliconf.set_option("bulk_chunk_size", chunk_size)
+    start = time.perf_counter()
+    cliconf.edit_config(candidate=candidate)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=500)
+    parser.add_argument("--rtt", type=float, default=0.02)
+    parser.add_argument("--line-cost", type=float, default=0.0002)
+    args = parser.parse_args()
+
+    candidate = tunnel_config(args.lines)
+    print(
+        "%d lines, %.0fms round trip, %.1fms per line on the device"
+        % (args.lines, args.rtt * 1000, args.line_cost * 1000)
+    )
+    print("%-12s %10s %12s" % ("mode", "seconds", "lines/s"))
+    for chunk_size in (1, 10, 50, 200):
+        elapsed = push(candidate, chunk_size, args.rtt, args.line_cost)
+        mode = "per-line" if chunk_size == 1 else "bulk %d" % chunk_size
+        print("%-12s %10.2f %12.0f" % (mode, elapsed, args.lines / elapsed))
+
+
+if __name__ == "__main__":
+    main()
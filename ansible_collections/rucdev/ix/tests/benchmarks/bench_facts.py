@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark of the ix_facts resource gathering.
+
+Gathers every network resource from a generated running-config, once
+parsing the resources one after the other and once on a pool of worker
+processes, in seconds of wall time.
+
+Usage:
+    python -m ansible_collections.rucdev.ix.tests.benchmarks.bench_facts
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.facts import (
+    Facts,
+    ParseModule,
+)
+from ansible_collections.rucdev.ix.tests.benchmarks.bench_parse import (
+    synthetic_config,
+)
+
+
+def gather(config, workers):
+    module = ParseModule(
+        {
+            "gather_subset": ["!all"],
+            "gather_network_resources": ["all"],
+            "parse_workers": workers,
+        }
+    )
+    start = time.perf_counter()
+    Facts(module).get_facts(data=config)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--interfaces", type=int, default=4000)
+    parser.add_argument("--workers", type=int, default=5)
+    args = parser.parse_args()
+
+    config = "\n".join(synthetic_config(args.interfaces))
+    print("%d interfaces" % args.interfaces)
+    print("%-12s %10s" % ("mode", "seconds"))
+    serial = gather(config, 1)
+    print("%-12s %10.2f" % ("serial", serial))
+    parallel = gather(config, args.workers)
+    print(
+        "%-12s %10.2f %7.1fx"
+        % ("%d workers" % args.workers, parallel, serial / parallel)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark of idempotent runs of the interface resource modules.
+
+Generates the commands of the interfaces, l3_interfaces and
+ospf_interfaces resources for a want equal to the gathered facts of a
+generated running-config, which produce no commands, in milliseconds.
+
+Usage:
+    python -m ansible_collections.rucdev.ix.tests.benchmarks.bench_idempotent
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import copy
+import time
+
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.config.interfaces.interfaces import (
+    Interfaces,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.config.l3_interfaces.l3_interfaces import (
+    L3_interfaces,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.config.ospf_interfaces.ospf_interfaces import (
+    Ospf_interfaces,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.facts import (
+    ParseModule,
+)
+from ansible_collections.rucdev.ix.tests.benchmarks.bench_parse import (
+    synthetic_config,
+)
+
+RESOURCES = (
+    ("interfaces", Interfaces),
+    ("l3_interfaces", L3_interfaces),
+    ("ospf_interfaces", Ospf_interfaces),
+)
+
+
+def generate(resource_cls, config, state):
+    module = ParseModule({"running_config": config, "state": "parsed"})
+    resource = resource_cls(module)
+    resource.state = state
+    resource.want = copy.deepcopy(resource.before)
+    resource.have = copy.deepcopy(resource.before)
+
+    start = time.perf_counter()
+    resource.generate_commands()
+    elapsed = time.perf_counter() - start
+    return elapsed, len(resource.commands)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--interfaces", type=int, default=4000)
+    args = parser.parse_args()
+
+    config = "\n".join(synthetic_config(args.interfaces))
+    print("%d interfaces" % args.interfaces)
+    print("%-16s %-10s %10s %10s" % ("resource", "state", "commands", "ms"))
+    for name, resource_cls in RESOURCES:
+        for state in ("merged", "replaced", "overridden"):
+            elapsed, commands = generate(resource_cls, config, state)
+            print("%-16s %-10s %10d %10.1f" % (name, state, commands, elapsed * 1000))
+
+
+if __name__ == "__main__":
+    main()
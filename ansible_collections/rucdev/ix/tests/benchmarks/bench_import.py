@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark of the module import time.
+
+Imports each plugins/modules/ix_* entry point in a fresh interpreter and
+reports the best import time over a few runs, along with the number of
+collection modules and rm_templates it pulled in.
+
+Usage:
+    python -m ansible_collections.rucdev.ix.tests.benchmarks.bench_import
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+MODULES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "plugins", "modules"
+)
+PACKAGE = "ansible_collections.rucdev.ix"
+
+# the shared dependencies are imported first, so that only the cost of the
+# entry point itself is measured
+PROBE = """
+import json, sys, time
+import ansible.module_utils.basic
+import ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils
+before = set(sys.modules)
+start = time.perf_counter()
+import %(module)s
+elapsed = time.perf_counter() - start
+loaded = [name for name in set(sys.modules) - before if name.startswith("%(package)s.")]
+print(json.dumps({
+    "seconds": elapsed,
+    "modules": len(loaded),
+    "templates": sorted(name.rsplit(".", 1)[1] for name in loaded if ".rm_templates." in name),
+}))
+"""
+
+
+def entry_points():
+    return sorted(
+        name[:-3]
+        for name in os.listdir(MODULES_DIR)
+        if name.startswith("ix_") and name.endswith(".py")
+    )
+
+
+def probe(name):
+    module = "%s.plugins.modules.%s" % (PACKAGE, name)
+    code = PROBE % {"module": module, "package": PACKAGE}
+    out = subprocess.check_output([sys.executable, "-c", code])
+    return json.loads(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("%-20s %9s %8s  %s" % ("module", "ms", "modules", "rm_templates"))
+    for name in entry_points():
+        runs = [probe(name) for _run in range(args.repeat)]
+        best = min(run["seconds"] for run in runs)
+        print(
+            "%-20s %9.1f %8d  %s"
+            % (name, best * 1000, runs[0]["modules"], " ".join(runs[0]["templates"]))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark of the ix_l3_interfaces command generation.
+
+Generates the commands of a merged and of a replaced run on an interface
+carrying a growing number of secondary addresses, half of them already
+configured, in milliseconds and microseconds per address.
+
+Usage:
+    python -m ansible_collections.rucdev.ix.tests.benchmarks.bench_l3_interfaces
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import copy
+import time
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    remove_empties,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.config.l3_interfaces.l3_interfaces import (
+    L3_interfaces,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.facts import (
+    ParseModule,
+)
+
+
+def address(idx):
+    return "10.%d.%d.1/24" % (idx // 256 % 256, idx % 256)
+
+
+def running_config(secondaries):
+    lines = ["interface GigaEthernet0.0", "  ip address %s" % address(0)]
+    for idx in range(1, secondaries // 2 + 1):
+        lines.append("  ip address %s secondary" % address(idx))
+    return "\n".join(lines)
+
+
+def want(secondaries):
+    ipv4 = [{"address": address(0)}]
+    for idx in range(1, secondaries + 1):
+        ipv4.append({"address": address(idx), "secondary": True})
+    return [{"name": "GigaEthernet0.0", "ipv4": ipv4}]
+
+
+def generate(secondaries, state):
+    module = ParseModule(
+        {
+            "config": want(secondaries),
+            "running_config": running_config(secondaries),
+            "state": "parsed",
+        }
+    )
+    resource = L3_interfaces(module)
+    resource.state = state
+    resource.want = remove_empties({"config": resource.want})["config"]
+    resource.have = copy.deepcopy(resource.before)
+
+    start = time.perf_counter()
+    resource.generate_commands()
+    elapsed = time.perf_counter() - start
+    return elapsed, len(resource.commands)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    args = parser.parse_args()
+
+    print(
+        "%-10s %12s %10s %10s %14s"
+        % ("state", "secondaries", "commands", "ms", "us/address")
+    )
+    for state in ("merged", "replaced"):
+        for size in args.sizes:
+            elapsed, commands = generate(size, state)
+            print(
+                "%-10s %12d %10d %10.1f %14.1f"
+                % (state, size, commands, elapsed * 1000, elapsed * 1e6 / size)
+            )
+
+
+if __name__ == "__main__":
+    main()
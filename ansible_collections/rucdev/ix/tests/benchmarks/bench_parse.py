@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark of the rm_templates parsing engine.
+
+Compares the netcommon NetworkTemplate.parse, which tests every line
+against every parser, with IxNetworkTemplate.parse, which only tests the
+parsers indexed under the line's leading keywords.
+
+Usage:
+    python -m ansible_collections.rucdev.ix.tests.benchmarks.bench_parse
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import re
+import time
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_base.network_template import (
+    IxNetworkTemplate,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.ospf_interfaces import (
+    Ospf_interfacesTemplate,
+)
+
+
+def synthetic_config(interfaces):
+    """Returns the lines of a config with the given number of interfaces"""
+    lines = []
+    for idx in range(interfaces):
+        lines.extend(
+            [
+                "interface Tunnel%d.0" % idx,
+                "  description tunnel-%d" % idx,
+                "  ip address 10.%d.%d.1/30" % (idx // 256 % 256, idx % 256),
+                "  ip ospf cost %d" % (idx % 100 + 1),
+                "  ip ospf hello-interval 10",
+                "  ipv6 ospf cost %d" % (idx % 100 + 1),
+                "  no shutdown",
+                "!",
+            ]
+        )
+    return lines
+
+
+def synthetic_template(parser_count):
+    """Returns a template class with parser_count keyword parsers"""
+    parsers = [
+        {
+            "name": "interface",
+            "getval": re.compile(r"^interface\s(?P<name>\S+)$"),
+            "result": {},
+            "shared": True,
+        }
+    ]
+    for idx in range(parser_count - 1):
+        parsers.append(
+            {
+                "name": "kw%d" % idx,
+                "getval": re.compile(
+                    r"""
+                    \s+kw%d
+                    \s(?P<value>\S+)
+                    $""" % idx,
+                    re.VERBOSE,
+                ),
+                "result": {},
+            }
+        )
+
+    class SyntheticTemplate(IxNetworkTemplate):
+        def __init__(self, lines=None):
+            super(SyntheticTemplate, self).__init__(lines=lines, tmplt=self)
+
+        PARSERS = parsers
+
+    return SyntheticTemplate
+
+
+def synthetic_lines(parser_count, line_count):
+    lines = []
+    for idx in range(line_count):
+        if idx % 10 == 0:
+            lines.append("interface Tunnel%d.0" % idx)
+        else:
+            lines.append("  kw%d %d" % (idx % (parser_count - 1), idx))
+    return lines
+
+
+def timed(func, repeat):
+    best = None
+    for _count in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(tmplt, repeat):
+    base = timed(lambda: NetworkTemplate.parse(tmplt), repeat)
+    ix = timed(tmplt.parse, repeat)
+    return base, ix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--interfaces", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("parser count scaling (10,000 lines, regex cost only)")
+    print("%8s %12s %12s %8s" % ("parsers", "netcommon", "ix", "speedup"))
+    for parser_count in (5, 20, 50, 100, 200):
+        template = synthetic_template(parser_count)
+        tmplt = template(lines=synthetic_lines(parser_count, 10000))
+        base, ix = run(tmplt, args.repeat)
+        print("%8d %11.3fs %11.3fs %7.1fx" % (parser_count, base, ix, base / ix))
+
+    print("")
+    print("line count scaling (50 parsers, regex cost only)")
+    print("%8s %12s %12s %8s" % ("lines", "netcommon", "ix", "speedup"))
+    template = synthetic_template(50)
+    for line_count in (1000, 10000, 50000, 100000):
+        tmplt = template(lines=synthetic_lines(50, line_count))
+        base, ix = run(tmplt, args.repeat)
+        print("%8d %11.3fs %11.3fs %7.1fx" % (line_count, base, ix, base / ix))
+
+    print("")
+    lines = synthetic_config(args.interfaces)
+    print(
+        "Ospf_interfacesTemplate, %d interfaces (%d lines)"
+        % (args.interfaces, len(lines))
+    )
+    print("%8s %12s %12s %8s" % ("", "netcommon", "ix", "speedup"))
+    base, ix = run(Ospf_interfacesTemplate(lines=lines), 1)
+    print("%8s %11.3fs %11.3fs %7.1fx" % ("", base, ix, base / ix))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 AP Communications
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark of the rm_templates command rendering.
+
+Compares the netcommon NetworkTemplate.render, which compiles the setval
+template of every rendered command, with IxNetworkTemplate.render, which
+compiles each setval once, in commands rendered per second.
+
+Usage:
+    python -m ansible_collections.rucdev.ix.tests.benchmarks.bench_render
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.l3_interfaces import (
+    L3_interfacesTemplate,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.ospf_interfaces import (
+    Ospf_interfacesTemplate,
+)
+from ansible_collections.rucdev.ix.tests.benchmarks.bench_parse import timed
+
+
+def ospf_interfaces_commands(interfaces):
+    """Returns the (data, parser, negate) of an overridden ospf_interfaces run"""
+    commands = []
+    for idx in range(interfaces):
+        name = "Tunnel%d.0" % idx
+        commands.append(({"name": name}, "name", False))
+        for afi in ("ipv4", "ipv6"):
+            data = {
+                "afi": afi,
+                "cost": idx % 100 + 1,
+                "dead_interval": 40,
+                "hello_interval": 10,
+                "retransmit_interval": 5,
+                "transmit_delay": 1,
+            }
+            for parser in (
+                "cost",
+                "dead_interval",
+                "hello_interval",
+                "retransmit_interval",
+                "transmit_delay",
+            ):
+                commands.append((data, parser, False))
+        commands.append(({"interface_type": "point-to-point"}, "interface_type", True))
+    return commands
+
+
+def l3_interfaces_commands(interfaces):
+    """Returns the (data, parser, negate) of an overridden l3_interfaces run"""
+    commands = []
+    for idx in range(interfaces):
+        commands.append(({"name": "Tunnel%d.0" % idx}, "name", False))
+        commands.append(
+            (
+                {"ipv4": {"address": "10.%d.%d.1/30" % (idx // 256 % 256, idx % 256)}},
+                "ipv4.address",
+                False,
+            )
+        )
+        commands.append(
+            (
+                {"ipv4": {"address": "10.%d.%d.1/30" % (idx // 256 % 256, idx % 256)}},
+                "ipv4.address",
+                True,
+            )
+        )
+        commands.append(
+            (
+                {"ipv6": {"address": "2001:db8:%x::1/64" % idx, "anycast": True}},
+                "ipv6.address",
+                False,
+            )
+        )
+    return commands
+
+
+def run(tmplt, commands, repeat):
+    def netcommon():
+        for data, parser, negate in commands:
+            NetworkTemplate.render(tmplt, data, parser, negate)
+
+    def ix():
+        for data, parser, negate in commands:
+            tmplt.render(data, parser, negate)
+
+    return timed(netcommon, repeat), timed(ix, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--interfaces", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        "%-24s %9s %14s %14s %8s" % ("", "commands", "netcommon/s", "ix/s", "speedup")
+    )
+    for template, commands in (
+        (Ospf_interfacesTemplate, ospf_interfaces_commands(args.interfaces)),
+        (L3_interfacesTemplate, l3_interfaces_commands(args.interfaces)),
+    ):
+        base, ix = run(template(), commands, args.repeat)
+        print(
+            "%-24s %9d %14.0f %14.0f %7.1fx"
+            % (
+                template.__name__,
+                len(commands),
+                len(commands) / base,
+                len(commands) / ix,
+                base / ix,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils import (
+    backup_store,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.backup_store import (
+    BackupStore,
+)
+from ansible_collections.rucdev.ix.tests.unit.modules.network.ix.ix_module import (
+    load_fixture,
+)
+
+
+def change(text, day):
+    lines = text.split("\n")
+    lines[day % len(lines)] = "! day %d" % day
+    lines.insert(day % 7, "ip route 10.%d.0.0/16 Null0" % day)
+    return "\n".join(lines)
+
+
+class TestIxBackupStore(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.store = BackupStore(self.path)
+        self.config = load_fixture("ix_running_config.cfg")
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_put_get(self):
+        sha1, changed = self.store.put("r1", self.config)
+        self.assertTrue(changed)
+        self.assertEqual(sha1, hashlib.sha1(self.config.encode("utf-8")).hexdigest())
+        self.assertEqual(self.store.get(sha1), self.config)
+        self.assertEqual(
+            self.store.object_path(sha1),
+            os.path.join(self.path, "objects", sha1 + ".gz"),
+        )
+        self.assertRaises(KeyError, self.store.get, "0" * 40)
+        self.assertIsNone(self.store.object_path("0" * 40))
+
+    def test_deduplicated(self):
+        sha1 = self.store.put("r1", self.config)[0]
+        self.assertEqual(self.store.put("r1", self.config), (sha1, False))
+        self.assertEqual(self.store.put("r2", self.config), (sha1, True))
+        self.assertEqual(os.listdir(os.path.join(self.path, "objects")), [sha1 + ".gz"])
+        self.assertEqual([entry[1] for entry in self.store.history("r2")], [sha1])
+        self.assertEqual(self.store.history("r3"), [])
+
+    def test_deltas(self):
+        texts = [self.config]
+        for day in range(1, 6):
+            texts.append(change(texts[-1], day))
+        sha1s = [self.store.put("r1", text)[0] for text in texts]
+
+        for sha1, text in zip(sha1s, texts):
+            self.assertEqual(self.store.get(sha1), text)
+        self.assertTrue(self.store.object_path(sha1s[0]).endswith(".gz"))
+        for sha1 in sha1s[1:]:
+            self.assertTrue(self.store.object_path(sha1).endswith(".delta.gz"))
+        self.assertEqual([entry[1] for entry in self.store.history("r1")], sha1s)
+
+        # going back to a stored config only adds a ref
+        self.assertEqual(self.store.put("r1", self.config), (sha1s[0], True))
+        self.assertEqual(len(os.listdir(os.path.join(self.path, "objects"))), 6)
+
+    def test_corrupt_delta(self):
+        texts = [self.config]
+        for day in range(1, 4):
+            texts.append(change(texts[-1], day))
+        sha1s = [self.store.put("r1", text)[0] for text in texts]
+
+        # the second link of the chain rebuilds the first backup instead
+        path = self.store.object_path(sha1s[2])
+        delta = json.loads(self.store._read(path))
+        delta["ops"] = [[0, len(self.config.split("\n"))]]
+        self.store._write(path, gzip.compress(json.dumps(delta).encode("utf-8")))
+
+        self.assertEqual(self.store.get(sha1s[1]), texts[1])
+        for sha1 in sha1s[2:]:
+            self.assertRaises(ValueError, self.store.get, sha1)
+        # the next backup is stored in full
+        sha1 = self.store.put("r1", change(texts[-1], 4))[0]
+        self.assertTrue(self.store.object_path(sha1).endswith("%s.gz" % sha1))
+
+    def test_delta_depth(self):
+        text = self.config
+        self.store.put("r1", text)
+        with patch.object(backup_store, "MAX_DELTA_DEPTH", 2):
+            for day in range(1, 5):
+                text = change(text, day)
+                sha1 = self.store.put("r1", text)[0]
+                self.assertEqual(self.store.get(sha1), text)
+                self.assertEqual(
+                    self.store.object_path(sha1).endswith(".delta.gz"), day != 3
+                )
+
+    def test_unrelated_config(self):
+        self.store.put("r1", self.config)
+        sha1 = self.store.put("r1", "hostname Other")[0]
+        self.assertTrue(self.store.object_path(sha1).endswith("%s.gz" % sha1))
+        self.assertEqual(self.store.get(sha1), "hostname Other")
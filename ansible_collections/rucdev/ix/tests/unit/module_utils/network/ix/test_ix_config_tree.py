@@ -0,0 +1,183 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import random
+import unittest
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
+    NetworkConfig,
+    dumps,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.config_tree import (
+    ConfigTrees,
+    IxNetworkConfig,
+)
+from ansible_collections.rucdev.ix.tests.unit.modules.network.ix.ix_module import (
+    load_fixture,
+)
+
+WORDS = ["ip", "ospf", "cost", "10", "20", "area", "0", "network", "mtu", "1500"]
+HEADERS = [
+    "interface GigaEthernet0.0",
+    "interface GigaEthernet1.0",
+    "interface Tunnel0.0",
+    "ip router ospf 1",
+    "ipv6 router ospf 1",
+]
+
+
+def random_config(rng, lines):
+    """Returns a config text with nested blocks, odd indents, duplicates,
+    comments and blank lines
+    """
+    config = []
+    for _idx in range(lines):
+        roll = rng.random()
+        if roll < 0.2:
+            config.append(rng.choice(HEADERS))
+        elif roll < 0.25:
+            config.append(rng.choice(["!", "", "  ! comment", "exit", "end"]))
+        elif roll < 0.3:
+            config.append(" " * rng.randint(0, 6) + "area 0 {")
+        else:
+            indent = rng.choice([0, 1, 2, 2, 2, 3, 4, 5])
+            words = rng.sample(WORDS, rng.randint(1, 3))
+            config.append(" " * indent + " ".join(words) + rng.choice(["", " ", ";"]))
+    return "\n".join(config)
+
+
+def mutate(rng, text):
+    lines = text.split("\n")
+    for _idx in range(rng.randint(0, 6)):
+        roll = rng.random()
+        pos = rng.randrange(len(lines) + 1)
+        if roll < 0.4 and lines:
+            del lines[min(pos, len(lines) - 1)]
+        elif roll < 0.7:
+            lines.insert(pos, "  " + " ".join(rng.sample(WORDS, 2)))
+        else:
+            lines.insert(pos, rng.choice(HEADERS))
+    return "\n".join(lines)
+
+
+def diff(config_cls, candidate, running, match, path, replace):
+    candidate_obj = config_cls(indent=1)
+    candidate_obj.load(candidate)
+    running_obj = config_cls(indent=1, contents=running)
+    updates = candidate_obj.difference(
+        running_obj, path=path, match=match, replace=replace
+    )
+    return dumps(updates, "commands")
+
+
+class TestIxConfigTreeParity(unittest.TestCase):
+    """IxNetworkConfig gives the same diffs as NetworkConfig"""
+
+    def assert_parity(self, candidate, running, paths):
+        for match in ("line", "strict", "exact"):
+            for replace in ("line", "block"):
+                for path in paths:
+                    args = (candidate, running, match, path, replace)
+                    self.assertEqual(
+                        diff(IxNetworkConfig, *args),
+                        diff(NetworkConfig, *args),
+                        (match, replace, path),
+                    )
+
+    def test_parse_parity(self):
+        rng = random.Random(0)
+        for _run in range(50):
+            text = random_config(rng, 60)
+            ours = IxNetworkConfig(indent=1, contents=text)
+            theirs = NetworkConfig(indent=1, contents=text)
+            self.assertEqual(
+                [(item.raw, item.line, item.children) for item in ours.items],
+                [(item.raw, item.line, item.children) for item in theirs.items],
+            )
+            self.assertEqual(ours.sha1, theirs.sha1)
+
+    def test_diff_parity_random(self):
+        rng = random.Random(1)
+        for _run in range(80):
+            running = random_config(rng, rng.randint(0, 40))
+            candidate = mutate(rng, running)
+            paths = [None, [rng.choice(HEADERS)], ["ip router ospf 1", "area 0 {"]]
+            self.assert_parity(candidate, running, paths)
+
+    def test_diff_parity_running_config(self):
+        running = load_fixture("ix_running_config.cfg")
+        candidate = mutate(random.Random(2), running)
+        self.assert_parity(
+            candidate,
+            running,
+            [None, ["interface GigaEthernet0.0"], ["ip router ospf 1"]],
+        )
+
+    def test_diff_parity_without_running(self):
+        running = load_fixture("ix_running_config.cfg")
+        self.assert_parity(running, "", [None])
+
+
+class TestIxConfigTreeMerge(unittest.TestCase):
+    running = "\n".join(
+        [
+            "hostname Router",
+            "interface GigaEthernet0.0",
+            "  ip address 192.168.1.1/24",
+            "  ip ospf cost 10",
+            "  no shutdown",
+            "ip router ospf 1",
+            "  area 0",
+            "    range 10.0.0.0/8",
+            "interface GigaEthernet1.0",
+            "  ip address 10.0.0.1/30",
+        ]
+    )
+
+    def merge(self, lines, parents=None):
+        candidate = IxNetworkConfig(indent=1)
+        candidate.add(lines, parents=parents)
+        return IxNetworkConfig(indent=1, contents=self.running).merge(candidate)
+
+    def test_merge_added_lines(self):
+        merged = self.merge(["stub"], ["ip router ospf 1", "area 0"])
+        self.assertEqual(
+            merged.split("\n")[5:9],
+            [
+                "ip router ospf 1",
+                "  area 0",
+                "    range 10.0.0.0/8",
+                "    stub",
+            ],
+        )
+        merged = self.merge(["ip address 10.1.0.1/30"], ["interface Tunnel0.0"])
+        self.assertEqual(
+            merged.split("\n")[-3:],
+            [
+                "  ip address 10.0.0.1/30",
+                "interface Tunnel0.0",
+                "  ip address 10.1.0.1/30",
+            ],
+        )
+        self.assertEqual(self.merge(["ip ospf cost 10"], [HEADERS[0]]), self.running)
+
+    def test_merge_replaced_lines(self):
+        for lines in (
+            ["ip ospf cost 30"],
+            ["ip address 192.168.2.1/24"],
+            ["no ip ospf cost"],
+            ["shutdown"],
+        ):
+            self.assertIsNone(self.merge(lines, [HEADERS[0]]), lines)
+        self.assertIsNone(self.merge(["hostname Other"]))
+        # in doubt, a line sharing its leading words is taken as a replacement
+        self.assertIsNone(
+            self.merge(["range 172.16.0.0/12"], ["ip router ospf 1", "area 0"])
+        )
+
+    def test_config_trees(self):
+        trees = ConfigTrees()
+        tree = trees.get(self.running)
+        self.assertIs(trees.get(self.running), tree)
+        self.assertEqual(tree.sha1, trees.get(self.running + "\n!\n").sha1)
+        self.assertEqual(tree.sha1, NetworkConfig(contents=self.running).sha1)
@@ -0,0 +1,310 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import re
+import unittest
+
+from copy import deepcopy
+from textwrap import dedent
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    Template,
+    dict_merge,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_base.network_template import (
+    LazyPattern,
+    literal,
+    merge_into,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.interfaces import (
+    InterfacesTemplate,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.l3_interfaces import (
+    L3_interfacesTemplate,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.ospf_interfaces import (
+    Ospf_interfacesTemplate,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.ospfv2 import (
+    Ospfv2Template,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.rm_templates.ospfv3 import (
+    Ospfv3Template,
+)
+
+INTERFACES = dedent("""\
+    interface GigaEthernet0.0
+      description uplink to core
+      ip mtu 1500
+      no shutdown
+    interface GigaEthernet1.0
+      description 100
+      shutdown
+    interface Loopback0.0
+      description 'quoted'
+    """)
+
+L3_INTERFACES = dedent("""\
+    interface GigaEthernet0.0
+      ip address 192.168.1.1/24
+      ip address 192.168.2.1/24 secondary
+      ipv6 address 2001:db8::1/64
+      ipv6 address 2001:db8:1::1/64 anycast
+      ipv6 address 2001:db8:2::/64 eui-64
+    interface GigaEthernet1.0
+      ipv6 address autoconfig
+    interface Tunnel0.0
+      ipv6 address autoconfig receive-default
+    """)
+
+OSPF_INTERFACES = dedent("""\
+    interface GigaEthernet0.0
+      ip ospf authentication message-digest
+      ip ospf cost 10
+      ipv6 ospf cost 20
+      ip ospf dead-interval 40
+      ipv6 ospf dead-interval 40
+      ip ospf hello-interval 10
+      ipv6 ospf hello-interval 10
+      ip ospf message-digest 1 secret
+      ip ospf mtu-ignore
+      ip ospf network point-to-point
+      ip priority 1
+      ipv6 priority 2
+      ip ospf retransmit-interval 5
+      ipv6 ospf retransmit-interval 5
+      ip ospf transmit-delay 1
+      ipv6 ospf transmit-delay 1
+    interface GigaEthernet1.0
+      ip ospf authentication null
+      ip ospf neighbor 10.0.0.1 poll-interval 60 priority 1
+      ip ospf neighbor 10.0.0.2
+      ipv6 ospf neighbor 1 10.0.0.3 fe80::1 poll-interval 60 priority 1
+    interface Tunnel0.0
+      ip ospf authentication
+    """)
+
+OSPFV2 = dedent("""\
+    ip router ospf 1
+      compatible rfc1583
+      default-metric 100
+      distance external 110 inter-area 120 intra-area 130 nssa-external 140
+      distribute-list prefix PL1
+      distribute-list route-map RM1
+      network 10.0.0.0/8 area 0
+      network 172.16.0.0/12 area 0.0.0.1
+      nssa-range 10.1.0.0/16 not-advertise tag 10
+      nssa-range 10.2.0.0/16
+      originate-default always metric 10 metric-type 1 route-map RM2
+      passive-interface GigaEthernet0.0
+      passive-interface Tunnel0.0
+      rib max-entries 128
+      router-id 1.1.1.1
+      timers delay 5 hold 10
+      area 0
+      area 1 default-cost 10
+      area 2 nssa no-summary stability-interval 40 translate default-metric 10
+      area 3 range 10.3.0.0/16
+      area 3 range 10.4.0.0/16 not-advertise
+      area 4 stub
+      area 5 stub no-summary
+      area 6 virtual-link 2.2.2.2 hello-interval 10 dead-interval 40
+      area 6 virtual-link 3.3.3.3 authentication message-digest message-digest-key 1 secret
+      area 6 virtual-link 4.4.4.4 authentication authentication-key secret
+      area 0.0.0.7 stub
+    ip router ospf 02
+      router-id 2.2.2.2
+    """)
+
+OSPFV3 = dedent("""\
+    ipv6 router ospf 1
+      area 0
+      area 1 default-cost 10
+      area 2 range 2001:db8::/32
+      area 2 range 2001:db9::/32 not-advertise
+      area 3 stub
+      area 4 stub no-summary
+      distance external 110 inter-area 120 intra-area 130
+      network GigaEthernet0.0 area 0
+      originate-default always metric 10 metric-type 2 route-map RM1
+      passive-interface GigaEthernet1.0
+      router-id 1.1.1.1
+      timers delay 5 hold 10
+    ipv6 router ospf 2
+      router-id 2.2.2.2
+    """)
+
+RENDER_DATA = [
+    {},
+    {
+        "name": "Tunnel0.0",
+        "description": "uplink to core",
+        "mtu": 1500,
+        "afi": "ipv4",
+        "cost": 10,
+        "dead_interval": 40,
+        "hello_interval": 10,
+        "key_id": 1,
+        "password": "secret",
+        "router_id": "1.1.1.1",
+        "interval": 60,
+        "priority": 1,
+        "interface_type": "point-to-point",
+        "retransmit_interval": 5,
+        "transmit_delay": 1,
+        "process_id": 1,
+        "area_id": 0,
+        "area": 0,
+        "address": "10.0.0.0/8",
+        "default_cost": 10,
+        "default_metric": 100,
+        "rfc1583": True,
+        "interface": "GigaEthernet0.0",
+        "ipv4": {"address": "192.168.1.1/24", "secondary": True},
+        "ipv6": {"address": "2001:db8::1/64", "anycast": True, "eui": False},
+        "distance": {"external": 110, "inter_area": 120, "intra_area": 130},
+        "timers": {"delay": 5, "hold": 10},
+        "rib": {"max_entries": 128},
+    },
+    {"name": "GigaEthernet0.0", "afi": "ipv6", "cost": 20},
+]
+
+
+class TestIxRmTemplatesParity(unittest.TestCase):
+    """The result_fn of the parsers build exactly what their Jinja
+    result renders to.
+    """
+
+    def assert_parity(self, template, config):
+        lines = config.splitlines()
+        reference = NetworkTemplate(lines=lines, tmplt=template())
+        self.assertEqual(template(lines=lines).parse(), reference.parse())
+
+    def assert_result_fns(self, template):
+        for parser in template.PARSERS:
+            self.assertTrue(callable(parser.get("result_fn")), parser["name"])
+
+    def outcome(self, render, data, parser, negate, *args):
+        try:
+            return render(*(args + (data, parser["name"], negate)))
+        except Exception as exc:
+            return type(exc)
+
+    def test_interfaces_parity(self):
+        self.assert_result_fns(InterfacesTemplate)
+        self.assert_parity(InterfacesTemplate, INTERFACES)
+
+    def test_l3_interfaces_parity(self):
+        self.assert_result_fns(L3_interfacesTemplate)
+        self.assert_parity(L3_interfacesTemplate, L3_INTERFACES)
+
+    def test_ospf_interfaces_parity(self):
+        self.assert_result_fns(Ospf_interfacesTemplate)
+        self.assert_parity(Ospf_interfacesTemplate, OSPF_INTERFACES)
+
+    def test_ospfv2_parity(self):
+        self.assert_result_fns(Ospfv2Template)
+        self.assert_parity(Ospfv2Template, OSPFV2)
+
+    def test_ospfv3_parity(self):
+        self.assert_result_fns(Ospfv3Template)
+        self.assert_parity(Ospfv3Template, OSPFV3)
+
+    def test_render_parity(self):
+        for template in (
+            InterfacesTemplate,
+            L3_interfacesTemplate,
+            Ospf_interfacesTemplate,
+            Ospfv2Template,
+            Ospfv3Template,
+        ):
+            tmplt = template()
+            for parser in template.PARSERS:
+                if "setval" not in parser:
+                    continue
+                for data in RENDER_DATA:
+                    for negate in (False, True):
+                        self.assertEqual(
+                            self.outcome(tmplt.render, data, parser, negate),
+                            self.outcome(
+                                NetworkTemplate.render, data, parser, negate, tmplt
+                            ),
+                            (template.__name__, parser["name"], data, negate),
+                        )
+
+    def test_lazy_pattern(self):
+        pattern = LazyPattern(
+            r"""
+            \s+ip\sospf\scost\s(?P<cost>\S+)  # the cost
+            (\s[ ]secondary)?
+            $""",
+            re.VERBOSE,
+        )
+        self.assertIsNone(pattern._compiled)
+        self.assertEqual(pattern.match("  ip ospf cost 10").group("cost"), "10")
+        self.assertTrue(pattern.match("  ip ospf cost 10  secondary"))
+        self.assertEqual(
+            pattern.compile().pattern,
+            r"\s+ip\sospf\scost\s(?P<cost>\S+)(\s[ ]secondary)?$",
+        )
+        self.assertIs(pattern.compile(), pattern.compile())
+
+    def test_netcommon_engine(self):
+        parsers = L3_interfacesTemplate().PARSERS
+        self.assertIsInstance(parsers[0]["getval"], re.Pattern)
+        self.assertIsInstance(L3_interfacesTemplate.PARSERS[0]["getval"], LazyPattern)
+        lines = ["interface GigaEthernet0.0", "  ip address 192.168.1.1/24"]
+        self.assertEqual(
+            NetworkTemplate(lines=lines, tmplt=L3_interfacesTemplate()).parse(),
+            L3_interfacesTemplate(lines=lines).parse(),
+        )
+
+    def test_merge_into_parity(self):
+        base = {
+            "name": "GigaEthernet0.0",
+            "cost": 10,
+            "ipv4": [{"address": "10.0.0.1/24"}],
+            "areas": ["0", "1"],
+            "auth": {"key": "secret", "type": "md5"},
+        }
+        for other in (
+            {"cost": 20, "mtu": 1500},
+            {"cost": 10, "areas": ["1", "2"]},
+            {"ipv4": [{"address": "10.0.1.1/24", "secondary": True}]},
+            {"auth": {"type": "text"}},
+            {"auth": "none"},
+            {"areas": None},
+            {"ipv4": None},
+            {"auth": None},
+            {"cost": None},
+        ):
+            self.assertEqual(
+                merge_into(deepcopy(base), other), dict_merge(base, other), other
+            )
+
+    def test_literal(self):
+        template = Template()
+        for value in (
+            "0",
+            "10",
+            "010",
+            "1.5",
+            "0.0.0.1",
+            "True",
+            "None",
+            "'quoted'",
+            " 10",
+            "10.0.0.0/8",
+            "GigaEthernet0.0",
+            "uplink to core",
+        ):
+            self.assertEqual(
+                literal(value),
+                template("{{ value }}", {"value": value}),
+                value,
+            )
+        self.assertIsNone(literal(None))
+        self.assertIsNone(literal(""))
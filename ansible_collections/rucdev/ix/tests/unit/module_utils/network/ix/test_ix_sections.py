@@ -0,0 +1,75 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import unittest
+
+from unittest.mock import MagicMock
+
+from ansible.module_utils.connection import ConnectionError
+
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.l3_interfaces.l3_interfaces import (
+    L3_interfacesFacts,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.sections import (
+    get_interfaces_config,
+    get_named_interfaces,
+)
+
+BLOCKS = {
+    "show running-config interface GigaEthernet0.0": "interface GigaEthernet0.0\n"
+    "  ip address 192.168.0.1/24\n  no shutdown",
+    "show running-config interface Tunnel0.0": "interface Tunnel0.0\n"
+    "  ip address 10.0.0.1/30\n  no shutdown",
+}
+
+
+def module(state, config):
+    return MagicMock(params={"state": state, "config": config})
+
+
+class TestIxInterfacesConfig(unittest.TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.connection.configure_get.side_effect = lambda command: BLOCKS.get(
+            command, "\n".join(BLOCKS.values())
+        )
+
+    def test_named_interfaces(self):
+        config = [{"name": "Tunnel0.0"}, {"name": "GigaEthernet0.0"}]
+        self.assertEqual(
+            get_named_interfaces(module("merged", config)),
+            ["Tunnel0.0", "GigaEthernet0.0"],
+        )
+        self.assertEqual(
+            get_named_interfaces(module("replaced", config + config)),
+            ["Tunnel0.0", "GigaEthernet0.0"],
+        )
+        self.assertIsNone(get_named_interfaces(module("overridden", config)))
+        self.assertIsNone(get_named_interfaces(module("deleted", None)))
+        self.assertIsNone(get_named_interfaces(module("gathered", None)))
+
+    def test_targeted_fetch(self):
+        facts = L3_interfacesFacts(module("merged", [{"name": "Tunnel0.0"}]))
+        ansible_facts = {"ansible_network_resources": {}}
+        facts.populate_facts(self.connection, ansible_facts)
+
+        self.connection.configure_get.assert_called_once_with(
+            "show running-config interface Tunnel0.0"
+        )
+        self.assertEqual(
+            ansible_facts["ansible_network_resources"]["l3_interfaces"],
+            [{"name": "Tunnel0.0", "ipv4": [{"address": "10.0.0.1/30"}]}],
+        )
+
+    def test_full_fetch(self):
+        get_interfaces_config(self.connection, module("overridden", [{"name": "x"}]))
+        self.connection.configure_get.assert_called_once_with(
+            "show running-config interface"
+        )
+
+    def test_unknown_interface_falls_back(self):
+        self.connection.configure_get.side_effect = [ConnectionError("invalid"), ""]
+        get_interfaces_config(self.connection, module("merged", [{"name": "Foo0.0"}]))
+        self.connection.configure_get.assert_called_with(
+            "show running-config interface"
+        )
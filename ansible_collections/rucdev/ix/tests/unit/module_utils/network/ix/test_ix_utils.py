@@ -0,0 +1,100 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import unittest
+
+from unittest.mock import MagicMock
+
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils import (
+    utils,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.utils import (
+    expand_ipv4,
+    natural_key,
+    normalize_ip,
+    parse_ipv4,
+    parse_ipv6,
+    validate_ipv4,
+    validate_ipv6,
+    validate_n_expand_ipv4,
+)
+
+
+class TestIxUtils(unittest.TestCase):
+    def test_parse_ipv4(self):
+        self.assertEqual(parse_ipv4("192.168.1.1/24"), (0xC0A80101, 24))
+        self.assertEqual(parse_ipv4("192.168.1.1 255.255.255.0"), (0xC0A80101, 24))
+        self.assertEqual(parse_ipv4("0.0.0.0/0"), (0, 0))
+        self.assertEqual(parse_ipv4("10.0.0.1/24 "), (0x0A000001, 24))
+        self.assertEqual(parse_ipv4(" 10.0.0.1 255.255.255.0 "), (0x0A000001, 24))
+        for value in (
+            "192.168.1.1",
+            "192.168.1.1/33",
+            "192.168.1.256/24",
+            "192.168.1/24",
+            "host/24",
+            "192.168.1.1 255.0.255.0",
+        ):
+            self.assertRaises(ValueError, parse_ipv4, value)
+
+    def test_expand_ipv4(self):
+        self.assertEqual(expand_ipv4("10.0.0.1/30"), "10.0.0.1 255.255.255.252")
+        self.assertEqual(expand_ipv4("10.0.0.1/32"), "10.0.0.1 255.255.255.255")
+        self.assertEqual(expand_ipv4("10.0.0.1  255.255.0.0"), "10.0.0.1 255.255.0.0")
+
+    def test_parsed_once(self):
+        value = "172.16.0.1/12"
+        self.assertIs(parse_ipv4(value), parse_ipv4(value))
+        self.assertEqual(expand_ipv4(value), "172.16.0.1 255.240.0.0")
+        self.assertIn(value, utils._IPV4_EXPANDED)
+
+        # errors are cached too
+        self.assertRaises(ValueError, parse_ipv4, "10.0.0.1/40")
+        self.assertIsInstance(utils._IPV4_ADDRESSES["10.0.0.1/40"], str)
+        self.assertRaises(ValueError, parse_ipv4, "10.0.0.1/40")
+
+    def test_normalize_ip(self):
+        self.assertEqual(normalize_ip("2001:DB8:0:0::1/64"), "2001:db8::1/64")
+        self.assertEqual(normalize_ip("FE80::0:1"), "fe80::1")
+        self.assertEqual(normalize_ip("10.0.0.1 255.255.255.0"), "10.0.0.1/24")
+        self.assertEqual(normalize_ip(" 10.0.0.1/24"), "10.0.0.1/24")
+        self.assertEqual(normalize_ip("192.168.1.1"), "192.168.1.1")
+        for value in ("dhcp", "10.0.0.1/40", "2001:db8::g/64"):
+            self.assertEqual(normalize_ip(value), value)
+        self.assertIn("FE80::0:1", utils._IP_NORMALIZED)
+
+    def test_parse_ipv6(self):
+        self.assertEqual(parse_ipv6("2001:db8::1/64"), (0x20010DB8 << 96 | 1, 64))
+        self.assertEqual(parse_ipv6("2001:DB8::1/64"), parse_ipv6("2001:db8::1/64"))
+        for value in ("2001:db8::1", "2001:db8::1/129", "2001:db8::1/x", "fe80::g/64"):
+            self.assertRaises(ValueError, parse_ipv6, value)
+
+    def test_validate(self):
+        module = MagicMock()
+        self.assertEqual(
+            validate_n_expand_ipv4(module, {"address": "192.168.1.1/24"}),
+            "192.168.1.1 255.255.255.0",
+        )
+        validate_ipv6("2001:db8::1/64", module)
+        module.fail_json.assert_not_called()
+
+        validate_ipv4("192.168.1.1 255.255.255.0", module)
+        module.fail_json.assert_called_with(
+            msg="address format is <ipv4 address>/<mask>, got invalid format "
+            "192.168.1.1 255.255.255.0"
+        )
+        validate_n_expand_ipv4(module, {"address": "192.168.1.1/40"})
+        module.fail_json.assert_called_with(
+            msg="invalid value for mask: 40, mask should be in range 0-32"
+        )
+        validate_ipv6("2001:db8::1/200", module)
+        module.fail_json.assert_called_with(
+            msg="invalid value for mask: 200, mask should be in range 0-128"
+        )
+
+    def test_natural_key(self):
+        names = ["Tunnel10.0", "Tunnel9.0", "GigaEthernet0.1", "Tunnel9.10"]
+        self.assertEqual(
+            sorted(names, key=natural_key),
+            ["GigaEthernet0.1", "Tunnel9.0", "Tunnel9.10", "Tunnel10.0"],
+        )
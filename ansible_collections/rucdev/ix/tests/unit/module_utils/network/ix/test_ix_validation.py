@@ -0,0 +1,71 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import os
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.argspec.interfaces.interfaces import (
+    InterfacesArgs,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.facts import (
+    FACT_RESOURCE_SUBSETS,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.validation import (
+    STRICT_VALIDATION_ENV,
+    validate_config,
+)
+from ansible_collections.rucdev.ix.tests.unit.modules.network.ix.ix_module import (
+    load_fixture,
+)
+
+
+def gather(facts_cls, data):
+    ansible_facts = {"ansible_network_resources": {}}
+    facts_cls(MagicMock(params={})).populate_facts(None, ansible_facts, data)
+    return ansible_facts["ansible_network_resources"]
+
+
+class TestIxValidation(unittest.TestCase):
+    def test_facts_parity(self):
+        data = load_fixture("ix_running_config.cfg")
+        for resource, facts_cls in FACT_RESOURCE_SUBSETS.items():
+            with patch.dict(os.environ, {STRICT_VALIDATION_ENV: "1"}):
+                strict = gather(facts_cls, data)
+            with patch.dict(os.environ, {STRICT_VALIDATION_ENV: ""}):
+                fast = gather(facts_cls, data)
+            self.assertEqual(fast, strict, resource)
+            self.assertTrue(fast, resource)
+
+    def test_types_and_defaults(self):
+        data = {
+            "config": [
+                {"name": "GigaEthernet0.0", "mtu": "1500"},
+                {"name": "GigaEthernet1.0", "enabled": "no"},
+            ]
+        }
+        self.assertEqual(
+            validate_config(InterfacesArgs.argument_spec, data),
+            {
+                "config": [
+                    {"name": "GigaEthernet0.0", "mtu": 1500, "enabled": True},
+                    {"name": "GigaEthernet1.0", "enabled": False},
+                ],
+                "state": "merged",
+            },
+        )
+
+    def test_natural_order(self):
+        data = "\n".join(
+            "interface Tunnel%d.0\n  ip address 10.0.%d.1/30" % (idx, idx)
+            for idx in (10, 9, 100, 1)
+        )
+        for facts_cls in FACT_RESOURCE_SUBSETS.values():
+            resources = gather(facts_cls, data)
+            for facts in resources.values():
+                if isinstance(facts, list):
+                    self.assertEqual(
+                        [entry["name"] for entry in facts],
+                        ["Tunnel1.0", "Tunnel9.0", "Tunnel10.0", "Tunnel100.0"],
+                    )
@@ -0,0 +1,416 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import os
+import re
+import shutil
+import socket
+import tempfile
+import threading
+
+from functools import partial
+from textwrap import dedent
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import paramiko
+
+from ansible_collections.ansible.netcommon.plugins.connection.network_cli import (
+    Connection,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
+    dumps,
+)
+from ansible_collections.rucdev.ix.plugins.cliconf.ix import Cliconf
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.backup_store import (
+    BackupStore,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils.config_tree import (
+    IxNetworkConfig,
+)
+from ansible_collections.rucdev.ix.plugins.modules import ix_config
+from ansible_collections.rucdev.ix.tests.unit.modules.utils import set_module_args
+from ansible_collections.rucdev.ix.tests.unit.plugins.cliconf.test_ix_cliconf import (
+    FakeConnection,
+)
+
+from .ix_module import TestIxModule
+
+RUNNING_CONFIG = dedent("""\
+    hostname Router
+    interface GigaEthernet0.0
+      ip address 192.168.1.1/24
+      ip ospf cost 10
+      no shutdown
+    interface GigaEthernet1.0
+      ip address 10.0.0.1/30
+    """)
+
+
+def get_diff(candidate, running, diff_match, diff_ignore_lines, path, diff_replace):
+    candidate_obj = IxNetworkConfig(indent=1, contents=candidate)
+    running_obj = IxNetworkConfig(
+        indent=1, contents=running, ignore_lines=diff_ignore_lines
+    )
+    updates = candidate_obj.difference(
+        running_obj, path=path, match=diff_match, replace=diff_replace
+    )
+    return {"config_diff": dumps(updates, "commands") if updates else ""}
+
+
+class FlashSftpServer(paramiko.SFTPServerInterface):
+    """Serves a local directory standing in for the flash of the device"""
+
+    def __init__(self, server, root, *args, **kwargs):
+        super(FlashSftpServer, self).__init__(server, *args, **kwargs)
+        self.root = root
+
+    def _path(self, path):
+        return os.path.join(self.root, path.lstrip("/"))
+
+    def open(self, path, flags, attr):
+        mode = "wb" if flags & (os.O_WRONLY | os.O_RDWR) else "rb"
+        try:
+            fobj = open(self._path(path), mode)
+        except OSError as exc:
+            return paramiko.SFTPServer.convert_errno(exc.errno)
+        handle = paramiko.SFTPHandle(flags)
+        handle.readfile = handle.writefile = fobj
+        return handle
+
+    def stat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.stat(self._path(path)))
+        except OSError as exc:
+            return paramiko.SFTPServer.convert_errno(exc.errno)
+
+    lstat = stat
+
+
+class SshServer(paramiko.ServerInterface):
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+
+class IxStandIn(FakeConnection):
+    """Plays an IX router reached by network_cli
+
+    The files transferred over SFTP go to a local directory standing in for
+    its flash, and replacing the running-config with one of them makes it
+    the config shown afterwards.
+    """
+
+    host_key = None
+
+    def __init__(self, flash, running, merge=False):
+        super(IxStandIn, self).__init__()
+        self.flash = flash
+        self.running = running
+        self.merge = merge
+
+    def _run(self, command):
+        match = re.match(r"copy (\S+) running-config$", command)
+        if not match:
+            return super(IxStandIn, self)._run(command)
+        with open(os.path.join(self.flash, match.group(1))) as fobj:
+            if self.merge:
+                self.running += fobj.read()
+            else:
+                self.running = fobj.read()
+        return ""
+
+    def ssh_client(self):
+        """Returns an SSH client connected to the SFTP server of the device"""
+        if IxStandIn.host_key is None:
+            IxStandIn.host_key = paramiko.RSAKey.generate(1024)
+        server_sock, client_sock = socket.socketpair()
+        transport = paramiko.Transport(server_sock)
+        transport.add_server_key(IxStandIn.host_key)
+        transport.set_subsystem_handler(
+            "sftp", paramiko.SFTPServer, FlashSftpServer, self.flash
+        )
+        transport.start_server(event=threading.Event(), server=SshServer())
+
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(
+            "router",
+            username="admin",
+            password="admin",
+            sock=client_sock,
+            look_for_keys=False,
+            allow_agent=False,
+        )
+        return client, transport
+
+
+class TestIxConfigModule(TestIxModule):
+    module = ix_config
+
+    def setUp(self):
+        super(TestIxConfigModule, self).setUp()
+
+        self.mock_get_connection = patch(
+            "ansible_collections.rucdev.ix.plugins.modules.ix_config.get_connection"
+        )
+        self.get_connection = self.mock_get_connection.start()
+        self.get_connection.return_value.get_diff.side_effect = get_diff
+
+        self.mock_get_config = patch(
+            "ansible_collections.rucdev.ix.plugins.modules.ix_config.get_config"
+        )
+        self.get_config = self.mock_get_config.start()
+        self.get_config.return_value = RUNNING_CONFIG
+
+        self.mock_run_commands = patch(
+            "ansible_collections.rucdev.ix.plugins.modules.ix_config.run_commands"
+        )
+        self.run_commands = self.mock_run_commands.start()
+
+    def tearDown(self):
+        super(TestIxConfigModule, self).tearDown()
+        self.mock_get_connection.stop()
+        self.mock_get_config.stop()
+        self.mock_run_commands.stop()
+
+    def test_ix_config_lines(self):
+        set_module_args(
+            dict(
+                lines=["ip ospf cost 10", "mtu 1400"],
+                parents=["interface GigaEthernet0.0"],
+            )
+        )
+        commands = ["interface GigaEthernet0.0", "mtu 1400"]
+        self.execute_module(changed=True, commands=commands, sort=False)
+        self.get_connection.return_value.edit_config.assert_called_with(
+            candidate=commands
+        )
+
+    def test_ix_config_diff_running_added_lines(self):
+        set_module_args(
+            dict(
+                lines=["ip address 192.168.2.1/24 secondary"],
+                parents=["interface GigaEthernet0.0"],
+                diff_against="running",
+                _ansible_diff=True,
+            )
+        )
+        result = self.execute_module(changed=True)
+        # the change only adds a line, the running-config is not read again
+        self.run_commands.assert_not_called()
+        self.assertEqual(
+            result["diff"]["after"].split("\n")[1:7],
+            [
+                "interface GigaEthernet0.0",
+                "  ip address 192.168.1.1/24",
+                "  ip ospf cost 10",
+                "  no shutdown",
+                "  ip address 192.168.2.1/24 secondary",
+                "interface GigaEthernet1.0",
+            ],
+        )
+        self.assertEqual(
+            result["diff"]["before"], str(IxNetworkConfig(contents=RUNNING_CONFIG))
+        )
+
+    def test_ix_config_diff_running_replaced_lines(self):
+        after = RUNNING_CONFIG.replace("ip ospf cost 10", "ip ospf cost 30")
+        self.run_commands.return_value = [after]
+        for lines in (["ip ospf cost 30"], ["no ip ospf cost"], ["shutdown"]):
+            set_module_args(
+                dict(
+                    lines=lines,
+                    parents=["interface GigaEthernet0.0"],
+                    diff_against="running",
+                    _ansible_diff=True,
+                )
+            )
+            result = self.execute_module(changed=True)
+            # the device may have replaced a line, read what it holds
+            self.assertEqual(
+                self.run_commands.call_args[0][1:], ("show running-config",)
+            )
+            self.assertEqual(
+                result["diff"]["after"], str(IxNetworkConfig(contents=after))
+            )
+            self.run_commands.reset_mock()
+
+    def test_ix_config_diff_check_mode(self):
+        set_module_args(
+            dict(
+                lines=["mtu 1400"],
+                parents=["interface GigaEthernet0.0"],
+                diff_against="startup",
+                _ansible_diff=True,
+                _ansible_check_mode=True,
+            )
+        )
+        self.run_commands.return_value = [RUNNING_CONFIG]
+        result = self.execute_module(changed=True)
+        self.get_connection.return_value.edit_config.assert_not_called()
+        # only the startup-config is read
+        self.run_commands.assert_called_once()
+        self.assertNotIn("diff", result)
+
+    def set_configs(self, running, startup, saved=None):
+        connection = self.get_connection.return_value
+        configs = {"running": running, "startup": startup}
+        connection.get_config.side_effect = lambda source: configs[source]
+        connection.get_saved_config.return_value = saved
+
+    def test_ix_config_save_when_modified_parses_once(self):
+        startup = RUNNING_CONFIG.replace("Router", "Router0")
+        self.set_configs(RUNNING_CONFIG, startup)
+        set_module_args(
+            dict(save_when="modified", diff_against="startup", _ansible_diff=True)
+        )
+        with patch.object(
+            IxNetworkConfig, "parse", autospec=True, side_effect=IxNetworkConfig.parse
+        ) as parse:
+            result = self.execute_module(changed=True)
+        self.assertEqual(parse.call_count, 2)
+        self.assertEqual(
+            self.run_commands.call_args[0][1], "copy running-config startup-config\r"
+        )
+        self.get_connection.return_value.set_saved_config.assert_called_with(
+            IxNetworkConfig(contents=RUNNING_CONFIG).sha1
+        )
+        self.assertEqual(
+            result["diff"],
+            dict(
+                before=str(IxNetworkConfig(contents=startup)),
+                after=str(IxNetworkConfig(contents=RUNNING_CONFIG)),
+            ),
+        )
+
+    def test_ix_config_save_when_modified_saved(self):
+        sha1 = IxNetworkConfig(contents=RUNNING_CONFIG).sha1
+        self.set_configs(RUNNING_CONFIG, RUNNING_CONFIG.replace("Router", "R"), sha1)
+        set_module_args(
+            dict(save_when="modified", diff_against="startup", _ansible_diff=True)
+        )
+        result = self.execute_module()
+        # the running-config is the one saved last, startup is not read
+        self.get_connection.return_value.get_config.assert_called_once_with(
+            source="running"
+        )
+        self.run_commands.assert_not_called()
+        self.assertNotIn("diff", result)
+
+    def test_ix_config_save_when_modified_unsaved(self):
+        self.set_configs(RUNNING_CONFIG, RUNNING_CONFIG, "0" * 40)
+        set_module_args(dict(save_when="modified"))
+        self.execute_module()
+        self.run_commands.assert_not_called()
+        self.get_connection.return_value.set_saved_config.assert_called_with(
+            IxNetworkConfig(contents=RUNNING_CONFIG).sha1
+        )
+
+    def test_ix_config_save_when_modified_check_mode(self):
+        self.set_configs(RUNNING_CONFIG, "")
+        set_module_args(dict(save_when="modified", _ansible_check_mode=True))
+        self.execute_module(changed=True)
+        self.run_commands.assert_not_called()
+        self.get_connection.return_value.set_saved_config.assert_not_called()
+
+    def test_ix_config_backup(self):
+        set_module_args(dict(backup=True))
+        result = self.execute_module()
+        self.assertEqual(result["__backup__"], RUNNING_CONFIG)
+
+    def test_ix_config_backup_store(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        set_module_args(
+            dict(backup=True, backup_options=dict(store=path, filename="router1"))
+        )
+        result = self.execute_module()
+        self.assertNotIn("__backup__", result)
+        self.assertNotIn("backup_path", result)
+
+        store = BackupStore(path)
+        self.assertEqual(store.get(result["backup_sha1"]), RUNNING_CONFIG)
+        self.assertEqual(result["backup_store"], path)
+        self.assertEqual(store.history("router1")[-1][1], result["backup_sha1"])
+
+    def replace_config(self, merge=False, **args):
+        flash = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, flash)
+        device = IxStandIn(flash, RUNNING_CONFIG, merge)
+        client, transport = device.ssh_client()
+        self.addCleanup(transport.close)
+        self.addCleanup(client.close)
+
+        # the transfer and the replace run through network_cli and cliconf
+        network_cli = SimpleNamespace(
+            ssh_type="paramiko",
+            ssh_type_conn=SimpleNamespace(_connect_uncached=lambda: client),
+        )
+        connection = self.get_connection.return_value
+        connection.copy_file.side_effect = partial(Connection.copy_file, network_cli)
+        cliconf = Cliconf(device)
+        cliconf.set_option("replace_command", "copy {path} running-config")
+        connection.edit_config.side_effect = cliconf.edit_config
+        self.run_commands.side_effect = lambda *args, **kwargs: [device.running]
+        set_module_args(dict(replace="config", **args))
+        return device
+
+    def test_ix_config_replace_config(self):
+        src = RUNNING_CONFIG.replace("  no shutdown\n", "")
+        device = self.replace_config(
+            src=src, diff_against="running", _ansible_diff=True
+        )
+        commands = ["copy ansible_candidate.cfg running-config"]
+        result = self.execute_module(changed=True, commands=commands)
+
+        self.assertEqual(device.sent, commands)
+        with open(os.path.join(device.flash, "ansible_candidate.cfg")) as fobj:
+            self.assertEqual(fobj.read(), src)
+        self.assertEqual(device.running, src)
+        # the candidate is applied as a whole, not line by line
+        self.get_connection.return_value.get_diff.assert_not_called()
+        self.assertEqual(result["diff"]["after"], str(IxNetworkConfig(contents=src)))
+        self.assertNotIn("no shutdown", result["diff"]["after"])
+
+    def test_ix_config_replace_config_path(self):
+        device = self.replace_config(
+            src="hostname Other", replace_path="usr/candidate.cfg"
+        )
+        os.mkdir(os.path.join(device.flash, "usr"))
+        commands = ["copy usr/candidate.cfg running-config"]
+        self.execute_module(changed=True, commands=commands)
+
+        self.assertEqual(device.sent, commands)
+        self.assertEqual(
+            os.listdir(os.path.join(device.flash, "usr")), ["candidate.cfg"]
+        )
+        self.assertEqual(device.running, "hostname Other\n")
+
+    def test_ix_config_replace_config_unchanged(self):
+        device = self.replace_config(src=RUNNING_CONFIG + "!\n", file_transfer="scp")
+        self.execute_module()
+        self.assertEqual(os.listdir(device.flash), [])
+        self.assertEqual(device.sent, [])
+
+    def test_ix_config_replace_config_check_mode(self):
+        device = self.replace_config(src="hostname Other", _ansible_check_mode=True)
+        self.execute_module(changed=True)
+        self.assertEqual(os.listdir(device.flash), [])
+        self.assertEqual(device.running, RUNNING_CONFIG)
+
+    def test_ix_config_replace_config_requires_src(self):
+        set_module_args(dict(replace="config", lines=["hostname Other"]))
+        self.execute_module(failed=True)
+
+    def test_ix_config_replace_config_merged(self):
+        self.replace_config(merge=True, src="hostname Other")
+        result = self.execute_module(failed=True)
+        self.assertIn("differs from src after the replace", result["msg"])
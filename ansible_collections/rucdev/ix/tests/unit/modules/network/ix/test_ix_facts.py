@@ -0,0 +1,148 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import multiprocessing.pool
+import os
+import shutil
+import tempfile
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.facts import (
+    FACT_RESOURCE_SUBSETS,
+)
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.utils import (
+    facts_cache,
+)
+from ansible_collections.rucdev.ix.plugins.modules import ix_facts
+from ansible_collections.rucdev.ix.tests.unit.modules.utils import set_module_args
+
+from .ix_module import TestIxModule, load_fixture
+
+
+class TestIxFactsModule(TestIxModule):
+    module = ix_facts
+
+    def setUp(self):
+        super(TestIxFactsModule, self).setUp()
+
+        self.mock_get_resource_connection_facts = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts."
+            "get_resource_connection",
+        )
+        self.get_resource_connection_facts = (
+            self.mock_get_resource_connection_facts.start()
+        )
+        self.connection = MagicMock()
+        self.connection.configure_get.return_value = load_fixture(
+            "ix_running_config.cfg"
+        )
+        self.get_resource_connection_facts.return_value = self.connection
+
+    def tearDown(self):
+        super(TestIxFactsModule, self).tearDown()
+        self.mock_get_resource_connection_facts.stop()
+
+    def test_ix_facts_all_resources_single_fetch(self):
+        set_module_args(dict(gather_network_resources=["all"]))
+        result = self.execute_module()
+        resources = result["ansible_facts"]["ansible_network_resources"]
+
+        self.connection.configure_get.assert_called_once_with("show running-config")
+        self.assertEqual(
+            sorted(resources),
+            ["interfaces", "l3_interfaces", "ospf_interfaces", "ospfv2", "ospfv3"],
+        )
+        self.assertEqual(
+            [intf["name"] for intf in resources["l3_interfaces"]],
+            ["GigaEthernet0.0", "GigaEthernet1.0", "Tunnel0.0"],
+        )
+        self.assertEqual(
+            [proc["process_id"] for proc in resources["ospfv2"]["processes"]], [1]
+        )
+
+    def test_ix_facts_single_resource_uses_own_command(self):
+        set_module_args(dict(gather_network_resources=["l3_interfaces"]))
+        self.execute_module()
+
+        self.connection.configure_get.assert_called_once_with(
+            "show running-config interface"
+        )
+
+    def test_ix_facts_cache_dir(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        set_module_args(dict(gather_network_resources=["all"], cache_dir=cache_dir))
+        first = self.execute_module()["ansible_facts"]["ansible_network_resources"]
+        self.assertEqual(len(os.listdir(cache_dir)), 5)
+
+        # only the ospfv2 sections changed
+        self.connection.configure_get.return_value = load_fixture(
+            "ix_running_config.cfg"
+        ).replace("ip router ospf 1", "ip router ospf 2")
+        populated = []
+        for resource, facts_cls in FACT_RESOURCE_SUBSETS.items():
+            patcher = patch.object(
+                facts_cls,
+                "populate_facts",
+                autospec=True,
+                side_effect=facts_cls.populate_facts,
+            )
+            populated.append((resource, patcher.start()))
+            self.addCleanup(patcher.stop)
+
+        second = self.execute_module()["ansible_facts"]["ansible_network_resources"]
+        self.assertEqual(
+            [resource for resource, mock in populated if mock.called], ["ospfv2"]
+        )
+        self.assertEqual(second["ospfv2"]["processes"][0]["process_id"], 2)
+        first.pop("ospfv2")
+        second.pop("ospfv2")
+        self.assertEqual(second, first)
+        self.assertEqual(len(os.listdir(cache_dir)), 6)
+
+    def test_ix_facts_cache_dir_no_resources(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        set_module_args(dict(cache_dir=cache_dir))
+        self.execute_module()
+
+        self.connection.configure_get.assert_not_called()
+        self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_ix_facts_cache_dir_source_changed(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        set_module_args(dict(gather_network_resources=["all"], cache_dir=cache_dir))
+        self.execute_module()
+
+        # a new version of the ospfv3 template, the config did not change
+        facts_cls = FACT_RESOURCE_SUBSETS["ospfv3"]
+        with patch.dict(facts_cache._SOURCE_DIGESTS, {facts_cls.__module__: "0" * 40}):
+            with patch.object(
+                facts_cls,
+                "populate_facts",
+                autospec=True,
+                side_effect=facts_cls.populate_facts,
+            ) as populate_facts:
+                self.execute_module()
+        populate_facts.assert_called_once()
+        self.assertEqual(len(os.listdir(cache_dir)), 6)
+
+    def test_ix_facts_parse_workers(self):
+        set_module_args(dict(gather_network_resources=["all"]))
+        serial = self.execute_module()["ansible_facts"]["ansible_network_resources"]
+
+        set_module_args(dict(gather_network_resources=["all"], parse_workers=2))
+        apply_async = multiprocessing.pool.Pool.apply_async
+        with patch(
+            "ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.facts."
+            "PARALLEL_MIN_LINES",
+            0,
+        ):
+            with patch("multiprocessing.pool.Pool.apply_async", autospec=True) as spy:
+                spy.side_effect = apply_async
+                parallel = self.execute_module()
+        resources = parallel["ansible_facts"]["ansible_network_resources"]
+
+        self.assertEqual(spy.call_count, 5)
+        self.assertEqual(resources, serial)
@@ -0,0 +1,164 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+from textwrap import dedent
+from unittest.mock import patch
+
+from ansible_collections.rucdev.ix.plugins.module_utils.network.ix.config.l3_interfaces.l3_interfaces import (
+    L3_interfaces,
+)
+from ansible_collections.rucdev.ix.plugins.modules import ix_l3_interfaces
+from ansible_collections.rucdev.ix.tests.unit.modules.utils import set_module_args
+
+from .ix_module import TestIxModule
+
+
+class TestIxL3InterfacesModule(TestIxModule):
+    module = ix_l3_interfaces
+
+    def setUp(self):
+        super(TestIxL3InterfacesModule, self).setUp()
+
+        self.mock_get_resource_connection_facts = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module_base."
+            "get_resource_connection",
+        )
+        self.mock_get_resource_connection_facts = (
+            self.mock_get_resource_connection_facts.start()
+        )
+
+        self.mock_execute_show_command = patch(
+            "ansible_collections.rucdev.ix.plugins.module_utils.network.ix.facts.l3_interfaces.l3_interfaces."
+            "L3_interfacesFacts.get_l3_interfaces_data",
+        )
+        self.execute_show_command = self.mock_execute_show_command.start()
+        self.execute_show_command.return_value = dedent("""\
+            interface GigaEthernet0.0
+              ip address 192.168.1.1/24
+              ip address 192.168.2.1/24 secondary
+              ip address 192.168.3.1/24 secondary
+              ipv6 address 2001:db8::1/64
+            interface GigaEthernet1.0
+              ip address 10.0.0.1/30
+            """)
+
+    def tearDown(self):
+        super(TestIxL3InterfacesModule, self).tearDown()
+        self.mock_get_resource_connection_facts.stop()
+        self.mock_execute_show_command.stop()
+
+    def test_ix_l3_interfaces_merged(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigaEthernet0.0",
+                        ipv4=[
+                            dict(address="192.168.4.1/24", secondary=True),
+                            dict(address="192.168.5.1 255.255.255.0", secondary=True),
+                        ],
+                        ipv6=[dict(address="2001:DB8:1::1/64")],
+                    )
+                ],
+                state="merged",
+            )
+        )
+        commands = [
+            "interface GigaEthernet0.0",
+            "ip address 192.168.4.1 255.255.255.0 secondary",
+            "ip address 192.168.5.1 255.255.255.0 secondary",
+            "ipv6 address 2001:db8:1::1/64",
+        ]
+        self.execute_module(changed=True, commands=commands)
+
+    def test_ix_l3_interfaces_merged_idempotent(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigaEthernet0.0",
+                        ipv4=[
+                            dict(address="192.168.1.1/24"),
+                            dict(address="192.168.2.1/24", secondary=True),
+                        ],
+                    )
+                ],
+                state="merged",
+            )
+        )
+        self.execute_module(changed=False, commands=[])
+
+    def test_ix_l3_interfaces_merged_ipv6_normalized(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigaEthernet0.0",
+                        ipv6=[dict(address="2001:DB8:0:0::1/64")],
+                    )
+                ],
+                state="merged",
+            )
+        )
+        self.execute_module(changed=False, commands=[])
+
+    def test_ix_l3_interfaces_unchanged_not_compared(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigaEthernet1.0",
+                        ipv4=[dict(address="10.0.0.1/30")],
+                    )
+                ],
+                state="merged",
+            )
+        )
+        with patch.object(
+            L3_interfaces, "_compare", autospec=True, side_effect=L3_interfaces._compare
+        ) as compare:
+            self.execute_module(changed=False, commands=[])
+        compare.assert_not_called()
+
+    def test_ix_l3_interfaces_replaced_secondaries_only(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigaEthernet0.0",
+                        ipv4=[
+                            dict(address="192.168.1.1/24", secondary=True),
+                            dict(address="192.168.2.1/24", secondary=True),
+                        ],
+                    )
+                ],
+                state="replaced",
+            )
+        )
+        commands = [
+            "interface GigaEthernet0.0",
+            "no ip address 192.168.3.1 255.255.255.0 secondary",
+            "no ipv6 address 2001:db8::1/64",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
+    def test_ix_l3_interfaces_overridden(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigaEthernet1.0",
+                        ipv4=[dict(address="10.0.0.1/30")],
+                    )
+                ],
+                state="overridden",
+            )
+        )
+        commands = [
+            "interface GigaEthernet0.0",
+            "no ip address 192.168.1.1 255.255.255.0",
+            "no ip address 192.168.2.1 255.255.255.0 secondary",
+            "no ip address 192.168.3.1 255.255.255.0 secondary",
+            "no ipv6 address 2001:db8::1/64",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
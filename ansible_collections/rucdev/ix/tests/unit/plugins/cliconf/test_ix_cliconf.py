@@ -0,0 +1,424 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import json
+import unittest
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils._text import to_text
+
+from ansible_collections.rucdev.ix.plugins.cliconf.ix import (
+    Cliconf,
+    split_output_at_prompts,
+    split_pipelined_output,
+)
+from ansible_collections.rucdev.ix.plugins.terminal.ix import TerminalModule
+
+OUTPUTS = {
+    "show clock": "Thu Jan  1 00:00:00 2024",
+    "show version": "NEC Portable Internetwork Core Operating System Software\n"
+    "IX Series IX2106 (magellan-sec) Software, Version 10.2.16, RELEASE SOFTWARE",
+    "show ip route summary": "Route Source    Networks\nconnected       3",
+    "show running-config": "! NEC Portable Internetwork Core Operating System Software\n"
+    "hostname Router\n"
+    "timezone +09 00",
+    "show foo": "% show foo: Invalid command.",
+    "ip route foo": "% ip route foo: Invalid command.",
+}
+
+
+class FakeConnection(object):
+    """Plays the device side of a network_cli connection"""
+
+    def __init__(
+        self, hostname="Router", chunk=None, mode="(config)", wrap=None, echo=True
+    ):
+        self.hostname = hostname
+        self.chunk = chunk
+        self.wrap = wrap
+        self.echo = echo
+        self.mode = mode
+        self.sent = []
+        self.receives = 0
+        self.options = {"terminal_stderr_re": None, "single_user_mode": False}
+        self._pending = []
+
+    def get_option(self, option):
+        return self.options[option]
+
+    def set_option(self, option, value):
+        self.options[option] = value
+
+    def get_prompt(self):
+        return ("%s%s#" % (self.hostname, self.mode)).encode()
+
+    def _run(self, command):
+        if command in ("configure", "svintr-config"):
+            self.mode = "(config)"
+        elif command.startswith("interface "):
+            self.mode = "(config-if-%s)" % command.split()[1]
+        elif command == "exit":
+            self.mode = "(config)" if self.mode != "(config)" else ""
+        return OUTPUTS.get(command, "")
+
+    def _get_terminal_std_re(self, option):
+        return TerminalModule.terminal_stderr_re
+
+    def send(self, command, sendonly=False, **kwargs):
+        command = to_text(command)
+        self.sent.append(command)
+        if sendonly:
+            self._pending.append(command)
+            return None
+        output = self._run(command)
+        for regex in TerminalModule.terminal_stderr_re:
+            if regex.search(output.encode()):
+                raise AnsibleConnectionFailure(output)
+        return output
+
+    def receive(self, strip_prompt=True, **kwargs):
+        self.receives += 1
+        count = self.chunk or len(self._pending)
+        commands, self._pending = self._pending[:count], self._pending[count:]
+        lines = []
+        for idx, command in enumerate(commands):
+            echo = command if self.echo else ""
+            if self.wrap:
+                echo = "\n".join(
+                    command[pos : pos + self.wrap]
+                    for pos in range(0, len(command), self.wrap)
+                )
+            if idx:
+                lines[-1] += echo
+            else:
+                lines.append(echo)
+            lines.extend(self._run(command).splitlines())
+            lines.append(to_text(self.get_prompt()))
+        return "\n".join(lines).strip()
+
+
+class TestIxCliconfPipeline(unittest.TestCase):
+    def setUp(self):
+        self.connection = FakeConnection()
+        self.cliconf = Cliconf(self.connection)
+        self.cliconf.set_option("pipeline_window", 10)
+
+    def test_split_pipelined_output(self):
+        output = (
+            "show clock\nclock\nRouter# show version\nversion 1\nversion 2\nRouter#"
+        )
+        self.assertEqual(
+            split_pipelined_output(output, ["show clock", "show version"]),
+            ["clock", "version 1\nversion 2"],
+        )
+
+    def test_split_pipelined_output_incomplete(self):
+        output = "show clock\nclock\nRouter#"
+        self.assertIsNone(
+            split_pipelined_output(output, ["show clock", "show version"])
+        )
+
+    def test_split_output_at_prompts(self):
+        output = "show cl\nock\nclock\nRouter# show ve\nrsion\nversion 1\nRouter#"
+        commands = ["show clock", "show version"]
+        self.assertIsNone(split_pipelined_output(output, commands))
+        self.assertEqual(
+            split_output_at_prompts(output, commands),
+            ["ock\nclock", "rsion\nversion 1"],
+        )
+        self.assertIsNone(split_output_at_prompts(output, commands + ["show clock"]))
+
+    def test_run_commands_pipelined(self):
+        commands = ["show clock", "show version", "show ip route summary"]
+        responses = self.cliconf.run_commands(commands)
+
+        self.assertEqual(responses, [OUTPUTS[command] for command in commands])
+        self.assertEqual(self.connection.sent, commands)
+        self.assertEqual(self.connection.receives, 1)
+        self.assertIsNone(self.connection.options["terminal_stderr_re"])
+
+    def test_run_commands_pipelined_partial_reads(self):
+        self.connection.chunk = 1
+        commands = ["show clock", "show version", "show ip route summary"]
+        responses = self.cliconf.run_commands(commands)
+
+        self.assertEqual(responses, [OUTPUTS[command] for command in commands])
+        self.assertEqual(self.connection.receives, 3)
+
+    def test_run_commands_pipelined_wrapped_echo(self):
+        self.connection.wrap = 12
+        commands = ["show clock", "show running-config", "show version"]
+        responses = self.cliconf.run_commands(commands)
+
+        # read up to the last prompt, then run again one at a time
+        self.assertEqual(responses, [OUTPUTS[command] for command in commands])
+        self.assertEqual(self.connection.sent, commands + commands)
+        self.assertEqual(self.connection.receives, 1)
+
+    def test_run_commands_not_show_not_pipelined(self):
+        self.connection.echo = False
+        commands = [
+            "show clock",
+            "clear arp",
+            "ip route default GigaEthernet0.0",
+            "copy running-config startup-config",
+            "show version",
+        ]
+        self.cliconf.run_commands(commands)
+
+        # written once each, never read back as a window
+        self.assertEqual(self.connection.sent, commands)
+        self.assertEqual(self.connection.receives, 0)
+
+    def test_run_commands_window(self):
+        self.cliconf.set_option("pipeline_window", 2)
+        commands = ["show clock", "show version", "show ip route summary"]
+        responses = self.cliconf.run_commands(commands)
+
+        self.assertEqual(responses, [OUTPUTS[command] for command in commands])
+        self.assertEqual(self.connection.receives, 1)
+
+    def test_run_commands_pipelined_error(self):
+        commands = ["show clock", "show foo", "show version"]
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.cliconf.run_commands(commands)
+        self.assertIn("Invalid command", str(exc.exception))
+
+        responses = self.cliconf.run_commands(commands, check_rc=False)
+        self.assertEqual(responses, [OUTPUTS[command] for command in commands])
+
+    def test_run_commands_prompt_not_pipelined(self):
+        commands = [
+            "show clock",
+            {"command": "show version", "prompt": "[y/n]", "answer": "y"},
+            "show ip route summary",
+        ]
+        responses = self.cliconf.run_commands(commands)
+
+        self.assertEqual(
+            responses,
+            [
+                OUTPUTS["show clock"],
+                OUTPUTS["show version"],
+                OUTPUTS["show ip route summary"],
+            ],
+        )
+        self.assertEqual(self.connection.receives, 0)
+
+    def test_run_commands_single_user_mode(self):
+        self.connection.options["single_user_mode"] = True
+        self.cliconf.run_commands(["show clock", "show version"])
+        self.assertEqual(self.connection.receives, 0)
+
+
+class TestIxCliconfBulkEditConfig(unittest.TestCase):
+    def setUp(self):
+        self.connection = FakeConnection()
+        self.cliconf = Cliconf(self.connection)
+        self.cliconf.set_option("bulk_chunk_size", 3)
+        self.candidate = []
+        for idx in range(10):
+            self.candidate.extend(
+                [
+                    "interface Tunnel%d.0" % idx,
+                    "  ip address 10.0.%d.1/30" % idx,
+                    "exit",
+                ]
+            )
+
+    def test_edit_config_bulk(self):
+        resp = self.cliconf.edit_config(candidate=self.candidate)
+
+        lines = [line for line in self.candidate if line != "exit"]
+        self.assertEqual(resp["request"], lines)
+        self.assertEqual(resp["response"], [""] * len(lines))
+        self.assertEqual(self.connection.sent, lines + ["configure"])
+        self.assertEqual(self.connection.receives, 7)
+
+    def test_edit_config_bulk_reports_failing_line(self):
+        self.candidate[13] = "ip route foo"
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.cliconf.edit_config(candidate=self.candidate)
+
+        self.assertIn("candidate line 14 'ip route foo' failed", str(exc.exception))
+        # the chunk holding the failing line is the last one sent
+        self.assertEqual(self.connection.receives, 4)
+
+    def test_edit_config_bulk_wrapped_echo(self):
+        self.connection.wrap = 12
+        self.candidate[13] = "ip route foo"
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.cliconf.edit_config(candidate=self.candidate)
+
+        self.assertIn("candidate line 14 'ip route foo' failed", str(exc.exception))
+        # the chunk holding the failing line is the last one, no line is
+        # sent twice
+        self.assertEqual(self.connection.receives, 4)
+        self.assertEqual(len(self.connection.sent), len(set(self.connection.sent)))
+
+    def test_edit_config_per_line(self):
+        self.cliconf.set_option("bulk_chunk_size", 1)
+        self.cliconf.edit_config(candidate=self.candidate)
+        self.assertEqual(self.connection.receives, 0)
+
+    def test_edit_config_replace(self):
+        self.cliconf.set_option("replace_command", "copy {path} running-config")
+        resp = self.cliconf.edit_config(replace="ansible_candidate.cfg")
+
+        self.assertEqual(resp["request"], ["copy ansible_candidate.cfg running-config"])
+        self.assertEqual(
+            self.connection.sent, ["copy ansible_candidate.cfg running-config"]
+        )
+        self.assertRaises(ValueError, self.cliconf.edit_config, replace=True)
+
+
+class TestIxCliconfModes(unittest.TestCase):
+    def setUp(self):
+        self.connection = FakeConnection(mode="")
+        self.cliconf = Cliconf(self.connection)
+        self.cliconf.set_option("pipeline_window", 1)
+        self.cliconf.set_option("bulk_chunk_size", 1)
+        self.cliconf.set_option("config_cache", True)
+
+    def test_configure_mode_entered_once(self):
+        self.cliconf.configure_get("show running-config")
+        self.cliconf.configure_get("show running-config interface")
+        self.cliconf.run_configs(["ip route default GigaEthernet0.0"])
+
+        self.assertEqual(
+            self.connection.sent,
+            [
+                "configure",
+                "show running-config",
+                "show running-config interface",
+                "ip route default GigaEthernet0.0",
+            ],
+        )
+
+    def test_edit_config_mode_changes(self):
+        self.cliconf.edit_config(
+            candidate=["interface Tunnel0.0", "  ip ospf cost 10", "exit"]
+        )
+        self.cliconf.edit_config(candidate=["ip route default GigaEthernet0.0"])
+
+        self.assertEqual(
+            self.connection.sent,
+            [
+                "configure",
+                "interface Tunnel0.0",
+                "  ip ospf cost 10",
+                "configure",
+                "ip route default GigaEthernet0.0",
+            ],
+        )
+        self.assertEqual(self.cliconf.get_mode(), "config")
+
+    def test_session_setup_sent_once(self):
+        self.cliconf.get_default_flag()
+        self.cliconf.get_device_info()
+        self.cliconf._device_info = {}
+        self.cliconf.get_device_info()
+
+        self.assertEqual(self.connection.sent.count("svintr-config"), 1)
+        self.assertEqual(self.connection.sent.count("configure"), 1)
+        self.assertEqual(self.connection.sent.count("terminal length 0"), 1)
+
+    def test_device_info_from_prompt(self):
+        device_info = self.cliconf.get_device_info()
+
+        self.assertEqual(device_info["network_os_hostname"], "Router")
+        self.assertEqual(device_info["network_os_model"], "IX2106")
+        self.assertEqual(device_info["network_os_version"], "10.2.16")
+        self.assertNotIn("show running-config", self.connection.sent)
+
+    def test_device_info_falls_back_to_running_config(self):
+        self.connection.get_prompt = lambda: b""
+        device_info = self.cliconf.get_device_info()
+
+        self.assertEqual(device_info["network_os_hostname"], "Router")
+        self.assertIn("show running-config", self.connection.sent)
+
+
+class TestIxCliconfConfigCache(unittest.TestCase):
+    def setUp(self):
+        self.connection = FakeConnection()
+        self.cliconf = Cliconf(self.connection)
+        self.cliconf.set_option("pipeline_window", 1)
+        self.cliconf.set_option("bulk_chunk_size", 1)
+        self.cliconf.set_option("config_cache", True)
+
+    def cache_stats(self):
+        return json.loads(self.cliconf.get_capabilities())["config_cache"]
+
+    def test_get_config_cached(self):
+        first = self.cliconf.get_config()
+        second = self.cliconf.configure_get("show running-config")
+
+        self.assertEqual(first, OUTPUTS["show running-config"])
+        self.assertEqual(second, first)
+        self.assertEqual(self.connection.sent.count("show running-config"), 1)
+        self.assertEqual(self.cache_stats(), {"hits": 1, "misses": 1})
+
+    def test_get_config_commands(self):
+        self.cliconf.get_config(flags=["interface"])
+        self.cliconf.get_config(source="startup")
+        self.cliconf.get_config(flags="interface")
+
+        self.assertEqual(
+            self.connection.sent,
+            ["show running-config interface", "show startup-config"],
+        )
+
+    def test_invalidated_by_configuration(self):
+        self.cliconf.get_config()
+        self.cliconf.edit_config(candidate=["ip route default GigaEthernet0.0"])
+        self.cliconf.get_config()
+        self.cliconf.run_configs(["ip route default GigaEthernet1.0"])
+        self.cliconf.get_config()
+        self.cliconf.run_commands(["show clock"])
+        self.cliconf.get_config()
+        self.cliconf.run_commands(["copy running-config startup-config"])
+        self.cliconf.get_config()
+
+        self.assertEqual(self.connection.sent.count("show running-config"), 4)
+        self.assertEqual(self.cache_stats(), {"hits": 1, "misses": 4})
+
+    def test_invalidated_by_cli_command(self):
+        self.cliconf.get_config()
+        self.cliconf.set_saved_config("sha1")
+        self.cliconf.get("show clock")
+        self.cliconf.get_config()
+        self.assertEqual(self.cliconf.get_saved_config(), "sha1")
+
+        # cli_command sends through get
+        self.cliconf.get("no ip route default GigaEthernet0.0")
+        self.assertIsNone(self.cliconf.get_saved_config())
+        self.cliconf.get_config()
+
+        self.assertEqual(self.connection.sent.count("show running-config"), 2)
+        self.assertEqual(self.cache_stats(), {"hits": 1, "misses": 2})
+
+    def test_saved_config(self):
+        self.cliconf.set_saved_config("sha1")
+        self.cliconf.get_config()
+        self.cliconf.edit_config(candidate=["ip route default GigaEthernet0.0"])
+        self.cliconf.run_commands(["show clock"])
+        self.assertEqual(self.cliconf.get_saved_config(), "sha1")
+
+        self.cliconf.run_commands(["copy running-config startup-config"])
+        self.assertIsNone(self.cliconf.get_saved_config())
+
+        self.cliconf.set_saved_config("sha1")
+        self.cliconf.configure_get("erase startup-config")
+        self.assertIsNone(self.cliconf.get_saved_config())
+
+        self.cliconf.set_saved_config("sha1")
+        self.cliconf.set_option("config_cache", False)
+        self.assertIsNone(self.cliconf.get_saved_config())
+
+    def test_cache_disabled(self):
+        self.cliconf.set_option("config_cache", False)
+        self.cliconf.get_config()
+        self.cliconf.get_config()
+
+        self.assertEqual(self.connection.sent.count("show running-config"), 2)